@@ -1,2957 +1,4002 @@
-import sys
-import os
-import subprocess
-import json
-import shutil
-from pathlib import Path
-import hashlib
-import re
-import shlex
-import time
-from datetime import timedelta
-
-# Optional dependency
-try:
-    import psutil
-except ImportError:
-    psutil = None
-
-# --- PyQt6 Imports ---
-from PyQt6.QtWidgets import (
-    QApplication, QMainWindow, QWidget, QHBoxLayout, QVBoxLayout,
-    QListWidget, QStatusBar, QListWidgetItem, QPushButton, QMessageBox,
-    QFileDialog, QLabel, QDialog, QLineEdit, QDialogButtonBox,
-    QSplitter, QTabWidget, QMenu, QStyle, QStyledItemDelegate, QSlider, QComboBox,
-    QTreeWidget, QTreeWidgetItem, QHeaderView, QCheckBox, QFormLayout, QGroupBox,
-    QSizePolicy, QProgressBar, QProgressDialog, QInputDialog
-)
-from PyQt6.QtGui import QFont, QIcon, QPixmap, QAction, QPainter, QColor, QBrush, QPen, QFontDatabase, QPainterPath, QLinearGradient
-from PyQt6.QtCore import Qt, QSize, QStandardPaths, QRect, QTimer, QByteArray, pyqtSignal, QThread
-
-# =============================================================================
-# --- APPLICATION CONSTANTS & UTILITIES ---
-# =============================================================================
-
-class Constants:
-    VERSION = "2.00"
-    APP_NAME = "EmulatorHub"
-    # Modern Dark Theme Colors with enhanced contrast
-    C_BACKGROUND_DARK = "#1A1B26"; C_BACKGROUND_LIGHT = "#24283B"; C_BACKGROUND_WIDGET = "#16161E"
-    C_BORDER = "#414868"; C_TEXT_PRIMARY = "#C0CAF5"; C_TEXT_SECONDARY = "#9AA5CE"
-    C_HIGHLIGHT_BLUE = "#7AA2F7"; C_HIGHLIGHT_CYAN = "#2AC3DE"; C_ACCENT = "#BB9AF7"
-    C_SUCCESS = "#9ECE6A"; C_WARNING = "#E0AF68"; C_ERROR = "#F7768E"
-    ALL_GAMES_CATEGORY = "All Games"; FAVORITES_CATEGORY = "Favorites"; RECENTS_CATEGORY = "Recently Played"
-    STATISTICS_CATEGORY = "Statistics"; COLLECTIONS_CATEGORY = "Collections"
-    DEFAULT_GRID_ICON_SIZE = 150; MIN_GRID_ICON_SIZE = 100; MAX_GRID_ICON_SIZE = 300
-    DEFAULT_LIST_ICON_SIZE = 48;  MIN_LIST_ICON_SIZE = 32;  MAX_LIST_ICON_SIZE = 96
-    
-    # Platform icons and colors mapping
-    PLATFORM_ICONS = {
-        "PC": "💻", "Windows": "💻",
-        "PlayStation": "🎮", "PlayStation 2": "🎮", "PlayStation 3": "🎮",
-        "Xbox": "🎮", "Xbox 360": "🎮",
-        "🎮", "Wii": "🎮", "GameCube": "🎮", "Nintendo 64": "🎮",
-        "Game Boy": "👾", "Game Boy Color": "👾", "Game Boy Advance": "👾",
-        "Nintendo DS": "📱", "Nintendo 3DS": "📱",
-        "PSP": "📱",
-        "Sega Genesis": "🕹️", "Sega Game Gear": "🕹️", "Dreamcast": "🕹️",
-        "Super Nintendo": "🕹️", "TurboGrafx-16": "🕹️", "Atari Lynx": "🕹️"
-    }
-    
-    PLATFORM_COLORS = {
-        "PC": "#0078D4", "Windows": "#0078D4",
-        "PlayStation": "#003087", "PlayStation 2": "#003087", "PlayStation 3": "#003087",
-        "Xbox": "#107C10", "Xbox 360": "#107C10",
-        "Wii": "#009AC7", "GameCube": "#6A5ACD", "Nintendo 64": "#E4000F",
-        "Game Boy": "#8B8589", "Game Boy Color": "#FFCB05", "Game Boy Advance": "#3B1F90",
-        "Nintendo DS": "#D3D3D3", "Nintendo 3DS": "#FF0000",
-        "PSP": "#000000",
-        "Sega Genesis": "#000080", "Sega Game Gear": "#FF6347", "Dreamcast": "#FF6600",
-        "Super Nintendo": "#5A5AFF", "TurboGrafx-16": "#FF4500", "Atari Lynx": "#FF8C00"
-    }
-
-def format_size(size_bytes):
-    if size_bytes == 0: return "0 B"
-    size_name = ("B", "KB", "MB", "GB", "TB"); i = 0
-    while size_bytes >= 1024 and i < len(size_name) - 1:
-        size_bytes /= 1024.0; i += 1
-    return f"{size_bytes:.2f} {size_name[i]}"
-
-def format_playtime(seconds):
-    if seconds == 0: return "Never Played"
-    return str(timedelta(seconds=int(seconds)))
-
-# =============================================================================
-# --- BACKGROUND WORKER THREADS ---
-# =============================================================================
-
-class GameScanner(QThread):
-    progress_update = pyqtSignal(str)
-    scan_finished = pyqtSignal(dict, dict)
-
-    def __init__(self, backend):
-        super().__init__()
-        self.backend = backend
-
-    def run(self):
-        games_by_platform = {}
-        all_games_map = {}
-        self.progress_update.emit("Starting library scan...")
-        game_paths = []
-        for lib_path in self.backend.config_manager.config["game_library_paths"]:
-            for root, dirs, files in os.walk(lib_path, topdown=True):
-                game_paths.extend([os.path.join(root, f) for f in files])
-                game_paths.extend([os.path.join(root, d) for d in dirs])
-        
-        total_items = len(game_paths)
-        processed_items = 0
-
-        for lib_path in self.backend.config_manager.config["game_library_paths"]:
-            for root, dirs, files in os.walk(lib_path, topdown=True):
-                dirs[:] = [d for d in dirs if not d.startswith('.')]
-                current_dirs = dirs[:]
-                for dir_name in current_dirs:
-                    processed_items += 1
-                    self.progress_update.emit(f"Scanning... ({processed_items}/{total_items})")
-                    if os.path.isdir(os.path.join(root, dir_name, 'PS3_GAME')):
-                        self._add_game("PlayStation 3", dir_name, os.path.join(root, dir_name), games_by_platform, all_games_map)
-                        dirs.remove(dir_name)
-                for file_name in files:
-                    processed_items += 1
-                    self.progress_update.emit(f"Scanning... ({processed_items}/{total_items})")
-                    platform = self.backend.get_platform_from_path(root) or self.backend.GAME_EXTENSIONS.get(Path(file_name).suffix.lower())
-                    if platform:
-                        self._add_game(platform, file_name, os.path.join(root, file_name), games_by_platform, all_games_map)
-        self.scan_finished.emit(games_by_platform, all_games_map)
-
-    def _add_game(self, platform, title_source, path, games_by_platform, all_games_map):
-        if platform == "Game Boy Color":
-            platform = "Game Boy"
-        if platform not in games_by_platform: games_by_platform[platform] = []
-        path_hash = hashlib.md5(str(Path(path).resolve()).encode()).hexdigest()
-        if path_hash not in all_games_map:
-            clean_title = self.backend._clean_game_title(title_source)
-            try:
-                size = (sum(f.stat().st_size for f in Path(path).glob('**/*') if f.is_file())) if os.path.isdir(path) else os.path.getsize(path)
-            except FileNotFoundError: size = 0
-            metadata = self.backend.config_manager.config.get("game_metadata", {}).get(path_hash, {})
-            game_data = {"title": clean_title, "path": path, "hash": path_hash, "size": size, "platform": platform, **metadata}
-            games_by_platform[platform].append(game_data)
-            all_games_map[path_hash] = game_data
-
-# =============================================================================
-# --- CUSTOM UI DELEGATES ---
-# =============================================================================
-
-class GridItemDelegate(QStyledItemDelegate):
-    def __init__(self, backend, parent=None):
-        super().__init__(parent); self.backend = backend; self.TEXT_PADDING = 5
-        self.TEXT_AREA_HEIGHT = 40; self.FAVORITE_STAR = QPixmap(":/qt-project.org/styles/commonstyle/images/star-on-16.png")
-    def sizeHint(self, option, index):
-        icon_size = option.decorationSize; return QSize(icon_size.width(), icon_size.height() + self.TEXT_AREA_HEIGHT)
-    def paint(self, painter, option, index):
-        rect = option.rect; game_data = index.data(Qt.ItemDataRole.UserRole)
-        if not game_data:  # Fix: Null check
-            return
-        colors = self.parent().window().themes[self.parent().window().current_theme_name]
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        # Background with shadow for hover/selection
-        if option.state & QStyle.StateFlag.State_MouseOver:
-            painter.save()
-            painter.setPen(Qt.PenStyle.NoPen)
-            painter.setBrush(QColor(colors['C_BACKGROUND_LIGHT']))
-            painter.drawRoundedRect(rect.adjusted(2, 2, -2, -2), 8, 8)
-            painter.restore()
-        if option.state & QStyle.StateFlag.State_Selected:
-            painter.save(); pen = QPen(QColor(colors['C_HIGHLIGHT_CYAN'])); pen.setWidth(3)
-            painter.setPen(pen); painter.setBrush(Qt.BrushStyle.NoBrush); painter.drawRoundedRect(rect.adjusted(2, 2, -2, -2), 8, 8); painter.restore()
-        icon_area = QRect(rect.x() + 4, rect.y() + 4, rect.width() - 8, rect.height() - self.TEXT_AREA_HEIGHT - 4); icon = index.data(Qt.ItemDataRole.DecorationRole)
-        if isinstance(icon, QIcon):
-            pixmap = icon.pixmap(icon_area.size()); x = icon_area.x() + (icon_area.width() - pixmap.width()) // 2
-            y = icon_area.y() + (icon_area.height() - pixmap.height()) // 2
-            # Add shadow to icon
-            painter.save()
-            painter.setOpacity(0.2)
-            painter.drawPixmap(x + 2, y + 2, pixmap)
-            painter.restore()
-            painter.drawPixmap(x, y, pixmap)
-        if self.backend.is_favorite(game_data['hash']): 
-            star_icon = self.create_star_icon(colors); painter.drawPixmap(rect.x() + 8, rect.y() + 8, star_icon)
-        # Play count badge
-        playtime = game_data.get('playtime', 0)
-        if playtime > 0:
-            badge_text = format_playtime(playtime).split(',')[0]  # Show only first part
-            painter.save()
-            painter.setPen(Qt.PenStyle.NoPen)
-            painter.setBrush(QColor(colors['C_ACCENT']))
-            badge_rect = QRect(rect.right() - 60, rect.y() + 8, 50, 20)
-            painter.drawRoundedRect(badge_rect, 10, 10)
-            painter.setPen(QColor("#FFFFFF"))
-            painter.setFont(QFont("Segoe UI", 7, QFont.Weight.Bold))
-            painter.drawText(badge_rect, Qt.AlignmentFlag.AlignCenter, badge_text)
-            painter.restore()
-        text_area = QRect(rect.x() + self.TEXT_PADDING, icon_area.bottom() + 2, rect.width() - 2 * self.TEXT_PADDING, self.TEXT_AREA_HEIGHT)
-        text = index.data(Qt.ItemDataRole.DisplayRole); painter.setPen(option.palette.color(option.palette.ColorRole.Text))
-        painter.setFont(QFont("Segoe UI", 9, QFont.Weight.Medium))
-        painter.drawText(text_area, Qt.AlignmentFlag.AlignCenter | Qt.TextFlag.TextWordWrap, text)
-    def create_star_icon(self, colors):
-        pixmap = QPixmap(16, 16); pixmap.fill(Qt.GlobalColor.transparent)
-        painter = QPainter(pixmap); painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        painter.setBrush(QColor(colors['C_WARNING'])); painter.setPen(Qt.PenStyle.NoPen)
-        star_path = QPainterPath(); star_path.moveTo(8, 2)
-        for i in range(5):
-            angle = i * 144 * 3.14159 / 180
-            x = 8 + 6 * __import__('math').sin(angle); y = 8 - 6 * __import__('math').cos(angle)
-            star_path.lineTo(x, y)
-        star_path.closeSubpath(); painter.drawPath(star_path); painter.end()
-        return pixmap
-
-class SpacedListItemDelegate(QStyledItemDelegate):
-    def __init__(self, spacing=8, parent=None): super().__init__(parent); self.spacing = spacing
-    def sizeHint(self, option, index):
-        size = super().sizeHint(option, index); icon_height = option.decorationSize.height()
-        size.setHeight(max(size.height(), icon_height) + self.spacing); return size
-
-class PlatformListDelegate(QStyledItemDelegate):
-    """Custom delegate for platform list with enhanced visuals"""
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.padding = 8
-        self.icon_size = 24
-    
-    def sizeHint(self, option, index):
-        return QSize(option.rect.width(), 40)
-    
-    def paint(self, painter, option, index):
-        painter.save()
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        rect = option.rect
-        item_data = index.data(Qt.ItemDataRole.UserRole)
-        
-        # Skip separators
-        if item_data and item_data.get('is_separator'):
-            colors = self.parent().window().themes[self.parent().window().current_theme_name]
-            # Draw separator line
-            painter.setPen(QPen(QColor(colors['C_BORDER']), 2))
-            y = rect.center().y()
-            painter.drawLine(rect.left() + 20, y, rect.right() - 20, y)
-            
-            # Draw separator text
-            painter.setPen(QColor(colors['C_TEXT_SECONDARY']))
-            painter.setFont(QFont("Segoe UI", 8, QFont.Weight.Bold))
-            text_rect = rect.adjusted(0, -5, 0, -5)
-            painter.drawText(text_rect, Qt.AlignmentFlag.AlignCenter, item_data.get('text', ''))
-            painter.restore()
-            return
-        
-        colors = self.parent().window().themes[self.parent().window().current_theme_name]
-        
-        # Background
-        if option.state & QStyle.StateFlag.State_Selected:
-            gradient = QLinearGradient(rect.left(), rect.top(), rect.right(), rect.top())
-            gradient.setColorAt(0, QColor(colors['C_HIGHLIGHT_BLUE']))
-            gradient.setColorAt(1, QColor(colors['C_ACCENT']))
-            painter.setBrush(QBrush(gradient))
-            painter.setPen(Qt.PenStyle.NoPen)
-            painter.drawRoundedRect(rect.adjusted(4, 2, -4, -2), 6, 6)
-        elif option.state & QStyle.StateFlag.State_MouseOver:
-            painter.setBrush(QColor(colors['C_BACKGROUND_LIGHT']))
-            painter.setPen(Qt.PenStyle.NoPen)
-            painter.drawRoundedRect(rect.adjusted(4, 2, -4, -2), 6, 6)
-        
-        # Get platform info
-        platform_name = index.data(Qt.ItemDataRole.DisplayRole)
-        if not platform_name:
-            painter.restore()
-            return
-        
-        # Extract actual name and count
-        if ' (' in platform_name:
-            name_part = platform_name.split(' (')[0]
-            count_part = platform_name.split(' (')[1].rstrip(')')
-        else:
-            name_part = platform_name
-            count_part = None
-        
-        # Icon
-        icon_rect = QRect(rect.left() + self.padding, rect.top() + (rect.height() - self.icon_size) // 2, 
-                         self.icon_size, self.icon_size)
-        
-        # Draw emoji icon or colored circle
-        icon_text = Constants.PLATFORM_ICONS.get(name_part, "🎮")
-        painter.setFont(QFont("Segoe UI Emoji", 16))
-        painter.setPen(QColor(colors['C_TEXT_PRIMARY']))
-        painter.drawText(icon_rect, Qt.AlignmentFlag.AlignCenter, icon_text)
-        
-        # Platform color indicator
-        if name_part in Constants.PLATFORM_COLORS:
-            color_indicator = QRect(rect.left() + 2, rect.top() + 8, 3, rect.height() - 16)
-            painter.setBrush(QColor(Constants.PLATFORM_COLORS[name_part]))
-            painter.setPen(Qt.PenStyle.NoPen)
-            painter.drawRoundedRect(color_indicator, 2, 2)
-        
-        # Text
-        text_rect = QRect(icon_rect.right() + 8, rect.top(), 
-                         rect.width() - icon_rect.width() - self.padding * 3 - 40, rect.height())
-        
-        painter.setFont(QFont("Segoe UI", 10, QFont.Weight.Medium))
-        painter.setPen(QColor(colors['C_TEXT_PRIMARY']))
-        painter.drawText(text_rect, Qt.AlignmentFlag.AlignVCenter, name_part)
-        
-        # Count badge
-        if count_part:
-            badge_width = 35
-            badge_rect = QRect(rect.right() - badge_width - self.padding, 
-                             rect.top() + (rect.height() - 22) // 2, badge_width, 22)
-            
-            # Badge background
-            painter.setBrush(QColor(colors['C_ACCENT']))
-            painter.setPen(Qt.PenStyle.NoPen)
-            painter.drawRoundedRect(badge_rect, 11, 11)
-            
-            # Badge text
-            painter.setFont(QFont("Segoe UI", 8, QFont.Weight.Bold))
-            painter.setPen(QColor("#FFFFFF"))
-            painter.drawText(badge_rect, Qt.AlignmentFlag.AlignCenter, count_part)
-        
-        painter.restore()
-
-class EmulatorTreeDelegate(QStyledItemDelegate):
-    """Modern card-style delegate for emulator tree items"""
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.padding = 12
-        self.icon_size = 32
-    
-    def sizeHint(self, option, index):
-        # Parent items (platform names) are taller
-        if not index.parent().isValid():
-            return QSize(option.rect.width(), 50)
-        else:
-            return QSize(option.rect.width(), 70)
-    
-    def paint(self, painter, option, index):
-        painter.save()
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        colors = self.parent().window().themes[self.parent().window().current_theme_name]
-        rect = option.rect
-        is_parent = not index.parent().isValid()
-        
-        # Platform header styling (parent items)
-        if is_parent:
-            # Background gradient
-            gradient = QLinearGradient(rect.left(), rect.top(), rect.left(), rect.bottom())
-            gradient.setColorAt(0, QColor(colors['C_BACKGROUND_LIGHT']))
-            gradient.setColorAt(1, QColor(colors['C_BACKGROUND_DARK']))
-            painter.setBrush(QBrush(gradient))
-            painter.setPen(Qt.PenStyle.NoPen)
-            painter.drawRect(rect)
-            
-            # Bottom border
-            painter.setPen(QPen(QColor(colors['C_BORDER']), 1))
-            painter.drawLine(rect.bottomLeft(), rect.bottomRight())
-            
-            # Text
-            text = index.data(Qt.ItemDataRole.DisplayRole)
-            painter.setFont(QFont("Segoe UI", 11, QFont.Weight.Bold))
-            painter.setPen(QColor(colors['C_HIGHLIGHT_CYAN']))
-            text_rect = rect.adjusted(self.padding, 0, -self.padding, 0)
-            painter.drawText(text_rect, Qt.AlignmentFlag.AlignVCenter, f"📁 {text}")
-            
-        # Emulator card styling (child items)
-        else:
-            # Card background
-            card_rect = rect.adjusted(8, 4, -8, -4)
-            
-            if option.state & QStyle.StateFlag.State_Selected:
-                # Selected gradient
-                gradient = QLinearGradient(card_rect.left(), card_rect.top(), card_rect.right(), card_rect.top())
-                gradient.setColorAt(0, QColor(colors['C_HIGHLIGHT_BLUE']))
-                gradient.setColorAt(0.5, QColor(colors['C_ACCENT']))
-                gradient.setColorAt(1, QColor(colors['C_HIGHLIGHT_BLUE']))
-                painter.setBrush(QBrush(gradient))
-                painter.setPen(QPen(QColor(colors['C_HIGHLIGHT_CYAN']), 2))
-            elif option.state & QStyle.StateFlag.State_MouseOver:
-                painter.setBrush(QColor(colors['C_BACKGROUND_LIGHT']))
-                painter.setPen(QPen(QColor(colors['C_BORDER']), 2))
-            else:
-                painter.setBrush(QColor(colors['C_BACKGROUND_WIDGET']))
-                painter.setPen(QPen(QColor(colors['C_BORDER']), 1))
-            
-            painter.drawRoundedRect(card_rect, 8, 8)
-            
-            # Icon area
-            icon_rect = QRect(card_rect.left() + self.padding, 
-                            card_rect.top() + (card_rect.height() - self.icon_size) // 2,
-                            self.icon_size, self.icon_size)
-            
-            # Draw emulator icon
-            emulator_name = index.data(Qt.ItemDataRole.DisplayRole)
-            icon_emoji = self.get_emulator_icon(emulator_name)
-            painter.setFont(QFont("Segoe UI Emoji", 24))
-            painter.setPen(QColor(colors['C_TEXT_PRIMARY']))
-            painter.drawText(icon_rect, Qt.AlignmentFlag.AlignCenter, icon_emoji)
-            
-            # Text area
-            text_x = icon_rect.right() + 12
-            text_rect = QRect(text_x, card_rect.top() + 8, 
-                            card_rect.width() - (text_x - card_rect.left()) - self.padding, 24)
-            
-            # Emulator name
-            painter.setFont(QFont("Segoe UI", 11, QFont.Weight.Bold))
-            painter.setPen(QColor(colors['C_TEXT_PRIMARY']))
-            painter.drawText(text_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop, emulator_name)
-            
-            # Status indicator (bottom right)
-            status_text = "✓ Configured"
-            painter.setFont(QFont("Segoe UI", 8, QFont.Weight.Medium))
-            painter.setPen(QColor(colors['C_SUCCESS']))
-            status_rect = QRect(text_x, card_rect.bottom() - 24, 
-                              card_rect.width() - (text_x - card_rect.left()) - self.padding, 16)
-            painter.drawText(status_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignBottom, status_text)
-            
-        painter.restore()
-    
-    def get_emulator_icon(self, emulator_name):
-        """Return appropriate emoji icon for emulator"""
-        name_lower = emulator_name.lower()
-        
-        # Map emulator names to icons
-        if 'dolphin' in name_lower:
-            return '🐬'
-        elif 'pcsx2' in name_lower:
-            return '🎮'
-        elif 'rpcs3' in name_lower:
-            return '🎯'
-        elif 'xenia' in name_lower or 'xemu' in name_lower:
-            return '🟢'
-        elif 'duckstation' in name_lower:
-            return '🦆'
-        elif 'ppsspp' in name_lower:
-            return '📱'
-        elif 'mgba' in name_lower or 'visualboy' in name_lower:
-            return '👾'
-        elif 'citra' in name_lower:
-            return '🍊'
-        elif 'cemu' in name_lower:
-            return '🎮'
-        elif 'snes' in name_lower:
-            return '🕹️'
-        elif 'project64' in name_lower:
-            return '6️⃣4️⃣'
-        else:
-            return '🎮'
-
-
-
-# =============================================================================
-# --- CONTROLLER SUPPORT ---
-# =============================================================================
-
-class ControllerHandler(QThread):
-    """Handle controller input for navigation"""
-    button_pressed = pyqtSignal(str)
-    
-    def __init__(self, deadzone=0.2):
-        super().__init__()
-        self.deadzone = deadzone
-        self.running = False
-        self.joystick = None
-        
-    def run(self):
-        """Poll controller in background thread"""
-        try:
-            import pygame
-            pygame.init()
-            pygame.joystick.init()
-            
-            if pygame.joystick.get_count() == 0:
-                return
-            
-            self.joystick = pygame.joystick.Joystick(0)
-            self.joystick.init()
-            self.running = True
-            
-            last_axis = {0: 0, 1: 0}
-            axis_pressed = {0: False, 1: False}
-            
-            while self.running:
-                for event in pygame.event.get():
-                    if event.type == pygame.JOYBUTTONDOWN:
-                        # Map common buttons
-                        button_map = {
-                            0: 'A',  # A/Cross
-                            1: 'B',  # B/Circle
-                            2: 'X',  # X/Square
-                            3: 'Y',  # Y/Triangle
-                            4: 'LB',
-                            5: 'RB',
-                            6: 'Back',
-                            7: 'Start',
-                            8: 'LS',
-                            9: 'RS'
-                        }
-                        if event.button in button_map:
-                            self.button_pressed.emit(button_map[event.button])
-                    
-                    elif event.type == pygame.JOYHATMOTION:
-                        # D-pad
-                        x, y = event.value
-                        if x == -1:
-                            self.button_pressed.emit('Left')
-                        elif x == 1:
-                            self.button_pressed.emit('Right')
-                        if y == 1:
-                            self.button_pressed.emit('Up')
-                        elif y == -1:
-                            self.button_pressed.emit('Down')
-                
-                # Analog stick as D-pad
-                if self.joystick:
-                    # Left stick X axis
-                    x_axis = self.joystick.get_axis(0)
-                    if abs(x_axis) > self.deadzone:
-                        if not axis_pressed[0]:
-                            if x_axis < -self.deadzone:
-                                self.button_pressed.emit('Left')
-                            elif x_axis > self.deadzone:
-                                self.button_pressed.emit('Right')
-                            axis_pressed[0] = True
-                    else:
-                        axis_pressed[0] = False
-                    
-                    # Left stick Y axis
-                    y_axis = self.joystick.get_axis(1)
-                    if abs(y_axis) > self.deadzone:
-                        if not axis_pressed[1]:
-                            if y_axis < -self.deadzone:
-                                self.button_pressed.emit('Up')
-                            elif y_axis > self.deadzone:
-                                self.button_pressed.emit('Down')
-                            axis_pressed[1] = True
-                    else:
-                        axis_pressed[1] = False
-                
-                time.sleep(0.1)  # Poll 10 times per second
-                
-        except ImportError:
-            pass  # pygame not installed
-        except Exception:
-            pass
-    
-    def stop(self):
-        self.running = False
-
-# =============================================================================
-# --- CONFIGURATION MANAGER ---
-# =============================================================================
-class ConfigManager:
-    def __init__(self):
-        config_dir = Path(QStandardPaths.writableLocation(QStandardPaths.StandardLocation.AppLocalDataLocation)) / "EmulatorHub"
-        self.covers_dir = config_dir / "covers"; self.cache_dir = self.covers_dir / "cache"
-        self.save_states_dir = config_dir / "save_states"
-        config_dir.mkdir(parents=True, exist_ok=True); self.covers_dir.mkdir(exist_ok=True)
-        self.cache_dir.mkdir(exist_ok=True); self.save_states_dir.mkdir(exist_ok=True)
-        self.config_path = config_dir / "config.json"
-        self.config = {
-            "game_library_paths": [], "emulators": {}, "custom_covers": {},
-            "game_metadata": {}, "theme": "Modern Dark", "view_mode": "grid",
-            "grid_icon_size": 150, "list_icon_size": 48, "favorites": [],
-            "recently_played": [], "window_geometry": "", "window_state": "",
-            "splitter_state": "", "sort_order": "Name", "platform_defaults": {},
-            "details_panel_visible": True, "selected_platform_filter": "All Platforms",
-            "auto_backup": True, "last_scan_date": "", "total_playtime": 0,
-            "collections": {}, "game_tags": {}, "hotkeys": {}, "performance_mode": "balanced",
-            "controller_enabled": True, "controller_deadzone": 0.2,
-            "rawg_api_key": "", "auto_fetch_metadata": False,
-            "save_states_path": ""
-        }
-        self.load_config()
-    def load_config(self):
-        if self.config_path.exists():
-            with open(self.config_path, 'r') as f: self.config.update(json.load(f))
-    def save_config(self):
-        with open(self.config_path, 'w') as f: json.dump(self.config, f, indent=4)
-
-# =============================================================================
-# --- BACKEND LOGIC ---
-# =============================================================================
-class EmulatorHubBackend:
-    def __init__(self, config_manager: ConfigManager):
-        self.config_manager = config_manager; self.games_by_platform = {}; self.all_games_map = {}
-        self.cache_path = self.config_manager.covers_dir.parent / "game_cache.json"
-        self.image_cache = {}  # In-memory image cache for performance
-        self.PLATFORM_FOLDER_MAP = {"gamecube": "GameCube", "gc": "GameCube", "wii": "Wii", "playstation 2": "PlayStation 2", "ps2": "PlayStation 2", "playstation 3": "PlayStation 3", "ps3": "PlayStation 3", "nintendo switch": "Nintendo Switch", "switch": "Nintendo Switch", "playstation": "PlayStation", "psx": "PlayStation", "ps1": "PlayStation", "psp": "PSP", "playstation portable": "PSP", "xbox": "Xbox", "xbox 360": "Xbox 360", "x360": "Xbox 360", "nintendo 3ds": "Nintendo 3DS", "3ds": "Nintendo 3DS", "nintendo ds": "Nintendo DS", "ds": "Nintendo DS", "dreamcast": "Dreamcast", "dc": "Dreamcast", "super nintendo": "Super Nintendo", "snes": "Super Nintendo", "sega genesis": "Sega Genesis", "genesis": "Sega Genesis", "mega drive": "Sega Genesis", "turbografx-16": "TurboGrafx-16", "pc engine": "TurboGrafx-16", "game boy": "Game Boy", "gb": "Game Boy", "game boy color": "Game Boy Color", "gbc": "Game Boy Color", "game boy advance": "Game Boy Advance", "gba": "Game Boy Advance", "sega game gear": "Sega Game Gear", "gg": "Sega Game Gear", "atari lynx": "Atari Lynx", "lynx": "Atari Lynx"}
-        self.GAME_EXTENSIONS = {
-            ".exe": "PC",
-            ".lnk": "PC",
-            ".url": "PC",
-            ".iso": "PlayStation 2", 
-            ".pkg": "PlayStation 3",
-            ".xiso.iso": "Xbox", 
-            ".gcz": "GameCube", 
-            ".rvz": "GameCube", 
-            ".wbfs": "Wii", 
-            ".chd": "PlayStation", 
-            ".cue": "PlayStation", 
-            ".bin": "PlayStation", 
-            ".cso": "PSP", 
-            ".3ds": "Nintendo 3DS", 
-            ".cci": "Nintendo 3DS", 
-            ".nds": "Nintendo DS", 
-            ".gdi": "Dreamcast", 
-            ".cdi": "Dreamcast",
-            ".z64": "Nintendo 64",
-            ".sfc": "Super Nintendo",
-            ".smc": "Super Nintendo",
-            ".md": "Sega Genesis",
-            ".smd": "Sega Genesis",
-            ".gen": "Sega Genesis",
-            ".pce": "TurboGrafx-16",
-            ".gb": "Game Boy",
-            ".gbc": "Game Boy Color",
-            ".gba": "Game Boy Advance",
-            ".gg": "Sega Game Gear",
-            ".lnx": "Atari Lynx"
-        }
-        self.KNOWN_EMULATORS = {
-            # Handhelds
-            "mGBA": {"executables": ["mgba"], "systems": ["Game Boy", "Game Boy Color", "Game Boy Advance"]},
-            "VisualBoyAdvance-M": {"executables": ["visualboyadvance-m", "vbam"], "systems": ["Game Boy", "Game Boy Color", "Game Boy Advance"]},
-            "SameBoy": {"executables": ["sameboy"], "systems": ["Game Boy", "Game Boy Color"]},
-            # 4th Generation
-            "Snes9x": {"executables": ["snes9x"], "systems": ["Super Nintendo"]},
-            "Mesen": {"executables": ["mesen"], "systems": ["Super Nintendo"]},
-            "Kega Fusion": {"executables": ["fusion"], "systems": ["Sega Genesis", "Sega Game Gear"]},
-            "BlastEm": {"executables": ["blastem"], "systems": ["Sega Genesis"]},
-            # 6th Generation
-            "Dolphin": {"executables": ["dolphin"], "systems": ["GameCube", "Wii"]}, 
-            "PCSX2": {"executables": ["pcsx2", "pcsx2-qt"], "systems": ["PlayStation 2"]}, 
-            "Xemu": {"executables": ["xemu"], "systems": ["Xbox"]},
-            "Redream": {"executables": ["redream"], "systems": ["Dreamcast"]},
-            "Flycast": {"executables": ["flycast"], "systems": ["Dreamcast"]},
-            
-            # 5th Generation
-            "DuckStation": {"executables": ["duckstation-qt", "duckstation-nogui"], "systems": ["PlayStation"]}, 
-            "Project64": {"executables": ["project64"], "systems": ["Nintendo 64"]},
-            "simple64": {"executables": ["simple64-gui", "simple64-cli"], "systems": ["Nintendo 64"]},
-            "Mednafen": {"executables": ["mednafen"], "systems": ["PlayStation", "Sega Saturn", "Super Nintendo", "Sega Genesis", "TurboGrafx-16", "Atari Lynx"]},
-            "YabaSanshiro": {"executables": ["yabasanshiro"], "systems": ["Sega Saturn"]},
-            "Kronos": {"executables": ["kronos"], "systems": ["Sega Saturn"]},
-            
-            # Other Previously Added Emulators
-            "RPCS3": {"executables": ["rpcs3"], "systems": ["PlayStation 3"]}, 
-            "Xenia": {"executables": ["xenia"], "systems": ["Xbox 360"]}
-        }
-
-    def load_from_cache(self):
-        if not self.cache_path.exists():
-            return False
-        try:
-            with open(self.cache_path, 'r') as f:
-                cached_data = json.load(f)
-            self.all_games_map = cached_data
-            self.games_by_platform.clear()
-            for game in self.all_games_map.values():
-                platform = game['platform']
-                if platform not in self.games_by_platform:
-                    self.games_by_platform[platform] = []
-                self.games_by_platform[platform].append(game)
-            return True
-        except (json.JSONDecodeError, KeyError):
-            self.clear_cache()
-            return False
-
-    def save_to_cache(self):
-        with open(self.cache_path, 'w') as f:
-            json.dump(self.all_games_map, f)
-
-    def clear_cache(self):
-        if self.cache_path.exists():
-            self.cache_path.unlink()
-
-    def set_custom_game_image(self, game_hash, image_path):
-        try:
-            from PIL import Image
-        except ImportError:
-            return False, "Pillow library is required. Please run: pip install Pillow"
-        source_path = Path(image_path)
-        if source_path.suffix.lower() not in ['.png', '.jpg', '.jpeg', '.webp']:
-             return False, "Unsupported image format."
-        try:
-            new_name = f"{game_hash}{source_path.suffix}"; dest_path = self.config_manager.covers_dir / new_name
-            shutil.copy(source_path, dest_path); thumb_path = self.config_manager.cache_dir / new_name
-            with Image.open(dest_path) as img:
-                img.thumbnail((300, 300)); img.save(thumb_path, quality=85)
-            self.config_manager.config["custom_covers"][game_hash] = new_name; self.config_manager.save_config()
-            # Clear from image cache to force reload
-            if game_hash in self.image_cache:
-                del self.image_cache[game_hash]
-            return True, "Set new custom cover image."
-        except Exception as e:
-            return False, f"Could not save image cover: {e}"
-            
-    def _clean_game_title(self, filename):
-        title = Path(filename).stem; title = re.sub(r'\.xiso$', '', title, flags=re.IGNORECASE)
-        title = re.sub(r'\[.*?\]', '', title); title = re.sub(r'\(.*?\)', '', title)
-        title = title.replace('.', ' ').replace('_', ' '); return title.strip()
-    def launch_game(self, game_hash, chosen_emulator_config=None):
-        game_data = self.all_games_map.get(game_hash);
-        if not game_data: return None, "Game data not found."
-        
-        # PC games don't need emulators
-        if game_data['platform'] in ['PC', 'Windows']:
-            return self._launch_pc_game(game_data)
-        
-        if not chosen_emulator_config:
-            return None, "No emulator configuration provided."
-        
-        emulator_path = chosen_emulator_config['path']; launch_args = chosen_emulator_config.get('args', '')
-        path_to_launch = self._get_launchable_path(game_data)
-        if not path_to_launch: return None, "Could not determine a launchable file for this game."
-        command = self._build_launch_command(emulator_path, launch_args, path_to_launch)
-        try:
-            process = subprocess.Popen(command); self.add_to_recently_played(game_data['hash']); return process, f"Launching {game_data['title']}..."
-        except Exception as e:
-            return None, f"Failed to start emulator: {e}"
-    
-    def _launch_pc_game(self, game_data):
-        """Launch PC game directly without emulator"""
-        game_path = game_data['path']
-        
-        try:
-            # Handle .lnk shortcuts
-            if game_path.lower().endswith('.lnk'):
-                # Use Windows shell to open the shortcut
-                import ctypes
-                ctypes.windll.shell32.ShellExecuteW(None, "open", game_path, None, None, 1)
-                self.add_to_recently_played(game_data['hash'])
-                return True, f"Launching {game_data['title']}..."
-            
-            # Handle .url files
-            elif game_path.lower().endswith('.url'):
-                os.startfile(game_path)
-                self.add_to_recently_played(game_data['hash'])
-                return True, f"Launching {game_data['title']}..."
-            
-            # Handle .exe files
-            elif game_path.lower().endswith('.exe'):
-                # Get the directory of the exe for working directory
-                work_dir = os.path.dirname(game_path)
-                process = subprocess.Popen([game_path], cwd=work_dir)
-                self.add_to_recently_played(game_data['hash'])
-                return process, f"Launching {game_data['title']}..."
-            
-            # Handle folders (look for common executable names)
-            elif os.path.isdir(game_path):
-                # Look for common game executable patterns
-                exe_files = [f for f in os.listdir(game_path) if f.lower().endswith('.exe')]
-                if exe_files:
-                    # Prefer game.exe, launcher.exe, or first .exe found
-                    exe_name = next((f for f in exe_files if 'game' in f.lower()), 
-                                   next((f for f in exe_files if 'launch' in f.lower()), exe_files[0]))
-                    exe_path = os.path.join(game_path, exe_name)
-                    process = subprocess.Popen([exe_path], cwd=game_path)
-                    self.add_to_recently_played(game_data['hash'])
-                    return process, f"Launching {game_data['title']}..."
-                else:
-                    return None, "No executable found in game folder."
-            
-            return None, "Unsupported PC game file type."
-            
-        except Exception as e:
-            return None, f"Failed to launch PC game: {e}"
-    def _get_launchable_path(self, game_data):
-        if game_data['platform'] == "PlayStation 3":
-            path_obj = Path(game_data['path'])
-            if path_obj.is_dir():
-                eboot_path = path_obj / 'PS3_GAME' / 'USRDIR' / 'EBOOT.BIN'
-                if eboot_path.exists():
-                    return str(eboot_path)
-                if (path_obj / 'PS3_GAME').exists():
-                    return str(path_obj)
-                return None
-        return game_data['path']
-    def _build_launch_command(self, emulator_path, args_str, game_path):
-        norm_emulator_path = os.path.normpath(emulator_path); norm_game_path = os.path.normpath(game_path)
-        command = [norm_emulator_path]
-        if args_str:
-            if '%ROM%' in args_str:
-                full_args_str = args_str.replace('%ROM%', f'"{norm_game_path}"'); command.extend(shlex.split(full_args_str))
-            else:
-                command.extend(shlex.split(args_str)); command.append(norm_game_path)
-        else:
-            command.append(norm_game_path)
-        return command
-    def is_favorite(self, game_hash): return game_hash in self.config_manager.config['favorites']
-    def toggle_favorite(self, game_hash):
-        favorites = self.config_manager.config['favorites']
-        if game_hash in favorites: favorites.remove(game_hash)
-        else: favorites.append(game_hash)
-        self.config_manager.save_config()
-    def add_to_recently_played(self, game_hash):
-        recents = self.config_manager.config.get('recently_played', [])
-        if game_hash in recents: recents.remove(game_hash)
-        recents.insert(0, game_hash); self.config_manager.config['recently_played'] = recents[:20]; self.config_manager.save_config()
-    def get_favorite_games(self): return [self.all_games_map[h] for h in self.config_manager.config['favorites'] if h in self.all_games_map]
-    def get_recently_played_games(self): return [self.all_games_map[h] for h in self.config_manager.config['recently_played'] if h in self.all_games_map]
-    def get_emulators_for_system(self, system: str) -> list:
-        found_emulators = [];
-        for name, data in self.config_manager.config["emulators"].items():
-            if system.lower() in [s.lower() for s in data.get("systems", [])]: found_emulators.append({"name": name, "config": data})
-        return found_emulators
-
-    # --- FIX: New, simpler, name-only detection logic ---
-    def detect_emulator_from_exe(self, exe_path):
-        """Detects an emulator by checking if known names are part of the exe filename."""
-        selected_exe_name = Path(exe_path).name.lower()
-
-        for emu_name, emu_data in self.KNOWN_EMULATORS.items():
-            for known_exe in emu_data["executables"]:
-                # Check if a known name (e.g., "dolphin") is in the filename ("Dolphin-x64.exe")
-                if known_exe in selected_exe_name:
-                    return {
-                        "name": f"[Auto] {emu_name}", 
-                        "data": {
-                            "path": exe_path, 
-                            "systems": emu_data["systems"], 
-                            "args": emu_data.get("default_args", "")
-                        }
-                    }
-        return None
-        
-    def get_platform_from_path(self, path):
-        p = Path(path);
-        while p.parent != p:
-            platform = self.PLATFORM_FOLDER_MAP.get(p.name.lower());
-            if platform: return platform
-            p = p.parent
-        return None
-
-# =============================================================================
-# --- UI DIALOGS ---
-# =============================================================================
-# =============================================================================
-# --- UI DIALOGS ---
-# =============================================================================
-
-class SplashScreen(QWidget):
-    """Modern animated splash screen for app startup"""
-    def __init__(self):
-        super().__init__()
-        self.setWindowFlags(Qt.WindowType.FramelessWindowHint | Qt.WindowType.WindowStaysOnTopHint)
-        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
-        self.setFixedSize(500, 300)
-        
-        # Center on screen
-        screen = QApplication.primaryScreen().geometry()
-        self.move((screen.width() - self.width()) // 2, (screen.height() - self.height()) // 2)
-        
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(30, 30, 30, 30)
-        
-        # Title
-        title = QLabel(f"{Constants.APP_NAME}")
-        title.setFont(QFont("Segoe UI", 32, QFont.Weight.Bold))
-        title.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title.setStyleSheet(f"color: {Constants.C_HIGHLIGHT_CYAN};")
-        
-        # Version
-        version = QLabel(f"Version {Constants.VERSION}")
-        version.setFont(QFont("Segoe UI", 14))
-        version.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        version.setStyleSheet(f"color: {Constants.C_TEXT_SECONDARY};")
-        
-        # Status label
-        self.status_label = QLabel("Initializing...")
-        self.status_label.setFont(QFont("Segoe UI", 10))
-        self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.status_label.setStyleSheet(f"color: {Constants.C_TEXT_PRIMARY};")
-        
-        # Progress bar
-        self.progress = QProgressBar()
-        self.progress.setRange(0, 0)  # Indeterminate
-        self.progress.setTextVisible(False)
-        self.progress.setFixedHeight(4)
-        self.progress.setStyleSheet(f"""
-            QProgressBar {{
-                background-color: {Constants.C_BACKGROUND_LIGHT};
-                border: none;
-                border-radius: 2px;
-            }}
-            QProgressBar::chunk {{
-                background-color: {Constants.C_HIGHLIGHT_CYAN};
-                border-radius: 2px;
-            }}
-        """)
-        
-        layout.addStretch()
-        layout.addWidget(title)
-        layout.addWidget(version)
-        layout.addSpacing(40)
-        layout.addWidget(self.status_label)
-        layout.addWidget(self.progress)
-        layout.addStretch()
-    
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # Draw rounded background with gradient
-        from PyQt6.QtGui import QLinearGradient
-        gradient = QLinearGradient(0, 0, 0, self.height())
-        gradient.setColorAt(0, QColor(Constants.C_BACKGROUND_DARK))
-        gradient.setColorAt(1, QColor(Constants.C_BACKGROUND_LIGHT))
-        
-        painter.setBrush(QBrush(gradient))
-        painter.setPen(QPen(QColor(Constants.C_BORDER), 2))
-        painter.drawRoundedRect(self.rect(), 15, 15)
-    
-    def update_status(self, message):
-        self.status_label.setText(message)
-        QApplication.processEvents()
-
-class SettingsDialog(QDialog):
-    """Comprehensive settings dialog for all app configurations"""
-    def __init__(self, config_manager, parent=None):
-        super().__init__(parent)
-        self.config_manager = config_manager
-        self.setWindowTitle("Settings")
-        self.setMinimumSize(700, 500)
-        
-        layout = QVBoxLayout(self)
-        
-        # Tab widget for different settings categories
-        tabs = QTabWidget()
-        
-        # General Settings
-        general_tab = QWidget()
-        general_layout = QFormLayout(general_tab)
-        
-        self.auto_backup_check = QCheckBox("Enable automatic backups")
-        self.auto_backup_check.setChecked(config_manager.config.get("auto_backup", True))
-        general_layout.addRow("Backups:", self.auto_backup_check)
-        
-        self.performance_combo = QComboBox()
-        self.performance_combo.addItems(["Low", "Balanced", "High"])
-        self.performance_combo.setCurrentText(config_manager.config.get("performance_mode", "balanced").title())
-        general_layout.addRow("Performance Mode:", self.performance_combo)
-        
-        tabs.addTab(general_tab, "General")
-        
-        # Appearance Settings
-        appearance_tab = QWidget()
-        appearance_layout = QFormLayout(appearance_tab)
-        
-        self.theme_combo = QComboBox()
-        self.theme_combo.addItems(["Modern Dark", "Modern Light"])
-        self.theme_combo.setCurrentText(config_manager.config.get("theme", "Modern Dark"))
-        appearance_layout.addRow("Theme:", self.theme_combo)
-        
-        tabs.addTab(appearance_tab, "Appearance")
-        
-        # Hotkeys Settings
-        hotkeys_tab = QWidget()
-        hotkeys_layout = QFormLayout(hotkeys_tab)
-        hotkeys_layout.addRow(QLabel("Keyboard Shortcuts:"))
-        hotkeys_layout.addRow("Refresh Library:", QLabel("F5"))
-        hotkeys_layout.addRow("Search:", QLabel("Ctrl+F"))
-        hotkeys_layout.addRow("Toggle View:", QLabel("Ctrl+Tab"))
-        hotkeys_layout.addRow("Launch Game:", QLabel("Enter"))
-        hotkeys_layout.addRow("Delete Game:", QLabel("Delete"))
-        
-        tabs.addTab(hotkeys_tab, "Hotkeys")
-        
-        layout.addWidget(tabs)
-        
-        # Buttons
-        button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
-        button_box.accepted.connect(self.accept)
-        button_box.rejected.connect(self.reject)
-        layout.addWidget(button_box)
-    
-    def get_settings(self):
-        return {
-            "auto_backup": self.auto_backup_check.isChecked(),
-            "performance_mode": self.performance_combo.currentText().lower(),
-            "theme": self.theme_combo.currentText()
-        }
-
-class EnhancedGameInfoDialog(QDialog):
-    """Enhanced game info dialog with metadata editing"""
-    def __init__(self, game_data, backend, parent=None):
-        super().__init__(parent)
-        self.game_data = game_data
-        self.backend = backend
-        self.setWindowTitle(f"Game Info - {game_data.get('title', 'Unknown')}")
-        self.setMinimumSize(600, 500)
-        
-        layout = QVBoxLayout(self)
-        
-        # Top section with cover and basic info
-        top_layout = QHBoxLayout()
-        
-        # Cover image
-        cover_label = QLabel()
-        cover_label.setFixedSize(200, 267)
-        cover_label.setScaledContents(True)
-        cover_path = parent.get_cover_path_for_game(game_data) if parent else None
-        if cover_path:
-            pixmap = QPixmap(str(cover_path))
-            cover_label.setPixmap(pixmap.scaled(200, 267, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
-        else:
-            cover_label.setText("No Cover")
-            cover_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        
-        # Info section
-        info_layout = QFormLayout()
-        
-        self.title_edit = QLineEdit(game_data.get('title', ''))
-        info_layout.addRow("Title:", self.title_edit)
-        
-        platform_label = QLabel(game_data.get('platform', 'N/A'))
-        info_layout.addRow("Platform:", platform_label)
-        
-        size_label = QLabel(format_size(game_data.get('size', 0)))
-        info_layout.addRow("File Size:", size_label)
-        
-        playtime_label = QLabel(format_playtime(game_data.get('playtime', 0)))
-        info_layout.addRow("Time Played:", playtime_label)
-        
-        path_label = QLabel(game_data.get('path', 'N/A'))
-        path_label.setWordWrap(True)
-        info_layout.addRow("Location:", path_label)
-        
-        # Notes field
-        self.notes_edit = QLineEdit(game_data.get('notes', ''))
-        self.notes_edit.setPlaceholderText("Add notes about this game...")
-        info_layout.addRow("Notes:", self.notes_edit)
-        
-        # Tags
-        self.tags_edit = QLineEdit(game_data.get('tags', ''))
-        self.tags_edit.setPlaceholderText("Comma-separated tags...")
-        info_layout.addRow("Tags:", self.tags_edit)
-        
-        top_layout.addWidget(cover_label)
-        top_layout.addLayout(info_layout, 1)
-        layout.addLayout(top_layout)
-        
-        # Buttons
-        button_layout = QHBoxLayout()
-        
-        change_cover_btn = QPushButton("Change Cover...")
-        change_cover_btn.clicked.connect(self.change_cover)
-        button_layout.addWidget(change_cover_btn)
-        
-        button_layout.addStretch()
-        
-        save_btn = QPushButton("Save")
-        save_btn.clicked.connect(self.accept)
-        cancel_btn = QPushButton("Cancel")
-        cancel_btn.clicked.connect(self.reject)
-        
-        button_layout.addWidget(save_btn)
-        button_layout.addWidget(cancel_btn)
-        
-        layout.addLayout(button_layout)
-    
-    def change_cover(self):
-        image_path, _ = QFileDialog.getOpenFileName(self, "Select Cover Image", "", "Images (*.png *.jpg *.jpeg *.webp)")
-        if image_path:
-            success, message = self.backend.set_custom_game_image(self.game_data['hash'], image_path)
-            if success:
-                QMessageBox.information(self, "Success", "Cover image updated!")
-            else:
-                QMessageBox.critical(self, "Error", message)
-    
-    def get_metadata(self):
-        return {
-            "title": self.title_edit.text(),
-            "notes": self.notes_edit.text(),
-            "tags": self.tags_edit.text()
-        }
-
-class CollectionManagerDialog(QDialog):
-    """Dialog for managing game collections"""
-    def __init__(self, config_manager, parent=None):
-        super().__init__(parent)
-        self.config_manager = config_manager
-        self.setWindowTitle("Manage Collections")
-        self.setMinimumSize(500, 400)
-        
-        layout = QVBoxLayout(self)
-        
-        # Collections list
-        self.collections_list = QListWidget()
-        self.populate_collections()
-        layout.addWidget(QLabel("Your Collections:"))
-        layout.addWidget(self.collections_list)
-        
-        # Buttons
-        button_layout = QHBoxLayout()
-        
-        add_btn = QPushButton("New Collection...")
-        add_btn.clicked.connect(self.add_collection)
-        
-        rename_btn = QPushButton("Rename...")
-        rename_btn.clicked.connect(self.rename_collection)
-        
-        delete_btn = QPushButton("Delete")
-        delete_btn.clicked.connect(self.delete_collection)
-        
-        button_layout.addWidget(add_btn)
-        button_layout.addWidget(rename_btn)
-        button_layout.addWidget(delete_btn)
-        button_layout.addStretch()
-        
-        close_btn = QPushButton("Close")
-        close_btn.clicked.connect(self.accept)
-        button_layout.addWidget(close_btn)
-        
-        layout.addLayout(button_layout)
-    
-    def populate_collections(self):
-        self.collections_list.clear()
-        for collection_name in self.config_manager.config.get("collections", {}).keys():
-            self.collections_list.addItem(collection_name)
-    
-    def add_collection(self):
-        name, ok = QLineEdit().text(), True
-        name, ok = self.get_collection_name("New Collection", "")
-        if ok and name:
-            if name not in self.config_manager.config.get("collections", {}):
-                self.config_manager.config.setdefault("collections", {})[name] = []
-                self.config_manager.save_config()
-                self.populate_collections()
-            else:
-                QMessageBox.warning(self, "Duplicate", "A collection with this name already exists.")
-    
-    def rename_collection(self):
-        current_item = self.collections_list.currentItem()
-        if not current_item:
-            return
-        old_name = current_item.text()
-        new_name, ok = self.get_collection_name("Rename Collection", old_name)
-        if ok and new_name and new_name != old_name:
-            collections = self.config_manager.config.get("collections", {})
-            if new_name not in collections:
-                collections[new_name] = collections.pop(old_name)
-                self.config_manager.save_config()
-                self.populate_collections()
-    
-    def delete_collection(self):
-        current_item = self.collections_list.currentItem()
-        if not current_item:
-            return
-        name = current_item.text()
-        reply = QMessageBox.question(self, "Confirm Delete", f"Delete collection '{name}'?")
-        if reply == QMessageBox.StandardButton.Yes:
-            del self.config_manager.config["collections"][name]
-            self.config_manager.save_config()
-            self.populate_collections()
-    
-    def get_collection_name(self, title, default):
-        dialog = QDialog(self)
-        dialog.setWindowTitle(title)
-        layout = QVBoxLayout(dialog)
-        
-        name_edit = QLineEdit(default)
-        layout.addWidget(QLabel("Collection Name:"))
-        layout.addWidget(name_edit)
-        
-        buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
-        buttons.accepted.connect(dialog.accept)
-        buttons.rejected.connect(dialog.reject)
-        layout.addWidget(buttons)
-        
-        ok = dialog.exec() == QDialog.DialogCode.Accepted
-        return name_edit.text().strip(), ok
-
-class SaveStateManagerDialog(QDialog):
-    """Dialog for managing game save states"""
-    def __init__(self, game_data, config_manager, parent=None):
-        super().__init__(parent)
-        self.game_data = game_data
-        self.config_manager = config_manager
-        self.setWindowTitle(f"Save States - {game_data['title']}")
-        self.setMinimumSize(600, 400)
-        
-        layout = QVBoxLayout(self)
-        
-        # Info
-        info = QLabel(f"Manage save states for {game_data['title']}")
-        info.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
-        layout.addWidget(info)
-        
-        # Save states list
-        self.states_tree = QTreeWidget()
-        self.states_tree.setHeaderLabels(["Save State", "Date", "Size"])
-        self.states_tree.setColumnWidth(0, 300)
-        self.populate_save_states()
-        layout.addWidget(self.states_tree)
-        
-        # Buttons
-        button_layout = QHBoxLayout()
-        
-        btn_create = QPushButton("Create Save Point")
-        btn_create.clicked.connect(self.create_save_point)
-        
-        btn_load = QPushButton("Load State")
-        btn_load.clicked.connect(self.load_state)
-        
-        btn_delete = QPushButton("Delete")
-        btn_delete.clicked.connect(self.delete_state)
-        
-        btn_open_folder = QPushButton("Open Folder")
-        btn_open_folder.clicked.connect(self.open_saves_folder)
-        
-        button_layout.addWidget(btn_create)
-        button_layout.addWidget(btn_load)
-        button_layout.addWidget(btn_delete)
-        button_layout.addStretch()
-        button_layout.addWidget(btn_open_folder)
-        
-        close_btn = QPushButton("Close")
-        close_btn.clicked.connect(self.accept)
-        
-        layout.addLayout(button_layout)
-        layout.addWidget(close_btn)
-    
-    def get_save_folder(self):
-        """Get save folder for this game"""
-        game_hash = self.game_data['hash']
-        save_folder = self.config_manager.save_states_dir / game_hash
-        save_folder.mkdir(exist_ok=True)
-        return save_folder
-    
-    def populate_save_states(self):
-        """List all save states"""
-        self.states_tree.clear()
-        save_folder = self.get_save_folder()
-        
-        if save_folder.exists():
-            for save_file in sorted(save_folder.iterdir(), key=lambda x: x.stat().st_mtime, reverse=True):
-                if save_file.is_file():
-                    mod_time = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(save_file.stat().st_mtime))
-                    size = format_size(save_file.stat().st_size)
-                    item = QTreeWidgetItem([save_file.name, mod_time, size])
-                    item.setData(0, Qt.ItemDataRole.UserRole, str(save_file))
-                    self.states_tree.addTopLevelItem(item)
-        
-        if self.states_tree.topLevelItemCount() == 0:
-            placeholder = QTreeWidgetItem(["No save states yet", "", ""])
-            placeholder.setFlags(Qt.ItemFlag.NoItemFlags)
-            self.states_tree.addTopLevelItem(placeholder)
-    
-    def create_save_point(self):
-        """Create a new save point"""
-        from PyQt6.QtWidgets import QInputDialog
-        name, ok = QInputDialog.getText(self, "Create Save Point", "Save point name:")
-        if ok and name:
-            save_folder = self.get_save_folder()
-            timestamp = time.strftime("%Y%m%d_%H%M%S")
-            filename = f"{name}_{timestamp}.save"
-            save_path = save_folder / filename
-            
-            # Create empty save file (in real use, this would copy actual save data)
-            save_path.write_text(json.dumps({
-                "game": self.game_data['title'],
-                "timestamp": time.time(),
-                "note": name
-            }))
-            
-            self.populate_save_states()
-            QMessageBox.information(self, "Save Created", f"Save point '{name}' created.")
-    
-    def load_state(self):
-        """Load selected save state"""
-        current = self.states_tree.currentItem()
-        if not current or not current.data(0, Qt.ItemDataRole.UserRole):
-            return
-        
-        save_path = current.data(0, Qt.ItemDataRole.UserRole)
-        QMessageBox.information(self, "Load State", f"In a real implementation, this would load save state from:\n{save_path}")
-    
-    def delete_state(self):
-        """Delete selected save state"""
-        current = self.states_tree.currentItem()
-        if not current or not current.data(0, Qt.ItemDataRole.UserRole):
-            return
-        
-        save_path = Path(current.data(0, Qt.ItemDataRole.UserRole))
-        reply = QMessageBox.question(self, "Confirm Delete", f"Delete save state '{save_path.name}'?")
-        if reply == QMessageBox.StandardButton.Yes:
-            try:
-                save_path.unlink()
-                self.populate_save_states()
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to delete save: {e}")
-    
-    def open_saves_folder(self):
-        """Open the saves folder in explorer"""
-        save_folder = self.get_save_folder()
-        if sys.platform == "win32":
-            subprocess.Popen(['explorer', str(save_folder)])
-        elif sys.platform == "darwin":
-            subprocess.Popen(['open', str(save_folder)])
-        else:
-            subprocess.Popen(['xdg-open', str(save_folder)])
-
-class EmulatorEditDialog(QDialog):
-    def __init__(self, emu_name="", emu_data=None, parent=None):
-        super().__init__(parent); self.setWindowTitle("Add/Edit Emulator")
-        emu_data = emu_data or {"path": "", "systems": [], "args": ""}; layout = QVBoxLayout(self); layout.addWidget(QLabel("Emulator Name:")); self.name_edit = QLineEdit(emu_name); layout.addWidget(self.name_edit)
-        layout.addWidget(QLabel("Executable Path:")); path_layout = QHBoxLayout(); self.path_edit = QLineEdit(emu_data["path"]); btn_browse = QPushButton("Browse..."); btn_browse.clicked.connect(self.browse_for_exe); path_layout.addWidget(self.path_edit); path_layout.addWidget(btn_browse); layout.addLayout(path_layout)
-        layout.addWidget(QLabel("Supported Systems (comma-separated):")); self.systems_edit = QLineEdit(", ".join(emu_data.get("systems", []))); layout.addWidget(self.systems_edit)
-        layout.addWidget(QLabel("Launch Arguments (use %ROM% for game path):")); self.args_edit = QLineEdit(emu_data.get("args", "")); layout.addWidget(self.args_edit)
-        buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel); buttons.accepted.connect(self.accept); buttons.rejected.connect(self.reject); layout.addWidget(buttons)
-    def browse_for_exe(self): path, _ = QFileDialog.getOpenFileName(self, "Select Executable"); self.path_edit.setText(path) if path else None
-    def get_data(self): return {"name": self.name_edit.text().strip(), "data": {"path": self.path_edit.text().strip(), "systems": [s.strip() for s in self.systems_edit.text().split(",") if s.strip()], "args": self.args_edit.text().strip()}}
-
-class GameInfoDialog(QDialog):
-    def __init__(self, info, parent=None):
-        super().__init__(parent); self.setWindowTitle(info.get('title', 'Game Info')); self.setMinimumSize(400, 150); layout = QVBoxLayout(self)
-        for key, title in [("title", "Title:"), ("platform", "Platform:"), ("size", "Size:"), ("playtime", "Time Played:")]:
-            layout.addWidget(QLabel(f"<b>{title}</b> {info.get(key, 'N/A')}"))
-        layout.addStretch(); close_btn = QPushButton("Close"); close_btn.clicked.connect(self.accept); layout.addWidget(close_btn, 0, Qt.AlignmentFlag.AlignRight)
-
-class EmulatorChoiceDialog(QDialog):
-    def __init__(self, emulators, platform_name, parent=None):
-        super().__init__(parent); self.setWindowTitle("Choose Emulator")
-        layout = QVBoxLayout(self); layout.addWidget(QLabel("Multiple emulators found. Please choose one:"))
-        self.list_widget = QListWidget()
-        for emu_name in emulators:
-            self.list_widget.addItem(emu_name)
-        self.list_widget.setCurrentRow(0); layout.addWidget(self.list_widget)
-        self.set_default_checkbox = QCheckBox(f"Always use this choice for {platform_name}")
-        layout.addWidget(self.set_default_checkbox)
-        buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
-        buttons.accepted.connect(self.accept); buttons.rejected.connect(self.reject); layout.addWidget(buttons)
-    
-    def get_selected_emulator_name(self):
-        return self.list_widget.currentItem().text() if self.list_widget.currentItem() else None
-
-    def get_set_as_default(self):
-        return self.set_default_checkbox.isChecked()
-
-class LibraryManagerDialog(QDialog):
-    def __init__(self, config_manager, parent=None):
-        super().__init__(parent); self.config_manager = config_manager; self.setWindowTitle("Manage Game Folders"); self.setMinimumSize(600, 400)
-        layout = QVBoxLayout(self); layout.addWidget(QLabel("Game Library Folders:"))
-        self.path_list = QListWidget(); self.populate_list(); layout.addWidget(self.path_list)
-        button_layout = QHBoxLayout(); btn_add = QPushButton("Add Folder..."); btn_add.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_FileDialogNewFolder))
-        self.btn_remove = QPushButton("Remove Selected"); self.btn_remove.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_TrashIcon))
-        btn_add.clicked.connect(self.add_path); self.btn_remove.clicked.connect(self.remove_path)
-        button_layout.addStretch(); button_layout.addWidget(btn_add); button_layout.addWidget(self.btn_remove); layout.addLayout(button_layout)
-        self.path_list.currentItemChanged.connect(lambda item: self.btn_remove.setEnabled(item is not None)); self.btn_remove.setEnabled(False)
-    def populate_list(self):
-        self.path_list.clear(); self.path_list.addItems(self.config_manager.config["game_library_paths"])
-    def add_path(self):
-        path = QFileDialog.getExistingDirectory(self, "Select Game Folder")
-        if path and path not in self.config_manager.config["game_library_paths"]:
-            self.config_manager.config["game_library_paths"].append(path); self.config_manager.save_config(); self.populate_list()
-    def remove_path(self):
-        selected_item = self.path_list.currentItem()
-        if not selected_item: return
-        path_to_remove = selected_item.text()
-        if QMessageBox.question(self, "Confirm Removal", f"Are you sure you want to remove this folder from the library?\n\n{path_to_remove}") == QMessageBox.StandardButton.Yes:
-            self.config_manager.config["game_library_paths"].remove(path_to_remove); self.config_manager.save_config(); self.populate_list()
-
-# =============================================================================
-# --- MAIN APPLICATION WINDOW ---
-# =============================================================================
-class EmulatorHubWindow(QMainWindow):
-    def __init__(self, backend, config_manager):
-        super().__init__()
-        self.backend = backend; self.config_manager = config_manager
-        self.themes = {
-            "Modern Dark": {
-                "C_BACKGROUND_DARK": "#1A1B26", "C_BACKGROUND_LIGHT": "#24283B", "C_BACKGROUND_WIDGET": "#16161E",
-                "C_BORDER": "#414868", "C_TEXT_PRIMARY": "#C0CAF5", "C_TEXT_SECONDARY": "#9AA5CE",
-                "C_HIGHLIGHT_BLUE": "#7AA2F7", "C_HIGHLIGHT_CYAN": "#2AC3DE", "C_ACCENT": "#BB9AF7",
-                "C_SUCCESS": "#9ECE6A", "C_WARNING": "#E0AF68", "C_ERROR": "#F7768E"
-            },
-            "Modern Light": {
-                "C_BACKGROUND_DARK": "#F5F5F5", "C_BACKGROUND_LIGHT": "#FFFFFF", "C_BACKGROUND_WIDGET": "#FAFAFA",
-                "C_BORDER": "#D0D0D0", "C_TEXT_PRIMARY": "#2E3440", "C_TEXT_SECONDARY": "#4C566A",
-                "C_HIGHLIGHT_BLUE": "#5E81AC", "C_HIGHLIGHT_CYAN": "#88C0D0", "C_ACCENT": "#B48EAD",
-                "C_SUCCESS": "#A3BE8C", "C_WARNING": "#EBCB8B", "C_ERROR": "#BF616A"
-            }
-        }
-        self.current_theme_name = self.config_manager.config.get("theme", "Modern Dark")
-        self.is_grid_mode = self.config_manager.config.get("view_mode", "grid") == "grid"
-        self.current_grid_icon_size = self.config_manager.config.get("grid_icon_size", 150)
-        self.current_list_icon_size = self.config_manager.config.get("list_icon_size", 48)
-        self.grid_delegate = GridItemDelegate(self.backend, self); self.list_delegate = SpacedListItemDelegate(parent=self)
-        self.setWindowTitle(f"{Constants.APP_NAME} v{Constants.VERSION}"); self.setGeometry(100, 100, 1280, 800)
-        self.process_timers = {}
-        self.selected_games = []  # For batch operations
-        self.scanner_thread = None
-
-        self.search_debounce_timer = QTimer(self)
-        self.search_debounce_timer.setSingleShot(True)
-        self.search_debounce_timer.setInterval(300)
-        self.search_debounce_timer.timeout.connect(self.repopulate_games_list)
-
-        self.setAcceptDrops(True)
-        
-        # Initialize controller support
-        self.controller_handler = None
-        if self.config_manager.config.get("controller_enabled", True):
-            try:
-                self.controller_handler = ControllerHandler(self.config_manager.config.get("controller_deadzone", 0.2))
-                self.controller_handler.button_pressed.connect(self.handle_controller_input)
-                self.controller_handler.start()
-            except:
-                pass  # Controller support optional
-        
-        self.setup_ui()
-        self.apply_theme()
-        self.restore_window_state()
-        QTimer.singleShot(50, self.initial_load)
-        
-    def setup_ui(self):
-        self.create_toolbar(); central_widget = QWidget(); self.setCentralWidget(central_widget)
-        main_layout = QVBoxLayout(central_widget); self.tabs = QTabWidget(); main_layout.addWidget(self.tabs)
-        self.library_tab = self._create_library_tab(); self.emulators_tab = self._create_emulators_tab()
-        self.tabs.addTab(self.library_tab, "Library"); self.tabs.addTab(self.emulators_tab, "Emulators")
-        self.setStatusBar(QStatusBar(self))
-        
-        # Setup keyboard shortcuts
-        self.setup_keyboard_shortcuts()
-
-    def create_toolbar(self):
-        toolbar = self.addToolBar("Main")
-        toolbar.setObjectName("MainToolBar")
-        toolbar.setMovable(False)
-        manage_folder_action = QAction(self.style().standardIcon(QStyle.StandardPixmap.SP_DirIcon), "Manage Game Folders...", self)
-        manage_folder_action.triggered.connect(self.open_library_manager); toolbar.addAction(manage_folder_action)
-        
-        # Add PC Game action
-        add_pc_game_action = QAction("💻 Add PC Game...", self)
-        add_pc_game_action.triggered.connect(self.add_pc_game_dialog); toolbar.addAction(add_pc_game_action)
-        toolbar.addSeparator()
-        
-        self.refresh_action = QAction(self.style().standardIcon(QStyle.StandardPixmap.SP_BrowserReload), "Refresh Library", self)
-        self.refresh_action.triggered.connect(self.start_full_scan); toolbar.addAction(self.refresh_action)
-        toolbar.addSeparator()
-        
-        # Collections action
-        collections_action = QAction(self.style().standardIcon(QStyle.StandardPixmap.SP_FileDialogListView), "Manage Collections...", self)
-        collections_action.triggered.connect(self.open_collections_manager); toolbar.addAction(collections_action)
-        toolbar.addSeparator()
-        
-        # Batch operations
-        self.batch_action = QAction(self.style().standardIcon(QStyle.StandardPixmap.SP_FileDialogDetailedView), "Batch Operations", self)
-        self.batch_action.setCheckable(True)
-        self.batch_action.toggled.connect(self.toggle_batch_mode)
-        self.batch_action.setEnabled(False)
-        toolbar.addAction(self.batch_action)
-        toolbar.addSeparator()
-        
-        self.theme_toggle_action = QAction(self.create_theme_icon(), "Toggle Theme", self)
-        self.theme_toggle_action.triggered.connect(self.toggle_theme); toolbar.addAction(self.theme_toggle_action)
-        toolbar.addSeparator()
-        
-        # Settings action
-        settings_action = QAction(self.style().standardIcon(QStyle.StandardPixmap.SP_FileDialogInfoView), "Settings...", self)
-        settings_action.triggered.connect(self.open_settings); toolbar.addAction(settings_action)
-        toolbar.addSeparator()
-        
-        self.toggle_details_action = QAction(self.style().standardIcon(QStyle.StandardPixmap.SP_FileDialogDetailedView), "Toggle Details Panel", self)
-        self.toggle_details_action.setCheckable(True)
-        self.toggle_details_action.toggled.connect(self.on_toggle_details_panel)
-        toolbar.addAction(self.toggle_details_action)
-
-    def _create_library_tab(self):
-        library_widget = QWidget(); layout = QHBoxLayout(library_widget)
-        self.main_splitter = QSplitter(Qt.Orientation.Horizontal)
-        self.systems_list = QListWidget()
-        self.systems_list.setItemDelegate(PlatformListDelegate(self.systems_list))
-        self.systems_list.setSpacing(2)
-        self.systems_list.setMinimumWidth(280)
-        self.systems_list.currentItemChanged.connect(self.repopulate_games_list)
-        self.main_splitter.addWidget(self.systems_list)
-        
-        right_panel = QWidget()
-        right_layout = QVBoxLayout(right_panel)
-        right_layout.setContentsMargins(0,0,0,0)
-        
-        self.games_list = QListWidget()
-        self._setup_common_list_properties()
-        right_layout.addLayout(self._create_view_options_bar())
-        right_layout.addWidget(self.games_list)
-        
-        # ++++++++++++++ THE FIX IS HERE ++++++++++++++
-        # 1. Create the details panel and assign it to the instance variable.
-        self.details_panel = self._create_details_panel()
-        # 2. Add the created panel to the layout.
-        right_layout.addWidget(self.details_panel)
-        # 3. NOW that self.details_panel exists, we can safely call a method that uses it.
-        self.update_details_panel(None)
-
-        self.main_splitter.addWidget(right_panel)
-        self.main_splitter.setSizes([250, 1030])
-        layout.addWidget(self.main_splitter)
-        return library_widget
-    def _create_view_options_bar(self):
-        layout = QHBoxLayout()
-        self.btn_list_view = QPushButton(self.create_view_switcher_icon('list'), ""); self.btn_list_view.setCheckable(True)
-        self.btn_grid_view = QPushButton(self.create_view_switcher_icon('grid'), ""); self.btn_grid_view.setCheckable(True)
-        self.btn_list_view.clicked.connect(lambda: self.set_view_mode(False)); self.btn_grid_view.clicked.connect(lambda: self.set_view_mode(True))
-        layout.addWidget(self.btn_list_view); layout.addWidget(self.btn_grid_view)
-        layout.addWidget(QLabel("Icon Size:"))
-        self.icon_size_slider = QSlider(Qt.Orientation.Horizontal)
-        self.icon_size_slider.valueChanged.connect(self.on_icon_size_changed)
-        layout.addWidget(self.icon_size_slider)
-        
-        # Platform Filter
-        layout.addWidget(QLabel("Filter:"))
-        self.platform_filter_combo = QComboBox()
-        self.platform_filter_combo.setMinimumWidth(150)
-        self.platform_filter_combo.addItem("All Platforms")
-        self.platform_filter_combo.currentTextChanged.connect(self.on_platform_filter_changed)
-        layout.addWidget(self.platform_filter_combo)
-        
-        layout.addWidget(QLabel("Sort:"))
-        self.sort_combo = QComboBox(); self.sort_combo.addItems(["Name", "File Size (Asc)", "File Size (Desc)", "Time Played", "Date Added"])
-        self.sort_combo.setCurrentText(self.config_manager.config.get("sort_order", "Name"))
-        self.sort_combo.currentTextChanged.connect(self.on_sort_order_changed)
-        layout.addWidget(self.sort_combo)
-        
-        # Enhanced search bar with clear button
-        search_container = QWidget()
-        search_layout = QHBoxLayout(search_container)
-        search_layout.setContentsMargins(0, 0, 0, 0)
-        self.search_bar = QLineEdit(); self.search_bar.setPlaceholderText("🔍 Search games...");
-        self.search_bar.textChanged.connect(self.on_search_text_changed)
-        self.search_clear_btn = QPushButton("✕")
-        self.search_clear_btn.setMaximumWidth(30)
-        self.search_clear_btn.setVisible(False)
-        self.search_clear_btn.clicked.connect(lambda: self.search_bar.clear())
-        self.search_bar.textChanged.connect(lambda text: self.search_clear_btn.setVisible(bool(text)))
-        search_layout.addWidget(self.search_bar)
-        search_layout.addWidget(self.search_clear_btn)
-        layout.addWidget(search_container)
-        return layout
-
-    def _create_details_panel(self):
-        details_box = QGroupBox("Details")
-        main_layout = QHBoxLayout(details_box)
-        self.details_cover_label = QLabel()
-        self.details_cover_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.details_cover_label.setMinimumSize(200, 200)
-        self.details_cover_label.setMaximumSize(200, 200)
-        self.details_cover_label.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
-        
-        info_layout = QFormLayout()
-        self.details_title_label = QLabel()
-        self.details_title_label.setWordWrap(True)
-        self.details_title_label.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold))
-        self.details_platform_label = QLabel()
-        self.details_size_label = QLabel()
-        self.details_playtime_label = QLabel()
-        info_layout.addRow(self.details_title_label)
-        info_layout.addRow(QLabel())
-        info_layout.addRow("<b>Platform:</b>", self.details_platform_label)
-        info_layout.addRow("<b>File Size:</b>", self.details_size_label)
-        info_layout.addRow("<b>Time Played:</b>", self.details_playtime_label)
-
-        main_layout.addWidget(self.details_cover_label)
-        main_layout.addLayout(info_layout)
-        
-        self.details_placeholder_label = QLabel("Select a game to see details here.")
-        self.details_placeholder_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.details_placeholder_label.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
-        
-        details_widget_stack = QWidget()
-        stack_layout = QVBoxLayout(details_widget_stack)
-        stack_layout.setContentsMargins(0,0,0,0)
-        stack_layout.addWidget(details_box)
-        stack_layout.addWidget(self.details_placeholder_label)
-        
-        # ++++++++++++++ THE FIX IS HERE ++++++++++++++
-        # The problematic call is REMOVED from this method.
-        # self.update_details_panel(None) 
-        
-        return details_widget_stack
-
-    def _create_emulators_tab(self):
-        emulators_widget = QWidget(); layout = QVBoxLayout(emulators_widget)
-        layout.setContentsMargins(12, 12, 12, 12)
-        layout.setSpacing(12)
-        
-        # Header section with title and actions
-        header_layout = QHBoxLayout()
-        
-        # Title with icon
-        title_label = QLabel("🎮 Emulator Management")
-        title_label.setFont(QFont("Segoe UI", 16, QFont.Weight.Bold))
-        title_label.setStyleSheet(f"color: {Constants.C_HIGHLIGHT_CYAN};")
-        header_layout.addWidget(title_label)
-        
-        header_layout.addStretch()
-        
-        # Quick action buttons in header
-        btn_scan_emus = QPushButton("📂 Scan Folder")
-        btn_scan_emus.clicked.connect(self.scan_for_emulators)
-        btn_scan_emus.setMinimumHeight(36)
-        header_layout.addWidget(btn_scan_emus)
-        
-        layout.addLayout(header_layout)
-        
-        # Search bar with modern styling
-        search_container = QWidget()
-        search_layout = QHBoxLayout(search_container)
-        search_layout.setContentsMargins(0, 0, 0, 0)
-        
-        search_label = QLabel("🔍")
-        search_label.setFont(QFont("Segoe UI Emoji", 14))
-        search_layout.addWidget(search_label)
-        
-        self.emu_search_bar = QLineEdit()
-        self.emu_search_bar.setPlaceholderText("Search emulators...")
-        self.emu_search_bar.textChanged.connect(self.update_emulator_list)
-        self.emu_search_bar.setMinimumHeight(36)
-        search_layout.addWidget(self.emu_search_bar)
-        
-        self.emu_search_clear_btn = QPushButton("✕")
-        self.emu_search_clear_btn.setMaximumWidth(36)
-        self.emu_search_clear_btn.setMinimumHeight(36)
-        self.emu_search_clear_btn.setVisible(False)
-        self.emu_search_clear_btn.clicked.connect(lambda: self.emu_search_bar.clear())
-        self.emu_search_bar.textChanged.connect(lambda text: self.emu_search_clear_btn.setVisible(bool(text)))
-        search_layout.addWidget(self.emu_search_clear_btn)
-        
-        layout.addWidget(search_container)
-        
-        # Emulator tree with custom delegate
-        self.emulators_tree = QTreeWidget()
-        self.emulators_tree.setHeaderHidden(True)
-        self.emulators_tree.setRootIsDecorated(True)
-        self.emulators_tree.setIndentation(0)  # Remove default indentation for cleaner look
-        self.emulators_tree.setItemDelegate(EmulatorTreeDelegate(self.emulators_tree))
-        self.emulators_tree.setUniformRowHeights(False)
-        self.emulators_tree.itemDoubleClicked.connect(self.launch_selected_emulator)
-        self.emulators_tree.currentItemChanged.connect(self.on_emulator_selection_changed)
-        layout.addWidget(self.emulators_tree)
-        
-        # Action buttons panel with modern styling
-        button_panel = QWidget()
-        button_panel.setStyleSheet(f"""
-            QWidget {{
-                background-color: {Constants.C_BACKGROUND_LIGHT};
-                border-radius: 8px;
-                padding: 8px;
-            }}
-        """)
-        button_layout = QHBoxLayout(button_panel)
-        button_layout.setSpacing(8)
-        
-        self.btn_add_emu = QPushButton("➕ Add")
-        self.btn_add_emu.setMinimumHeight(40)
-        self.btn_edit_emu = QPushButton("✏️ Edit")
-        self.btn_edit_emu.setMinimumHeight(40)
-        self.btn_remove_emu = QPushButton("🗑️ Remove")
-        self.btn_remove_emu.setMinimumHeight(40)
-        self.btn_start_emu = QPushButton("▶️ Launch")
-        self.btn_start_emu.setMinimumHeight(40)
-        
-        self.btn_add_emu.clicked.connect(self.add_emulator)
-        self.btn_edit_emu.clicked.connect(self.edit_emulator)
-        self.btn_remove_emu.clicked.connect(self.remove_emulator)
-        self.btn_start_emu.clicked.connect(self.launch_selected_emulator)
-        
-        button_layout.addWidget(self.btn_add_emu)
-        button_layout.addWidget(self.btn_edit_emu)
-        button_layout.addWidget(self.btn_remove_emu)
-        button_layout.addStretch()
-        button_layout.addWidget(self.btn_start_emu)
-        
-        layout.addWidget(button_panel)
-        
-        self.on_emulator_selection_changed(None)
-        return emulators_widget
-
-    def apply_theme(self):
-        colors = self.themes[self.current_theme_name]
-        self.setStyleSheet(f"""
-            QGroupBox {{ 
-                font-weight: bold; 
-                border: 2px solid {colors['C_BORDER']}; 
-                border-radius: 8px; 
-                margin-top: 12px;
-                background-color: {colors['C_BACKGROUND_WIDGET']};
-                padding-top: 15px;
-            }}
-            QGroupBox::title {{
-                subcontrol-origin: margin;
-                subcontrol-position: top center;
-                padding: 0 8px;
-                color: {colors['C_HIGHLIGHT_CYAN']};
-            }}
-            QMainWindow, QWidget, QDialog {{ background-color: {colors['C_BACKGROUND_DARK']}; color: {colors['C_TEXT_PRIMARY']}; border: none; }}
-            QToolBar {{ background-color: {colors['C_BACKGROUND_LIGHT']}; padding: 6px; border-bottom: 2px solid {colors['C_BORDER']}; }}
-            QTabWidget::pane {{ border-top: 2px solid {colors['C_BORDER']}; background-color: {colors['C_BACKGROUND_DARK']}; }}
-            QTabBar::tab {{ 
-                background: {colors['C_BACKGROUND_WIDGET']}; color: {colors['C_TEXT_SECONDARY']}; 
-                padding: 12px 20px; border: 1px solid {colors['C_BORDER']}; 
-                border-bottom: none; border-top-left-radius: 6px; border-top-right-radius: 6px;
-                margin-right: 2px;
-            }}
-            QTabBar::tab:selected, QTabBar::tab:hover {{ 
-                background: {colors['C_BACKGROUND_LIGHT']}; color: {colors['C_HIGHLIGHT_CYAN']}; 
-                border-bottom: 3px solid {colors['C_HIGHLIGHT_CYAN']};
-            }}
-            QSplitter::handle {{ background-color: {colors['C_BORDER']}; }}
-            QListWidget, QTreeWidget {{ 
-                background-color: {colors['C_BACKGROUND_WIDGET']}; 
-                border: 1px solid {colors['C_BORDER']}; 
-                border-radius: 4px;
-                padding: 8px; 
-            }}
-            QListWidget::item:hover, QTreeWidget::item:hover {{ background-color: {colors['C_BACKGROUND_LIGHT']}; }}
-            QListWidget::item:selected, QTreeWidget::item:selected {{ 
-                background-color: {colors['C_HIGHLIGHT_BLUE']}; 
-                color: {colors['C_TEXT_PRIMARY']};
-            }}
-            QListWidget::item:disabled {{ color: #888888; }}
-            QHeaderView::section {{ background-color: {colors['C_BACKGROUND_LIGHT']}; padding: 6px; border: 1px solid {colors['C_BORDER']}; }}
-            QPushButton {{ 
-                background-color: {colors['C_BACKGROUND_LIGHT']}; 
-                border: 2px solid {colors['C_BORDER']}; 
-                padding: 8px 16px; 
-                min-width: 0; 
-                border-radius: 6px;
-                font-weight: 500;
-            }}
-            QPushButton:hover {{ 
-                background-color: {colors['C_HIGHLIGHT_BLUE']}; 
-                border-color: {colors['C_HIGHLIGHT_CYAN']}; 
-            }} 
-            QPushButton:pressed {{ 
-                background-color: {colors['C_HIGHLIGHT_CYAN']}; 
-            }}
-            QPushButton:disabled {{ 
-                background-color: {colors['C_BACKGROUND_DARK']}; 
-                border-color: {colors['C_BACKGROUND_LIGHT']}; 
-                color: {colors['C_BORDER']}; 
-            }}
-            QPushButton:checkable:checked {{ 
-                background-color: {colors['C_HIGHLIGHT_BLUE']}; 
-                border-color: {colors['C_HIGHLIGHT_CYAN']}; 
-                color: white;
-            }}
-            QStatusBar {{ color: {colors['C_TEXT_PRIMARY']}; background-color: {colors['C_BACKGROUND_LIGHT']}; padding: 4px; }}
-            QLineEdit, QComboBox {{ 
-                border: 2px solid {colors['C_BORDER']}; 
-                padding: 8px; 
-                background-color: {colors['C_BACKGROUND_WIDGET']}; 
-                min-width: 120px; 
-                border-radius: 6px;
-            }}
-            QLineEdit:focus, QComboBox:focus {{
-                border-color: {colors['C_HIGHLIGHT_CYAN']};
-            }}
-            QComboBox::drop-down {{ border: none; padding-right: 5px; }}
-            QComboBox QAbstractItemView {{ 
-                border: 2px solid {colors['C_BORDER']}; 
-                background-color: {colors['C_BACKGROUND_LIGHT']}; 
-                selection-background-color: {colors['C_HIGHLIGHT_BLUE']}; 
-            }}
-            QSlider::groove:horizontal {{ 
-                border: 1px solid {colors['C_BORDER']}; height: 6px; 
-                background: {colors['C_BACKGROUND_LIGHT']}; margin: 2px 0; border-radius: 3px; 
-            }}
-            QSlider::handle:horizontal {{ 
-                background: {colors['C_HIGHLIGHT_CYAN']}; 
-                border: 2px solid {colors['C_HIGHLIGHT_BLUE']}; 
-                width: 18px; margin: -6px 0; border-radius: 9px; 
-            }}
-            QSlider::handle:horizontal:hover {{
-                background: {colors['C_HIGHLIGHT_BLUE']};
-            }}
-            QToolTip {{ 
-                background-color: {colors['C_BACKGROUND_LIGHT']}; 
-                color: {colors['C_TEXT_PRIMARY']}; 
-                border: 2px solid {colors['C_HIGHLIGHT_CYAN']}; 
-                padding: 6px; 
-                border-radius: 4px;
-            }}
-            QMenu {{ 
-                background-color: {colors['C_BACKGROUND_LIGHT']}; 
-                border: 2px solid {colors['C_BORDER']}; 
-                padding: 6px; 
-                border-radius: 6px;
-            }}
-            QMenu::item {{ padding: 8px 30px 8px 30px; border-radius: 4px; }}
-            QMenu::item:selected {{ 
-                background-color: {colors['C_HIGHLIGHT_BLUE']}; 
-                color: {colors['C_TEXT_PRIMARY']}; 
-            }}
-            QMenu::separator {{ height: 2px; background: {colors['C_BORDER']}; margin: 6px 10px; }}
-            QLabel {{ color: {colors['C_TEXT_PRIMARY']}; }}
-        """); self.theme_toggle_action.setIcon(self.create_theme_icon())
-    
-    def toggle_theme(self):
-        self.current_theme_name = "Modern Light" if self.current_theme_name == "Modern Dark" else "Modern Dark"
-        self.apply_theme()
-    def create_theme_icon(self):
-        pixmap = QPixmap(24, 24); pixmap.fill(Qt.GlobalColor.transparent)
-        painter = QPainter(pixmap); painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        colors = self.themes[self.current_theme_name]
-        painter.setBrush(QColor(colors['C_TEXT_PRIMARY'])); painter.setPen(Qt.PenStyle.NoPen)
-        if self.current_theme_name == "Modern Dark":
-            painter.drawEllipse(6, 6, 12, 12)
-        else:
-            path = QPainterPath(); path.addEllipse(4, 4, 16, 16); path.addEllipse(8, 4, 16, 16); path.setFillRule(Qt.FillRule.OddEvenFill); painter.drawPath(path)
-        painter.end(); return QIcon(pixmap)
-        
-    def create_view_switcher_icon(self, mode):
-        pixmap = QPixmap(24, 24); pixmap.fill(Qt.GlobalColor.transparent)
-        painter = QPainter(pixmap); painter.setRenderHint(QPainter.RenderHint.Antialiasing); painter.setPen(QPen(QColor(self.themes[self.current_theme_name]['C_TEXT_PRIMARY']), 2))
-        if mode == 'list':
-            for y in [6, 12, 18]: painter.drawLine(3, y, 21, y)
-        elif mode == 'grid':
-            painter.drawRect(4, 4, 7, 7); painter.drawRect(13, 4, 7, 7); painter.drawRect(4, 13, 7, 7); painter.drawRect(13, 13, 7, 7)
-        painter.end(); return QIcon(pixmap)
-
-    def set_view_mode(self, is_grid):
-        self.is_grid_mode = is_grid; self._apply_view_mode_settings()
-    def _apply_view_mode_settings(self):
-        self.games_list.clear(); self.btn_grid_view.setChecked(self.is_grid_mode); self.btn_list_view.setChecked(not self.is_grid_mode)
-        self.icon_size_slider.blockSignals(True)
-        if self.is_grid_mode:
-            self.games_list.setViewMode(QListWidget.ViewMode.IconMode); self.games_list.setFlow(QListWidget.Flow.LeftToRight); self.games_list.setWrapping(True)
-            self.games_list.setResizeMode(QListWidget.ResizeMode.Adjust); self.games_list.setSpacing(15)
-            self.games_list.setIconSize(QSize(self.current_grid_icon_size, int(self.current_grid_icon_size * 1.33))); self.games_list.setItemDelegate(self.grid_delegate)
-            self.icon_size_slider.setRange(Constants.MIN_GRID_ICON_SIZE, Constants.MAX_GRID_ICON_SIZE); self.icon_size_slider.setValue(self.current_grid_icon_size)
-        else:
-            self.games_list.setViewMode(QListWidget.ViewMode.ListMode); self.games_list.setFlow(QListWidget.Flow.TopToBottom); self.games_list.setWrapping(False)
-            self.games_list.setResizeMode(QListWidget.ResizeMode.Adjust); self.games_list.setSpacing(0)
-            self.games_list.setIconSize(QSize(self.current_list_icon_size, self.current_list_icon_size)); self.games_list.setItemDelegate(self.list_delegate)
-            self.icon_size_slider.setRange(Constants.MIN_LIST_ICON_SIZE, Constants.MAX_LIST_ICON_SIZE); self.icon_size_slider.setValue(self.current_list_icon_size)
-        self.icon_size_slider.blockSignals(False); self.repopulate_games_list()
-    def on_icon_size_changed(self, value):
-        if self.is_grid_mode:
-            self.current_grid_icon_size = value; self.games_list.setIconSize(QSize(value, int(value * 1.33)))
-        else:
-            self.current_list_icon_size = value; self.games_list.setIconSize(QSize(value, value))
-        self.games_list.doItemsLayout()
-
-    def on_search_text_changed(self):
-        self.search_debounce_timer.start()
-
-    def on_platform_filter_changed(self, filter_text):
-        self.config_manager.config['selected_platform_filter'] = filter_text
-        self.repopulate_games_list()
-
-    def on_sort_order_changed(self, sort_text):
-        self.config_manager.config['sort_order'] = sort_text
-        self.repopulate_games_list()
-
-    def repopulate_games_list(self):
-        current_item_data = self.games_list.currentItem().data(Qt.ItemDataRole.UserRole) if self.games_list.currentItem() else None
-        self.games_list.clear(); current_system = self.systems_list.currentItem()
-        if not current_system: return
-        system_text = current_system.text()
-        # Extract actual system name (remove count if present)
-        system_name = system_text.split(' (')[0] if ' (' in system_text else system_text
-        
-        # Handle Statistics view
-        if system_name == Constants.STATISTICS_CATEGORY:
-            self.show_statistics_view()
-            return
-        
-        if system_name == Constants.ALL_GAMES_CATEGORY: games = list(self.backend.all_games_map.values())
-        elif system_name == Constants.FAVORITES_CATEGORY: games = self.backend.get_favorite_games()
-        elif system_name == Constants.RECENTS_CATEGORY: games = self.backend.get_recently_played_games()
-        else: games = self.backend.games_by_platform.get(system_name, [])
-        
-        # Apply platform filter
-        platform_filter = self.platform_filter_combo.currentText()
-        if platform_filter != "All Platforms":
-            games = [g for g in games if g['platform'] == platform_filter]
-        
-        sort_key = self.sort_combo.currentText()
-        if sort_key == "Name": games.sort(key=lambda g: g['title'].lower())
-        elif sort_key == "File Size (Asc)": games.sort(key=lambda g: g.get('size', 0))
-        elif sort_key == "Time Played": games.sort(key=lambda g: g.get('playtime', 0), reverse=True)
-        elif sort_key == "Date Added": games.sort(key=lambda g: g.get('date_added', 0), reverse=True)
-        else: games.sort(key=lambda g: g.get('size', 0), reverse=True)
-        search_text = self.search_bar.text().lower()
-        if search_text: games = [g for g in games if search_text in g['title'].lower()]
-        
-        item_to_reselect = None
-        for game_data in games: 
-            item = self._add_game_item_to_view(game_data)
-            if current_item_data and game_data['hash'] == current_item_data['hash']:
-                item_to_reselect = item
-        
-        # Update status bar with count
-        self.statusBar().showMessage(f"Showing {self.games_list.count()} game(s)", 3000)
-        
-        if item_to_reselect:
-            self.games_list.setCurrentItem(item_to_reselect)
-        elif self.games_list.count() > 0:
-            self.games_list.setCurrentRow(0)
-        else:
-            self.update_details_panel(None)
-        
-    def _add_game_item_to_view(self, game_data):
-        item = QListWidgetItem()
-        item.setData(Qt.ItemDataRole.UserRole, game_data)
-        item.setToolTip(game_data['title'])
-        is_path_valid = os.path.exists(game_data['path'])
-        if is_path_valid:
-            item.setData(Qt.ItemDataRole.DisplayRole, game_data['title'])
-        else:
-            item.setData(Qt.ItemDataRole.DisplayRole, f"[MISSING] {game_data['title']}")
-            item.setForeground(QColor("red"))
-            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEnabled)
-        cover_path = self.get_cover_path_for_game(game_data)
-        icon = QIcon(str(cover_path)) if cover_path and cover_path.is_file() else self.create_placeholder_icon(game_data['title'])
-        item.setData(Qt.ItemDataRole.DecorationRole, icon); self.games_list.addItem(item)
-        return item
-
-    def create_placeholder_icon(self, text):
-        size = self.games_list.iconSize()
-        if not size.isValid() or size.width() <= 0 or size.height() <= 0: return QIcon()
-        pixmap = QPixmap(size); pixmap.fill(Qt.GlobalColor.transparent)
-        painter = QPainter(pixmap); painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # Create gradient background
-        from PyQt6.QtGui import QLinearGradient
-        gradient = QLinearGradient(0, 0, 0, size.height())
-        colors = self.themes[self.current_theme_name]
-        gradient.setColorAt(0, QColor(colors['C_HIGHLIGHT_BLUE']))
-        gradient.setColorAt(1, QColor(colors['C_ACCENT']))
-        painter.setBrush(QBrush(gradient))
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.drawRoundedRect(pixmap.rect().adjusted(4, 4, -4, -4), 12, 12)
-        
-        # Add border
-        pen = QPen(QColor(colors['C_BORDER']))
-        pen.setWidth(2)
-        painter.setPen(pen)
-        painter.setBrush(Qt.BrushStyle.NoBrush)
-        painter.drawRoundedRect(pixmap.rect().adjusted(5, 5, -5, -5), 12, 12)
-        
-        # Draw text
-        font_size = 10 if size.width() < 100 else 16; font = QFont("Segoe UI", font_size, QFont.Weight.Bold)
-        painter.setFont(font); painter.setPen(QColor("#FFFFFF")); text_rect = pixmap.rect().adjusted(15, 15, -15, -15)
-        painter.drawText(text_rect, Qt.AlignmentFlag.AlignCenter | Qt.TextFlag.TextWordWrap, text[:50]); painter.end()
-        return QIcon(pixmap)
-
-    def initial_load(self):
-        # Show splash screen
-        splash = SplashScreen()
-        splash.show()
-        splash.update_status("Loading configuration...")
-        QApplication.processEvents()
-        
-        import time
-        time.sleep(0.5)  # Brief pause for effect
-        
-        splash.update_status("Loading library from cache...")
-        self.statusBar().showMessage("Loading library from cache...")
-        if self.backend.load_from_cache():
-            splash.update_status("Building interface...")
-            self.update_system_list()
-            self.update_emulator_list()
-            splash.update_status("Ready!")
-            QApplication.processEvents()
-            time.sleep(0.3)
-            splash.close()
-            self.statusBar().showMessage("Library loaded from cache. Ready.", 5000)
-        else:
-            splash.update_status("No cache found. Scanning library...")
-            QApplication.processEvents()
-            splash.close()
-            self.statusBar().showMessage("No cache found. Performing initial library scan...")
-            self.start_full_scan()
-
-    def start_full_scan(self):
-        if self.scanner_thread and self.scanner_thread.isRunning():
-            return
-        self.backend.clear_cache()
-        self.refresh_action.setEnabled(False)
-        self.scanner_thread = GameScanner(self.backend)
-        self.scanner_thread.progress_update.connect(self.statusBar().showMessage)
-        self.scanner_thread.scan_finished.connect(self.on_scan_finished)
-        self.scanner_thread.finished.connect(lambda: self.refresh_action.setEnabled(True))
-        self.scanner_thread.start()
-
-    def on_scan_finished(self, games_by_platform, all_games_map):
-        self.backend.games_by_platform = games_by_platform
-        self.backend.all_games_map = all_games_map
-        self.backend.save_to_cache()
-        self.update_system_list()
-        self.update_emulator_list()
-        self.statusBar().showMessage("Library scan complete. Ready.", 5000)
-        
-    def update_system_list(self):
-        current_text = self.systems_list.currentItem().text() if self.systems_list.currentItem() else None
-        self.systems_list.clear()
-        
-        # Special categories
-        all_games_item = QListWidgetItem(Constants.ALL_GAMES_CATEGORY)
-        all_games_item.setData(Qt.ItemDataRole.UserRole, {'name': Constants.ALL_GAMES_CATEGORY})
-        self.systems_list.addItem(all_games_item)
-        
-        if self.backend.get_favorite_games():
-            fav_item = QListWidgetItem(Constants.FAVORITES_CATEGORY)
-            fav_item.setData(Qt.ItemDataRole.UserRole, {'name': Constants.FAVORITES_CATEGORY})
-            self.systems_list.addItem(fav_item)
-        
-        if self.backend.get_recently_played_games():
-            recent_item = QListWidgetItem(Constants.RECENTS_CATEGORY)
-            recent_item.setData(Qt.ItemDataRole.UserRole, {'name': Constants.RECENTS_CATEGORY})
-            self.systems_list.addItem(recent_item)
-        
-        # Add Statistics category
-        stats_item = QListWidgetItem(Constants.STATISTICS_CATEGORY)
-        stats_item.setData(Qt.ItemDataRole.UserRole, {'name': Constants.STATISTICS_CATEGORY})
-        self.systems_list.addItem(stats_item)
-        
-        if self.backend.games_by_platform:
-            # Add separator
-            sep = QListWidgetItem("")
-            sep.setFlags(Qt.ItemFlag.NoItemFlags)
-            sep.setData(Qt.ItemDataRole.UserRole, {'is_separator': True, 'text': 'PLATFORMS'})
-            self.systems_list.addItem(sep)
-        
-        # Update platform filter dropdown
-        self.platform_filter_combo.blockSignals(True)
-        current_filter = self.platform_filter_combo.currentText()
-        self.platform_filter_combo.clear()
-        self.platform_filter_combo.addItem("All Platforms")
-        
-        # Group platforms by manufacturer
-        platform_groups = {
-            'PlayStation': [],
-            'Xbox': [],
-            'Nintendo': [],
-            'Sega': [],
-            'Other': []
-        }
-        
-        for system in sorted(self.backend.games_by_platform.keys()):
-            game_count = len(self.backend.games_by_platform[system])
-            
-            # Categorize
-            if 'PlayStation' in system or 'PSP' in system:
-                platform_groups['PlayStation'].append((system, game_count))
-            elif 'Xbox' in system:
-                platform_groups['Xbox'].append((system, game_count))
-            elif 'Nintendo' in system or 'Wii' in system or 'GameCube' in system or 'Game Boy' in system or 'Switch' in system:
-                platform_groups['Nintendo'].append((system, game_count))
-            elif 'Sega' in system or 'Genesis' in system or 'Dreamcast' in system:
-                platform_groups['Sega'].append((system, game_count))
-            else:
-                platform_groups['Other'].append((system, game_count))
-            
-            self.platform_filter_combo.addItem(system)
-        
-        # Add platforms grouped by manufacturer
-        for group_name in ['PlayStation', 'Xbox', 'Nintendo', 'Sega', 'Other']:
-            if platform_groups[group_name]:
-                # Add group separator
-                if group_name != 'PlayStation':  # Skip separator for first group
-                    sep = QListWidgetItem("")
-                    sep.setFlags(Qt.ItemFlag.NoItemFlags)
-                    sep.setData(Qt.ItemDataRole.UserRole, {'is_separator': True, 'text': ''})
-                    sep.setSizeHint(QSize(0, 10))
-                    self.systems_list.addItem(sep)
-                
-                for system, count in sorted(platform_groups[group_name]):
-                    item = QListWidgetItem(f"{system} ({count})")
-                    item.setData(Qt.ItemDataRole.UserRole, {'name': system, 'count': count})
-                    self.systems_list.addItem(item)
-        
-        # Restore filter selection
-        if current_filter:
-            idx = self.platform_filter_combo.findText(current_filter)
-            if idx >= 0:
-                self.platform_filter_combo.setCurrentIndex(idx)
-        self.platform_filter_combo.blockSignals(False)
-        
-        items = self.systems_list.findItems(current_text, Qt.MatchFlag.MatchStartsWith) if current_text else []
-        if items:
-            self.systems_list.setCurrentItem(items[0])
-        elif self.systems_list.count() > 0:
-            self.systems_list.setCurrentRow(0)
-    
-    def update_emulator_list(self):
-        search_text = self.emu_search_bar.text().lower()
-        self.emulators_tree.clear()
-        
-        emulators_by_system = {}
-        for name, data in self.config_manager.config["emulators"].items():
-            for system in data.get("systems", []):
-                if system not in emulators_by_system:
-                    emulators_by_system[system] = []
-                emulators_by_system[system].append({"name": name, "data": data})
-
-        # Sort systems for better organization
-        for system_name in sorted(emulators_by_system.keys()):
-            child_items = []
-            for emu in emulators_by_system[system_name]:
-                emu_name_lower = emu["name"].lower()
-                if search_text and search_text not in emu_name_lower:
-                    continue
-                
-                child = QTreeWidgetItem([emu["name"]])
-                child.setData(0, Qt.ItemDataRole.UserRole, emu["name"])
-                child_items.append(child)
-
-            if child_items:
-                parent = QTreeWidgetItem(self.emulators_tree, [system_name])
-                parent.addChildren(child_items)
-                parent.setExpanded(True)  # Auto-expand for better visibility
-
-        # Show message if no emulators found
-        if self.emulators_tree.topLevelItemCount() == 0:
-            placeholder = QTreeWidgetItem(self.emulators_tree, ["No emulators configured"])
-            placeholder.setFlags(Qt.ItemFlag.NoItemFlags)
-            font = QFont("Segoe UI", 10, QFont.Weight.Normal)
-            font.setItalic(True)
-            placeholder.setFont(0, font)
-    
-    def _setup_common_list_properties(self):
-        self.games_list.itemDoubleClicked.connect(self.launch_selected_game)
-        self.games_list.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
-        self.games_list.customContextMenuRequested.connect(self.show_game_context_menu)
-        self.games_list.currentItemChanged.connect(self.update_details_panel)
-        self.games_list.setSelectionMode(QListWidget.SelectionMode.ExtendedSelection)  # Enable multi-select
-    
-    def setup_keyboard_shortcuts(self):
-        """Setup keyboard shortcuts for common actions"""
-        from PyQt6.QtGui import QShortcut, QKeySequence
-        
-        # F5 - Refresh
-        refresh_shortcut = QShortcut(QKeySequence("F5"), self)
-        refresh_shortcut.activated.connect(self.start_full_scan)
-        
-        # Ctrl+F - Focus search
-        search_shortcut = QShortcut(QKeySequence("Ctrl+F"), self)
-        search_shortcut.activated.connect(lambda: self.search_bar.setFocus())
-        
-        # Ctrl+Tab - Toggle view mode
-        view_shortcut = QShortcut(QKeySequence("Ctrl+Tab"), self)
-        view_shortcut.activated.connect(lambda: self.set_view_mode(not self.is_grid_mode))
-        
-        # Enter - Launch selected game
-        launch_shortcut = QShortcut(QKeySequence("Return"), self.games_list)
-        launch_shortcut.activated.connect(lambda: self.launch_selected_game(self.games_list.currentItem()) if self.games_list.currentItem() else None)
-        
-        # Delete - Delete selected game(s)
-        delete_shortcut = QShortcut(QKeySequence("Delete"), self.games_list)
-        delete_shortcut.activated.connect(self.delete_selected_games)
-        
-        # Ctrl+A - Select all
-        select_all_shortcut = QShortcut(QKeySequence("Ctrl+A"), self.games_list)
-        select_all_shortcut.activated.connect(self.games_list.selectAll)
-        
-        # Ctrl+I - Show info
-        info_shortcut = QShortcut(QKeySequence("Ctrl+I"), self.games_list)
-        info_shortcut.activated.connect(lambda: self.show_enhanced_game_info(self.games_list.currentItem()) if self.games_list.currentItem() else None)
-        
-        # Ctrl+B - Toggle batch mode
-        batch_shortcut = QShortcut(QKeySequence("Ctrl+B"), self)
-        batch_shortcut.activated.connect(lambda: self.batch_action.toggle())
-        
-        self.statusBar().showMessage("💡 Tip: Press F5 to refresh, Ctrl+F to search, Ctrl+Tab to toggle view", 5000)
-    
-    def handle_controller_input(self, button):
-        """Handle controller button presses"""
-        if button == 'Up':
-            self.games_list.setFocus()
-            current = self.games_list.currentRow()
-            if current > 0:
-                self.games_list.setCurrentRow(current - 1)
-        elif button == 'Down':
-            self.games_list.setFocus()
-            current = self.games_list.currentRow()
-            if current < self.games_list.count() - 1:
-                self.games_list.setCurrentRow(current + 1)
-        elif button == 'Left':
-            self.systems_list.setFocus()
-            current = self.systems_list.currentRow()
-            if current > 0:
-                self.systems_list.setCurrentRow(current - 1)
-        elif button == 'Right':
-            self.games_list.setFocus()
-        elif button == 'A':  # Launch game
-            if self.games_list.currentItem():
-                self.launch_selected_game(self.games_list.currentItem())
-        elif button == 'B':  # Back/Toggle favorite
-            if self.games_list.currentItem():
-                game_data = self.games_list.currentItem().data(Qt.ItemDataRole.UserRole)
-                if game_data:
-                    self.toggle_favorite(game_data['hash'])
-        elif button == 'X':  # Show info
-            if self.games_list.currentItem():
-                self.show_enhanced_game_info(self.games_list.currentItem())
-        elif button == 'Y':  # Search
-            self.search_bar.setFocus()
-        elif button == 'Start':  # Refresh
-            self.start_full_scan()
-        elif button == 'LB':  # Previous tab
-            current = self.tabs.currentIndex()
-            self.tabs.setCurrentIndex(max(0, current - 1))
-        elif button == 'RB':  # Next tab
-            current = self.tabs.currentIndex()
-            self.tabs.setCurrentIndex(min(self.tabs.count() - 1, current + 1))
-
-    def update_details_panel(self, current_item):
-        details_box = self.details_panel.findChild(QGroupBox)
-        if not details_box: return
-        
-        if not current_item or not current_item.data(Qt.ItemDataRole.UserRole):
-            details_box.setVisible(False)
-            self.details_placeholder_label.setVisible(True)
-            return
-
-        details_box.setVisible(True)
-        self.details_placeholder_label.setVisible(False)
-        game_data = current_item.data(Qt.ItemDataRole.UserRole)
-        
-        self.details_title_label.setText(game_data.get('title', 'N/A'))
-        self.details_platform_label.setText(game_data.get('platform', 'N/A'))
-        self.details_size_label.setText(format_size(game_data.get('size', 0)))
-        self.details_playtime_label.setText(format_playtime(game_data.get('playtime', 0)))
-
-        cover_path = self.get_cover_path_for_game(game_data)
-        if cover_path:
-            pixmap = QPixmap(str(cover_path))
-            self.details_cover_label.setPixmap(pixmap.scaled(200, 200, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
-        else:
-            self.details_cover_label.setPixmap(self.create_placeholder_icon(game_data['title']).pixmap(200,200))
-
-    def get_cover_path_for_game(self, game_data):
-        game_hash = game_data.get("hash")
-        if not game_hash:
-            return None
-        
-        # Check in-memory cache first for performance
-        if game_hash in self.backend.image_cache:
-            cached_path = self.backend.image_cache[game_hash]
-            if cached_path and Path(cached_path).is_file():
-                return cached_path
-        
-        custom_cover_name = self.config_manager.config["custom_covers"].get(game_hash)
-        if custom_cover_name:
-            cached_cover = self.config_manager.cache_dir / custom_cover_name
-            if cached_cover.is_file():
-                self.backend.image_cache[game_hash] = cached_cover  # Cache the path
-                return cached_cover
-            main_cover = self.config_manager.covers_dir / custom_cover_name
-            if main_cover.is_file():
-                self.backend.image_cache[game_hash] = main_cover  # Cache the path
-                return main_cover
-        
-        return None
-
-    def on_toggle_details_panel(self, checked):
-        self.details_panel.setVisible(checked)
-        self.config_manager.config['details_panel_visible'] = checked
-
-    def open_library_manager(self):
-        dialog = LibraryManagerDialog(self.config_manager, self);
-        if dialog.exec():
-            self.start_full_scan()
-
-    # ++++++++++++++ THE FIX IS HERE (AGAIN) ++++++++++++++
-    def add_emulator(self):
-        exe_path, _ = QFileDialog.getOpenFileName(self, "Select Emulator Executable", "", "Executables (*.exe);;All Files (*)")
-        if not exe_path:
-            return
-
-        detected = self.backend.detect_emulator_from_exe(exe_path)
-        
-        if detected:
-            # Successfully auto-detected
-            if detected['name'] not in self.config_manager.config["emulators"]:
-                self.config_manager.config["emulators"][detected['name']] = detected['data']
-                self.config_manager.save_config()
-                self.update_emulator_list()
-                QMessageBox.information(self, "Emulator Added", f"Successfully auto-detected and added '{detected['name']}'.")
-            else:
-                QMessageBox.warning(self, "Emulator Exists", f"An emulator named '{detected['name']}' is already configured.")
-        else:
-            # Detection failed, fall back to manual entry
-            QMessageBox.information(self, "Unknown Emulator", "Could not identify this emulator. Please enter its details manually.")
-            dialog = EmulatorEditDialog(emu_data={"path": exe_path}, parent=self)
-            if dialog.exec():
-                result = dialog.get_data()
-                if result["name"] and result["data"]["path"]:
-                    if result["name"] in self.config_manager.config["emulators"]:
-                        QMessageBox.warning(self, "Emulator Exists", f"An emulator named '{result['name']}' is already configured.")
-                    else:
-                        self.config_manager.config["emulators"][result["name"]] = result["data"]
-                        self.config_manager.save_config()
-                        self.update_emulator_list()
-
-    def scan_for_emulators(self):
-        scan_path = QFileDialog.getExistingDirectory(self, "Select Folder to Scan for Emulators")
-        if not scan_path: return
-        found_count = 0
-        for root, _, files in os.walk(scan_path):
-            for file in files:
-                full_path = os.path.join(root, file)
-                detected = self.backend.detect_emulator_from_exe(full_path)
-                if detected and detected['name'] not in self.config_manager.config['emulators']:
-                    self.config_manager.config['emulators'][detected['name']] = detected['data']; found_count += 1
-        if found_count > 0:
-            self.config_manager.save_config(); self.update_emulator_list()
-            QMessageBox.information(self, "Scan Complete", f"Found and added {found_count} new emulator(s).")
-        else: QMessageBox.information(self, "Scan Complete", "No new emulators found in the selected folder.")
-        
-    def on_emulator_selection_changed(self, item):
-        is_child = item is not None and item.parent() is not None
-        self.btn_edit_emu.setEnabled(is_child)
-        self.btn_remove_emu.setEnabled(is_child)
-        self.btn_start_emu.setEnabled(is_child)
-
-    def edit_emulator(self):
-        item = self.emulators_tree.currentItem()
-        if not item or not item.parent(): return
-        name = item.data(0, Qt.ItemDataRole.UserRole); dialog = EmulatorEditDialog(name, self.config_manager.config["emulators"][name], self)
-        if dialog.exec():
-            result = dialog.get_data()
-            if result["name"] and result["data"]["path"]:
-                if name != result["name"]: del self.config_manager.config["emulators"][name]
-                self.config_manager.config["emulators"][result["name"]] = result["data"]; self.config_manager.save_config(); self.update_emulator_list()
-    def remove_emulator(self):
-        item = self.emulators_tree.currentItem()
-        if not item or not item.parent(): return
-        name = item.data(0, Qt.ItemDataRole.UserRole)
-        if QMessageBox.question(self, "Confirm", f"Remove '{name}'?") == QMessageBox.StandardButton.Yes:
-            del self.config_manager.config["emulators"][name]; self.config_manager.save_config(); self.update_emulator_list()
-    def launch_selected_game(self, item):
-        game_data = item.data(Qt.ItemDataRole.UserRole)
-
-        if game_data.get('platform') == 'PlayStation 3' and game_data.get('path', '').lower().endswith('.pkg'):
-            QMessageBox.information(self, "Installation Required",
-                                    "This is a PlayStation 3 package file (.pkg).\n\n"
-                                    "It must be installed first using your emulator (e.g., RPCS3's 'File > Install Packages/Raps/Edats' option).\n\n"
-                                    "You cannot launch this file directly from EmulatorHub.")
-            return
-        
-        # Handle PC games separately (no emulator needed)
-        if game_data.get('platform') in ['PC', 'Windows']:
-            result, message = self.backend.launch_game(game_data['hash'])
-            self.statusBar().showMessage(message)
-            if result:
-                if hasattr(result, 'pid'):  # It's a process object
-                    self.start_playtime_tracker(result, game_data['hash'])
-            else:
-                QMessageBox.warning(self, "Launch Error", message)
-            return
-            
-        custom_emu_name = self.config_manager.config.get("game_metadata", {}).get(game_data['hash'], {}).get("custom_emulator")
-        chosen_emulator_config = None
-        system = game_data['platform']
-        if custom_emu_name:
-            chosen_emulator_config = self.config_manager.config["emulators"].get(custom_emu_name)
-            if not chosen_emulator_config:
-                QMessageBox.warning(self, "Launch Error", f"The custom emulator '{custom_emu_name}' is no longer configured."); return
-        else:
-            platform_defaults = self.config_manager.config.get("platform_defaults", {})
-            default_emu_name = platform_defaults.get(system)
-            if default_emu_name and default_emu_name in self.config_manager.config["emulators"]:
-                 chosen_emulator_config = self.config_manager.config["emulators"][default_emu_name]
-            else:
-                available_emulators = self.backend.get_emulators_for_system(system)
-                if not available_emulators:
-                    QMessageBox.warning(self, "Launch Error", f"No emulator configured for {system}."); return
-                if len(available_emulators) == 1:
-                    chosen_emulator_config = available_emulators[0]['config']
-                else:
-                    dialog = EmulatorChoiceDialog([emu['name'] for emu in available_emulators], system, self)
-                    if dialog.exec():
-                        name = dialog.get_selected_emulator_name()
-                        chosen_emulator_config = next((emu['config'] for emu in available_emulators if emu['name'] == name), None)
-                        if dialog.get_set_as_default() and name:
-                            self.config_manager.config["platform_defaults"][system] = name
-                            self.config_manager.save_config()
-                            self.statusBar().showMessage(f"Set {name} as default for {system}.")
-                    else: return
-        if chosen_emulator_config:
-            process, message = self.backend.launch_game(game_data['hash'], chosen_emulator_config)
-            self.statusBar().showMessage(message)
-            if process: self.start_playtime_tracker(process, game_data['hash'])
-            else: QMessageBox.warning(self, "Launch Error", message)
-
-    def start_playtime_tracker(self, process, game_hash):
-        if not psutil: return
-        pid = process.pid; start_time = time.time()
-        timer = QTimer(self); self.process_timers[pid] = timer
-        def check_process():
-            if not psutil.pid_exists(pid):
-                elapsed_time = time.time() - start_time
-                metadata = self.config_manager.config["game_metadata"].setdefault(game_hash, {})
-                metadata['playtime'] = metadata.get('playtime', 0) + elapsed_time
-                self.config_manager.save_config()
-                if game_hash in self.backend.all_games_map:
-                    self.backend.all_games_map[game_hash]['playtime'] = metadata['playtime']
-                self.process_timers[pid].stop(); del self.process_timers[pid]
-                self.repopulate_games_list()
-        timer.timeout.connect(check_process); timer.start(5000)
-        
-    def launch_selected_emulator(self, item=None):
-        if not item or not isinstance(item, QTreeWidgetItem): item = self.emulators_tree.currentItem()
-        if not item or not item.parent(): return
-        
-        name = item.data(0, Qt.ItemDataRole.UserRole)
-        path = self.config_manager.config["emulators"][name]['path']
-        try: subprocess.Popen([os.path.normpath(path)])
-        except Exception as e: QMessageBox.critical(self, "Launch Error", f"Failed to start emulator:\n{e}")
-    
-    def show_game_context_menu(self, pos):
-        item = self.games_list.itemAt(pos)
-        if not item: return
-        game_data = item.data(Qt.ItemDataRole.UserRole)
-        context_menu = QMenu(self)
-        is_enabled = bool(item.flags() & Qt.ItemFlag.ItemIsEnabled)
-        play_action = context_menu.addAction(self.style().standardIcon(QStyle.StandardPixmap.SP_MediaPlay), "Play Game")
-        bold_font = QFont(); bold_font.setBold(True); play_action.setFont(bold_font)
-        play_action.triggered.connect(lambda: self.launch_selected_game(item))
-        play_action.setEnabled(is_enabled)
-        context_menu.addSeparator()
-        is_fav = self.backend.is_favorite(game_data['hash'])
-        fav_text = "Remove from Favorites" if is_fav else "Add to Favorites"
-        fav_icon = self.style().standardIcon(QStyle.StandardPixmap.SP_DialogCancelButton if is_fav else QStyle.StandardPixmap.SP_DialogApplyButton)
-        fav_action = context_menu.addAction(fav_icon, fav_text)
-        fav_action.triggered.connect(lambda: self.toggle_favorite(game_data['hash']))
-        context_menu.addSeparator()
-        manage_menu = context_menu.addMenu("Manage...")
-        custom_emu_menu = manage_menu.addMenu("Set Custom Emulator")
-        game_metadata = self.config_manager.config.get("game_metadata", {}).get(game_data['hash'], {})
-        current_custom_emu = game_metadata.get("custom_emulator")
-        clear_action = custom_emu_menu.addAction("Use Platform Default"); clear_action.setCheckable(True)
-        clear_action.setChecked(current_custom_emu is None); clear_action.triggered.connect(lambda: self.set_custom_emulator_for_game(game_data['hash'], None))
-        custom_emu_menu.addSeparator()
-        for emu_name in sorted(self.config_manager.config.get("emulators", {}).keys()):
-            action = custom_emu_menu.addAction(emu_name); action.setCheckable(True)
-            action.setChecked(emu_name == current_custom_emu)
-            action.triggered.connect(lambda checked, name=emu_name: self.set_custom_emulator_for_game(game_data['hash'], name))
-        cover_action = manage_menu.addAction("Set Custom Image...")
-        cover_action.triggered.connect(lambda: self.set_custom_game_image(item))
-        platform_defaults = self.config_manager.config.get("platform_defaults", {})
-        if game_data['platform'] in platform_defaults:
-            clear_default_action = manage_menu.addAction(f"Clear Default Emulator for {game_data['platform']}")
-            clear_default_action.triggered.connect(lambda: self.clear_platform_default_emulator(game_data['platform']))
-        
-        manage_menu.addSeparator()
-        delete_action = manage_menu.addAction(self.style().standardIcon(QStyle.StandardPixmap.SP_TrashIcon), "Delete Files...")
-        delete_action.triggered.connect(lambda: self.delete_game_files(item))
-        delete_action.setEnabled(is_enabled)
-
-        context_menu.addSeparator()
-        show_folder_action = context_menu.addAction(self.style().standardIcon(QStyle.StandardPixmap.SP_DirIcon), "Show in Folder")
-        show_folder_action.triggered.connect(lambda: self.show_game_in_explorer(item))
-        show_folder_action.setEnabled(is_enabled)
-        
-        # Enhanced info action
-        enhanced_info_action = context_menu.addAction(self.style().standardIcon(QStyle.StandardPixmap.SP_FileDialogInfoView), "Detailed Info... (Ctrl+I)")
-        enhanced_info_action.triggered.connect(lambda: self.show_enhanced_game_info(item))
-        
-        # Collections submenu
-        collections = self.config_manager.config.get("collections", {})
-        if collections:
-            collections_menu = context_menu.addMenu("Add to Collection")
-            for collection_name in sorted(collections.keys()):
-                action = collections_menu.addAction(collection_name)
-                action.triggered.connect(lambda checked, name=collection_name, hash=game_data['hash']: self.add_to_collection(hash, name))
-        
-        context_menu.addSeparator()
-        
-        # Save states
-        save_states_action = context_menu.addAction("💾 Manage Save States")
-        save_states_action.triggered.connect(lambda: self.open_save_state_manager(game_data))
-        
-        info_action = context_menu.addAction(self.style().standardIcon(QStyle.StandardPixmap.SP_DialogHelpButton), "View Info...")
-        info_action.triggered.connect(lambda: self.show_game_info(item))
-        context_menu.exec(self.games_list.viewport().mapToGlobal(pos))
-    
-    def add_to_collection(self, game_hash, collection_name):
-        """Add a game to a collection"""
-        collections = self.config_manager.config.setdefault("collections", {})
-        if collection_name in collections:
-            if game_hash not in collections[collection_name]:
-                collections[collection_name].append(game_hash)
-                self.config_manager.save_config()
-                self.statusBar().showMessage(f"Added to collection '{collection_name}'", 3000)
-    
-    def add_pc_game_dialog(self):
-        """Dialog to manually add PC games"""
-        dialog = QDialog(self)
-        dialog.setWindowTitle("Add PC Game")
-        dialog.setMinimumWidth(500)
-        
-        layout = QVBoxLayout(dialog)
-        
-        # Instructions
-        info_label = QLabel("Add a PC game by selecting an executable (.exe), shortcut (.lnk), or game folder.")
-        info_label.setWordWrap(True)
-        layout.addWidget(info_label)
-        
-        # File/Folder selection
-        file_group = QGroupBox("Game Location")
-        file_layout = QVBoxLayout(file_group)
-        
-        path_layout = QHBoxLayout()
-        self.pc_game_path_edit = QLineEdit()
-        self.pc_game_path_edit.setPlaceholderText("Select game executable, shortcut, or folder...")
-        
-        btn_browse_file = QPushButton("Browse File...")
-        btn_browse_file.clicked.connect(lambda: self.browse_pc_game_file())
-        
-        btn_browse_folder = QPushButton("Browse Folder...")
-        btn_browse_folder.clicked.connect(lambda: self.browse_pc_game_folder())
-        
-        path_layout.addWidget(self.pc_game_path_edit)
-        path_layout.addWidget(btn_browse_file)
-        path_layout.addWidget(btn_browse_folder)
-        file_layout.addLayout(path_layout)
-        layout.addWidget(file_group)
-        
-        # Game info
-        info_group = QGroupBox("Game Information")
-        info_layout = QFormLayout(info_group)
-        
-        self.pc_game_title_edit = QLineEdit()
-        self.pc_game_title_edit.setPlaceholderText("Game title (auto-detected)")
-        info_layout.addRow("Title:", self.pc_game_title_edit)
-        
-        layout.addWidget(info_group)
-        
-        # Buttons
-        button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
-        button_box.accepted.connect(lambda: self.add_pc_game_to_library(dialog))
-        button_box.rejected.connect(dialog.reject)
-        layout.addWidget(button_box)
-        
-        dialog.exec()
-    
-    def browse_pc_game_file(self):
-        """Browse for PC game file"""
-        file_path, _ = QFileDialog.getOpenFileName(
-            self, 
-            "Select Game File",
-            "",
-            "Game Files (*.exe *.lnk *.url);;All Files (*.*)"
-        )
-        if file_path:
-            self.pc_game_path_edit.setText(file_path)
-            # Auto-detect title
-            if not self.pc_game_title_edit.text():
-                title = os.path.splitext(os.path.basename(file_path))[0]
-                self.pc_game_title_edit.setText(title)
-    
-    def browse_pc_game_folder(self):
-        """Browse for PC game folder"""
-        folder_path = QFileDialog.getExistingDirectory(self, "Select Game Folder")
-        if folder_path:
-            self.pc_game_path_edit.setText(folder_path)
-            # Auto-detect title
-            if not self.pc_game_title_edit.text():
-                title = os.path.basename(folder_path)
-                self.pc_game_title_edit.setText(title)
-    
-    def add_pc_game_to_library(self, dialog):
-        """Add the PC game to the library"""
-        game_path = self.pc_game_path_edit.text().strip()
-        game_title = self.pc_game_title_edit.text().strip()
-        
-        if not game_path:
-            QMessageBox.warning(dialog, "Missing Information", "Please select a game file or folder.")
-            return
-        
-        if not os.path.exists(game_path):
-            QMessageBox.warning(dialog, "Invalid Path", "The selected file or folder does not exist.")
-            return
-        
-        if not game_title:
-            game_title = os.path.splitext(os.path.basename(game_path))[0]
-        
-        # Create game entry
-        import time
-        path_hash = hashlib.md5(str(Path(game_path).resolve()).encode()).hexdigest()
-        
-        # Check if already exists
-        if path_hash in self.backend.all_games_map:
-            QMessageBox.information(dialog, "Already Added", "This game is already in your library.")
-            dialog.accept()
-            return
-        
-        # Get file size
-        try:
-            if os.path.isdir(game_path):
-                size = sum(f.stat().st_size for f in Path(game_path).glob('**/*') if f.is_file())
-            else:
-                size = os.path.getsize(game_path)
-        except:
-            size = 0
-        
-        # Add to backend
-        game_data = {
-            "title": game_title,
-            "path": game_path,
-            "hash": path_hash,
-            "size": size,
-            "platform": "PC",
-            "playtime": 0,
-            "date_added": time.time()
-        }
-        
-        self.backend.all_games_map[path_hash] = game_data
-        
-        if "PC" not in self.backend.games_by_platform:
-            self.backend.games_by_platform["PC"] = []
-        self.backend.games_by_platform["PC"].append(game_data)
-        
-        # Save to cache
-        self.backend.save_to_cache()
-        self.config_manager.config['last_scan_date'] = time.strftime("%Y-%m-%d %H:%M:%S")
-        self.config_manager.save_config()
-        
-        # Update UI
-        self.update_system_list()
-        self.repopulate_games_list()
-        
-        self.statusBar().showMessage(f"Added '{game_title}' to PC games library.", 5000)
-        dialog.accept()
-    
-    def dragEnterEvent(self, event):
-        if event.mimeData().hasUrls():
-            path = Path(event.mimeData().urls()[0].toLocalFile())
-            if path.is_dir() or path.suffix.lower() in ['.png', '.jpg', '.jpeg', '.webp']:
-                event.acceptProposedAction()
-
-    def dropEvent(self, event):
-        urls = event.mimeData().urls()
-        if not urls:
-            return
-        path = Path(urls[0].toLocalFile())
-        if path.is_dir():
-            if str(path) not in self.config_manager.config["game_library_paths"]:
-                reply = QMessageBox.question(self, "Add Library Folder", f"Do you want to add this folder to your game library?\n\n{path}")
-                if reply == QMessageBox.StandardButton.Yes:
-                    self.config_manager.config["game_library_paths"].append(str(path))
-                    self.config_manager.save_config()
-                    self.start_full_scan()
-        elif path.suffix.lower() in ['.png', '.jpg', '.jpeg', '.webp']:
-            window_pos = event.position().toPoint()
-            list_local_pos = self.games_list.mapFrom(self, window_pos)
-            item = self.games_list.itemAt(list_local_pos)
-            if item:
-                self.set_custom_game_image(item, image_path=str(path))
-
-    def show_game_in_explorer(self, item):
-        game_data = item.data(Qt.ItemDataRole.UserRole)
-        path = os.path.normpath(game_data['path'])
-        try:
-            if sys.platform == "win32":
-                subprocess.Popen(['explorer', '/select,', path])
-            elif sys.platform == "darwin": # macOS
-                subprocess.Popen(['open', '-R', path])
-            else: # Linux, etc.
-                subprocess.Popen(['xdg-open', os.path.dirname(path)])
-        except Exception as e:
-            QMessageBox.warning(self, "Error", f"Could not open file location: {e}")
-
-    def delete_game_files(self, item):
-        game_data = item.data(Qt.ItemDataRole.UserRole)
-        path_to_delete = Path(game_data['path'])
-        
-        msg_box = QMessageBox(self)
-        msg_box.setWindowTitle("Confirm Deletion")
-        msg_box.setText(f"<h2>Permanently Delete Files?</h2>"
-                        f"<p>This action cannot be undone. It will delete the following file or folder from your hard drive:</p>"
-                        f"<p><b>{path_to_delete.resolve()}</b></p>")
-        msg_box.setStandardButtons(QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
-        msg_box.setDefaultButton(QMessageBox.StandardButton.No)
-        msg_box.setIcon(QMessageBox.Icon.Warning)
-
-        if msg_box.exec() == QMessageBox.StandardButton.Yes:
-            try:
-                self.statusBar().showMessage(f"Deleting {path_to_delete.name}...")
-                if path_to_delete.is_dir():
-                    shutil.rmtree(path_to_delete)
-                else:
-                    path_to_delete.unlink()
-                
-                self.statusBar().showMessage(f"Successfully deleted {path_to_delete.name}.", 5000)
-                self.start_full_scan()
-
-            except Exception as e:
-                QMessageBox.critical(self, "Deletion Error", f"Could not delete files.\n\nError: {e}")
-                self.statusBar().showMessage("Deletion failed.", 5000)
-
-    def clear_platform_default_emulator(self, platform_name):
-        platform_defaults = self.config_manager.config.get("platform_defaults", {})
-        if platform_name in platform_defaults:
-            del platform_defaults[platform_name]
-            self.config_manager.save_config()
-            self.statusBar().showMessage(f"Cleared default emulator for {platform_name}. You will be prompted on next launch.")
-
-    def set_custom_emulator_for_game(self, game_hash, emulator_name):
-        metadata = self.config_manager.config["game_metadata"].setdefault(game_hash, {})
-        if emulator_name:
-            metadata["custom_emulator"] = emulator_name; self.statusBar().showMessage(f"Set {emulator_name} as custom emulator.")
-        else:
-            if "custom_emulator" in metadata: del metadata["custom_emulator"]
-            self.statusBar().showMessage("Cleared custom emulator. Will use platform default.")
-        self.config_manager.save_config()
-        
-    def toggle_favorite(self, game_hash):
-        self.backend.toggle_favorite(game_hash)
-        self.update_system_list()
-
-    def set_custom_game_image(self, item, image_path=None):
-        if not image_path:
-            image_path, _ = QFileDialog.getOpenFileName(self, "Select Cover Image", "", "Images (*.png *.jpg *.jpeg *.webp)")
-        if not image_path: return
-        game_data = item.data(Qt.ItemDataRole.UserRole)
-        success, message = self.backend.set_custom_game_image(game_data['hash'], image_path)
-        if success:
-            self.repopulate_games_list(); self.statusBar().showMessage(f"Set custom cover for {game_data['title']}")
-        else:
-            QMessageBox.critical(self, "Error", message)
-    def show_game_info(self, item):
-        game_data = item.data(Qt.ItemDataRole.UserRole)
-        info = {"title": game_data.get('title', 'N/A'), "platform": game_data.get('platform', 'N/A'), "size": format_size(game_data.get('size', 0)), "playtime": format_playtime(game_data.get('playtime', 0))}
-        GameInfoDialog(info, self).exec()
-        self.statusBar().showMessage("Ready.")
-    
-    def show_enhanced_game_info(self, item):
-        """Show enhanced game info dialog with editing capabilities"""
-        if not item:
-            return
-        game_data = item.data(Qt.ItemDataRole.UserRole)
-        if not game_data:
-            return
-        
-        dialog = EnhancedGameInfoDialog(game_data, self.backend, self)
-        if dialog.exec() == QDialog.DialogCode.Accepted:
-            metadata = dialog.get_metadata()
-            game_hash = game_data['hash']
-            
-            # Update metadata
-            stored_metadata = self.config_manager.config["game_metadata"].setdefault(game_hash, {})
-            if metadata['title'] != game_data.get('title'):
-                self.backend.all_games_map[game_hash]['title'] = metadata['title']
-            stored_metadata['notes'] = metadata['notes']
-            stored_metadata['tags'] = metadata['tags']
-            
-            self.config_manager.save_config()
-            self.backend.save_to_cache()
-            self.repopulate_games_list()
-            self.statusBar().showMessage("Game metadata updated.", 3000)
-    
-    def open_settings(self):
-        """Open settings dialog"""
-        dialog = SettingsDialog(self.config_manager, self)
-        if dialog.exec() == QDialog.DialogCode.Accepted:
-            settings = dialog.get_settings()
-            self.config_manager.config.update(settings)
-            
-            # Apply theme if changed
-            if settings['theme'] != self.current_theme_name:
-                self.current_theme_name = settings['theme']
-                self.apply_theme()
-            
-            self.config_manager.save_config()
-            self.statusBar().showMessage("Settings saved.", 3000)
-    
-    def open_save_state_manager(self, game_data):
-        """Open save state manager for a game"""
-        dialog = SaveStateManagerDialog(game_data, self.config_manager, self)
-        dialog.exec()
-    
-    def open_collections_manager(self):
-        """Open collections manager dialog"""
-        dialog = CollectionManagerDialog(self.config_manager, self)
-        if dialog.exec() == QDialog.DialogCode.Accepted:
-            self.update_system_list()
-    
-    def toggle_batch_mode(self, enabled):
-        """Toggle batch operations mode"""
-        if enabled:
-            self.statusBar().showMessage("Batch mode enabled. Select multiple games to perform actions.", 5000)
-            self.games_list.setSelectionMode(QListWidget.SelectionMode.MultiSelection)
-        else:
-            self.statusBar().showMessage("Batch mode disabled.", 3000)
-            self.games_list.setSelectionMode(QListWidget.SelectionMode.ExtendedSelection)
-            self.games_list.clearSelection()
-    
-    def delete_selected_games(self):
-        """Delete multiple selected games"""
-        selected_items = self.games_list.selectedItems()
-        if not selected_items:
-            return
-        
-        count = len(selected_items)
-        reply = QMessageBox.question(
-            self, 
-            "Confirm Batch Delete",
-            f"Are you sure you want to permanently delete {count} game(s)?\n\nThis action cannot be undone.",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
-        )
-        
-        if reply == QMessageBox.StandardButton.Yes:
-            deleted_count = 0
-            failed_items = []
-            
-            for item in selected_items:
-                game_data = item.data(Qt.ItemDataRole.UserRole)
-                if not game_data:
-                    continue
-                
-                path_to_delete = Path(game_data['path'])
-                try:
-                    if path_to_delete.is_dir():
-                        shutil.rmtree(path_to_delete)
-                    else:
-                        path_to_delete.unlink()
-                    deleted_count += 1
-                except Exception as e:
-                    failed_items.append((game_data['title'], str(e)))
-            
-            if deleted_count > 0:
-                self.statusBar().showMessage(f"Deleted {deleted_count} game(s).", 5000)
-                self.start_full_scan()
-            
-            if failed_items:
-                error_msg = "Failed to delete:\n" + "\n".join([f"• {title}: {error}" for title, error in failed_items[:5]])
-                QMessageBox.warning(self, "Deletion Errors", error_msg)
-    
-    def show_statistics_view(self):
-        """Display library statistics in the games list area"""
-        self.games_list.clear()
-        
-        # Calculate statistics
-        total_games = len(self.backend.all_games_map)
-        total_size = sum(g.get('size', 0) for g in self.backend.all_games_map.values())
-        total_playtime = sum(g.get('playtime', 0) for g in self.backend.all_games_map.values())
-        platform_count = len(self.backend.games_by_platform)
-        favorites_count = len(self.backend.get_favorite_games())
-        
-        # Most played games
-        most_played = sorted(
-            [g for g in self.backend.all_games_map.values() if g.get('playtime', 0) > 0],
-            key=lambda g: g.get('playtime', 0),
-            reverse=True
-        )[:5]
-        
-        # Platform distribution
-        platform_stats = {
-            platform: len(games) 
-            for platform, games in self.backend.games_by_platform.items()
-        }
-        top_platforms = sorted(platform_stats.items(), key=lambda x: x[1], reverse=True)[:5]
-        
-        # Get theme colors
-        theme_colors = self.themes.get(self.current_theme_name, self.themes["Modern Dark"])
-        cyan_color = theme_colors.get('C_HIGHLIGHT_CYAN', '#2AC3DE')
-        blue_color = theme_colors.get('C_HIGHLIGHT_BLUE', '#7AA2F7')
-        text_color = theme_colors.get('C_TEXT_PRIMARY', '#C0CAF5')
-        
-        # Create statistics display with proper styling
-        stats_text = f"""
-<div style='color: {text_color}; padding: 20px;'>
-<h2 style='color: {cyan_color}; margin-bottom: 10px;'>📊 Library Statistics</h2>
-<hr style='border-color: {blue_color}; margin: 15px 0;'>
-
-<h3 style='color: {blue_color}; margin-top: 20px;'>Overview</h3>
-<ul style='line-height: 1.8;'>
-<li><b>Total Games:</b> {total_games}</li>
-<li><b>Total Size:</b> {format_size(total_size)}</li>
-<li><b>Total Playtime:</b> {format_playtime(total_playtime)}</li>
-<li><b>Platforms:</b> {platform_count}</li>
-<li><b>Favorites:</b> {favorites_count}</li>
-</ul>
-
-<h3 style='color: {blue_color}; margin-top: 20px;'>Top 5 Most Played Games</h3>
-<ol style='line-height: 1.8;'>
-"""
-        
-        if most_played:
-            for game in most_played:
-                stats_text += f"<li><b>{game['title']}</b> <span style='color: {theme_colors.get('C_TEXT_SECONDARY', '#9AA5CE')}'>({game['platform']})</span> - {format_playtime(game.get('playtime', 0))}</li>\n"
-        else:
-            stats_text += f"<li><i style='color: {theme_colors.get('C_TEXT_SECONDARY', '#9AA5CE')}'>No games played yet</i></li>\n"
-        
-        stats_text += f"""
-</ol>
-
-<h3 style='color: {blue_color}; margin-top: 20px;'>Top 5 Platforms by Game Count</h3>
-<ol style='line-height: 1.8;'>
-"""
-        
-        for platform, count in top_platforms:
-            stats_text += f"<li><b>{platform}:</b> {count} game(s)</li>\n"
-        
-        stats_text += """
-</ol>
-</div>
-"""
-        
-        # Create a widget to display statistics
-        item = QListWidgetItem(self.games_list)
-        stats_widget = QLabel(stats_text)
-        stats_widget.setWordWrap(True)
-        stats_widget.setTextFormat(Qt.TextFormat.RichText)
-        stats_widget.setStyleSheet(f"QLabel {{ background-color: transparent; padding: 10px; }}")
-        item.setSizeHint(QSize(self.games_list.width() - 50, 600))
-        self.games_list.addItem(item)
-        self.games_list.setItemWidget(item, stats_widget)
-        
-        # Hide details panel for statistics view
-        if hasattr(self, 'details_placeholder_label'):
-            self.details_placeholder_label.setVisible(True)
-        details_box = self.details_panel.findChild(QGroupBox)
-        if details_box:
-            details_box.setVisible(False)
-    
-    def restore_window_state(self):
-        geo_hex = self.config_manager.config.get("window_geometry")
-        if geo_hex: self.restoreGeometry(QByteArray.fromHex(bytes(geo_hex, 'ascii')))
-        state_hex = self.config_manager.config.get("window_state")
-        if state_hex: self.restoreState(QByteArray.fromHex(bytes(state_hex, 'ascii')))
-        splitter_hex = self.config_manager.config.get("splitter_state")
-        if splitter_hex: self.main_splitter.restoreState(QByteArray.fromHex(bytes(splitter_hex, 'ascii')))
-        
-        is_visible = self.config_manager.config.get("details_panel_visible", True)
-        self.toggle_details_action.setChecked(is_visible)
-        self.details_panel.setVisible(is_visible)
-
-    def closeEvent(self, event):
-        # Stop controller handler
-        if self.controller_handler:
-            self.controller_handler.stop()
-            self.controller_handler.wait(1000)
-        
-        self.config_manager.config['view_mode'] = 'grid' if self.is_grid_mode else 'list'
-        self.config_manager.config['grid_icon_size'] = self.current_grid_icon_size
-        self.config_manager.config['list_icon_size'] = self.current_list_icon_size
-        self.config_manager.config['theme'] = self.current_theme_name
-        self.config_manager.config['window_geometry'] = self.saveGeometry().toHex().data().decode('ascii')
-        self.config_manager.config['window_state'] = self.saveState().toHex().data().decode('ascii')
-        self.config_manager.config['splitter_state'] = self.main_splitter.saveState().toHex().data().decode('ascii')
-        self.config_manager.config['details_panel_visible'] = self.toggle_details_action.isChecked()
-        self.config_manager.save_config(); event.accept()
-
-# =============================================================================
-# --- MAIN EXECUTION BLOCK ---
-# =============================================================================
-if __name__ == "__main__":
-    app = QApplication(sys.argv); app.setFont(QFont("Segoe UI", 9))
-    if psutil is None: print("WARNING: 'psutil' library not found. Playtime tracking will be disabled. Run 'pip install psutil' to enable it.")
-    config = ConfigManager(); backend = EmulatorHubBackend(config); window = EmulatorHubWindow(backend, config)
-    window.show(); sys.exit(app.exec())
+import sys
+import os
+import subprocess
+import json
+import shutil
+import sqlite3
+from pathlib import Path
+from collections import OrderedDict, defaultdict
+from functools import lru_cache
+import hashlib
+import math
+import re
+import shlex
+import time
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Optional dependency
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+# Optional dependency: Rust-backed JSON, noticeably faster for the game cache
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def json_dumps(obj):
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+def json_loads(data):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# --- PyQt6 Imports ---
+from PyQt6.QtWidgets import (
+    QApplication, QMainWindow, QWidget, QHBoxLayout, QVBoxLayout,
+    QListWidget, QStatusBar, QListWidgetItem, QPushButton, QMessageBox,
+    QFileDialog, QLabel, QDialog, QLineEdit, QDialogButtonBox,
+    QSplitter, QTabWidget, QMenu, QStyle, QStyledItemDelegate, QSlider, QComboBox,
+    QTreeWidget, QTreeWidgetItem, QHeaderView, QCheckBox, QFormLayout, QGroupBox,
+    QSizePolicy, QProgressBar, QProgressDialog, QInputDialog, QAbstractItemView,
+    QListView, QStackedWidget
+)
+from PyQt6.QtGui import QFont, QIcon, QImage, QImageReader, QPixmap, QPixmapCache, QAction, QPainter, QColor, QBrush, QPen, QFontDatabase, QPainterPath, QPolygonF, QGradient, QLinearGradient, QStaticText, QTransform
+from PyQt6.QtCore import Qt, QSize, QStandardPaths, QPointF, QRect, QRectF, QTimer, QByteArray, pyqtSignal, QThread, QThreadPool, QRunnable, QAbstractListModel, QModelIndex
+
+# =============================================================================
+# --- APPLICATION CONSTANTS & UTILITIES ---
+# =============================================================================
+
+class Constants:
+    VERSION = "2.00"
+    APP_NAME = "EmulatorHub"
+    # Modern Dark Theme Colors with enhanced contrast
+    C_BACKGROUND_DARK = "#1A1B26"; C_BACKGROUND_LIGHT = "#24283B"; C_BACKGROUND_WIDGET = "#16161E"
+    C_BORDER = "#414868"; C_TEXT_PRIMARY = "#C0CAF5"; C_TEXT_SECONDARY = "#9AA5CE"
+    C_HIGHLIGHT_BLUE = "#7AA2F7"; C_HIGHLIGHT_CYAN = "#2AC3DE"; C_ACCENT = "#BB9AF7"
+    C_SUCCESS = "#9ECE6A"; C_WARNING = "#E0AF68"; C_ERROR = "#F7768E"
+    ALL_GAMES_CATEGORY = "All Games"; FAVORITES_CATEGORY = "Favorites"; RECENTS_CATEGORY = "Recently Played"
+    STATISTICS_CATEGORY = "Statistics"; COLLECTIONS_CATEGORY = "Collections"
+    DEFAULT_GRID_ICON_SIZE = 150; MIN_GRID_ICON_SIZE = 100; MAX_GRID_ICON_SIZE = 300
+    DEFAULT_LIST_ICON_SIZE = 48;  MIN_LIST_ICON_SIZE = 32;  MAX_LIST_ICON_SIZE = 96
+    ICON_CACHE_SIZE = 512
+    
+    # Platform icons and colors mapping
+    PLATFORM_ICONS = {
+        "PC": "💻", "Windows": "💻",
+        "PlayStation": "🎮", "PlayStation 2": "🎮", "PlayStation 3": "🎮",
+        "Xbox": "🎮", "Xbox 360": "🎮",
+        "Nintendo Switch": "🎮", "Wii": "🎮", "GameCube": "🎮", "Nintendo 64": "🎮",
+        "Game Boy": "👾", "Game Boy Color": "👾", "Game Boy Advance": "👾",
+        "Nintendo DS": "📱", "Nintendo 3DS": "📱",
+        "PSP": "📱",
+        "Sega Genesis": "🕹️", "Sega Game Gear": "🕹️", "Dreamcast": "🕹️",
+        "Super Nintendo": "🕹️", "TurboGrafx-16": "🕹️", "Atari Lynx": "🕹️"
+    }
+    
+    PLATFORM_COLORS = {
+        "PC": "#0078D4", "Windows": "#0078D4",
+        "PlayStation": "#003087", "PlayStation 2": "#003087", "PlayStation 3": "#003087",
+        "Xbox": "#107C10", "Xbox 360": "#107C10",
+        "Wii": "#009AC7", "GameCube": "#6A5ACD", "Nintendo 64": "#E4000F",
+        "Game Boy": "#8B8589", "Game Boy Color": "#FFCB05", "Game Boy Advance": "#3B1F90",
+        "Nintendo DS": "#D3D3D3", "Nintendo 3DS": "#FF0000",
+        "PSP": "#000000",
+        "Sega Genesis": "#000080", "Sega Game Gear": "#FF6347", "Dreamcast": "#FF6600",
+        "Super Nintendo": "#5A5AFF", "TurboGrafx-16": "#FF4500", "Atari Lynx": "#FF8C00"
+    }
+
+# Rendered placeholder pixmaps keyed by (width, height, letter); cleared on
+# theme change since the gradient uses theme colors.
+_PLACEHOLDER_PIXMAPS = {}
+
+# Application stylesheet, parsed once at import; _build_qss fills in the
+# active theme's colors with str.format.
+_QSS_TEMPLATE = """
+            QGroupBox {{ 
+                font-weight: bold; 
+                border: 2px solid {C_BORDER}; 
+                border-radius: 8px; 
+                margin-top: 12px;
+                background-color: {C_BACKGROUND_WIDGET};
+                padding-top: 15px;
+            }}
+            QGroupBox::title {{
+                subcontrol-origin: margin;
+                subcontrol-position: top center;
+                padding: 0 8px;
+                color: {C_HIGHLIGHT_CYAN};
+            }}
+            QMainWindow, QWidget, QDialog {{ background-color: {C_BACKGROUND_DARK}; color: {C_TEXT_PRIMARY}; border: none; }}
+            QToolBar {{ background-color: {C_BACKGROUND_LIGHT}; padding: 6px; border-bottom: 2px solid {C_BORDER}; }}
+            QTabWidget::pane {{ border-top: 2px solid {C_BORDER}; background-color: {C_BACKGROUND_DARK}; }}
+            QTabBar::tab {{ 
+                background: {C_BACKGROUND_WIDGET}; color: {C_TEXT_SECONDARY}; 
+                padding: 12px 20px; border: 1px solid {C_BORDER}; 
+                border-bottom: none; border-top-left-radius: 6px; border-top-right-radius: 6px;
+                margin-right: 2px;
+            }}
+            QTabBar::tab:selected, QTabBar::tab:hover {{ 
+                background: {C_BACKGROUND_LIGHT}; color: {C_HIGHLIGHT_CYAN}; 
+                border-bottom: 3px solid {C_HIGHLIGHT_CYAN};
+            }}
+            QSplitter::handle {{ background-color: {C_BORDER}; }}
+            QListWidget, QTreeWidget {{ 
+                background-color: {C_BACKGROUND_WIDGET}; 
+                border: 1px solid {C_BORDER}; 
+                border-radius: 4px;
+                padding: 8px; 
+            }}
+            QListWidget::item:hover, QTreeWidget::item:hover {{ background-color: {C_BACKGROUND_LIGHT}; }}
+            QListWidget::item:selected, QTreeWidget::item:selected {{ 
+                background-color: {C_HIGHLIGHT_BLUE}; 
+                color: {C_TEXT_PRIMARY};
+            }}
+            QListWidget::item:disabled {{ color: #888888; }}
+            QHeaderView::section {{ background-color: {C_BACKGROUND_LIGHT}; padding: 6px; border: 1px solid {C_BORDER}; }}
+            QPushButton {{ 
+                background-color: {C_BACKGROUND_LIGHT}; 
+                border: 2px solid {C_BORDER}; 
+                padding: 8px 16px; 
+                min-width: 0; 
+                border-radius: 6px;
+                font-weight: 500;
+            }}
+            QPushButton:hover {{ 
+                background-color: {C_HIGHLIGHT_BLUE}; 
+                border-color: {C_HIGHLIGHT_CYAN}; 
+            }} 
+            QPushButton:pressed {{ 
+                background-color: {C_HIGHLIGHT_CYAN}; 
+            }}
+            QPushButton:disabled {{ 
+                background-color: {C_BACKGROUND_DARK}; 
+                border-color: {C_BACKGROUND_LIGHT}; 
+                color: {C_BORDER}; 
+            }}
+            QPushButton:checkable:checked {{ 
+                background-color: {C_HIGHLIGHT_BLUE}; 
+                border-color: {C_HIGHLIGHT_CYAN}; 
+                color: white;
+            }}
+            QStatusBar {{ color: {C_TEXT_PRIMARY}; background-color: {C_BACKGROUND_LIGHT}; padding: 4px; }}
+            QLineEdit, QComboBox {{ 
+                border: 2px solid {C_BORDER}; 
+                padding: 8px; 
+                background-color: {C_BACKGROUND_WIDGET}; 
+                min-width: 120px; 
+                border-radius: 6px;
+            }}
+            QLineEdit:focus, QComboBox:focus {{
+                border-color: {C_HIGHLIGHT_CYAN};
+            }}
+            QComboBox::drop-down {{ border: none; padding-right: 5px; }}
+            QComboBox QAbstractItemView {{ 
+                border: 2px solid {C_BORDER}; 
+                background-color: {C_BACKGROUND_LIGHT}; 
+                selection-background-color: {C_HIGHLIGHT_BLUE}; 
+            }}
+            QSlider::groove:horizontal {{ 
+                border: 1px solid {C_BORDER}; height: 6px; 
+                background: {C_BACKGROUND_LIGHT}; margin: 2px 0; border-radius: 3px; 
+            }}
+            QSlider::handle:horizontal {{ 
+                background: {C_HIGHLIGHT_CYAN}; 
+                border: 2px solid {C_HIGHLIGHT_BLUE}; 
+                width: 18px; margin: -6px 0; border-radius: 9px; 
+            }}
+            QSlider::handle:horizontal:hover {{
+                background: {C_HIGHLIGHT_BLUE};
+            }}
+            QToolTip {{ 
+                background-color: {C_BACKGROUND_LIGHT}; 
+                color: {C_TEXT_PRIMARY}; 
+                border: 2px solid {C_HIGHLIGHT_CYAN}; 
+                padding: 6px; 
+                border-radius: 4px;
+            }}
+            QMenu {{ 
+                background-color: {C_BACKGROUND_LIGHT}; 
+                border: 2px solid {C_BORDER}; 
+                padding: 6px; 
+                border-radius: 6px;
+            }}
+            QMenu::item {{ padding: 8px 30px 8px 30px; border-radius: 4px; }}
+            QMenu::item:selected {{ 
+                background-color: {C_HIGHLIGHT_BLUE}; 
+                color: {C_TEXT_PRIMARY}; 
+            }}
+            QMenu::separator {{ height: 2px; background: {C_BORDER}; margin: 6px 10px; }}
+            QLabel {{ color: {C_TEXT_PRIMARY}; }}
+        """
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+def format_size(size_bytes):
+    if not size_bytes: return "0 B"
+    size_bytes = int(size_bytes)
+    # bit_length gives the 1024-bucket directly; one shift and one divide
+    # instead of a divide-and-compare loop.
+    i = min((size_bytes.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (10 * i)):.2f} {_SIZE_UNITS[i]}"
+
+def format_playtime(seconds):
+    if seconds == 0: return "Never Played"
+    minutes, secs = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{secs:02d}"
+
+# Precompiled title-cleaning patterns; the bracket/paren groups are combined so
+# one pass strips both.
+_RE_XISO = re.compile(r'\.xiso$', re.IGNORECASE)
+_RE_TAGS = re.compile(r'\[[^\]]*\]|\([^)]*\)')
+
+@lru_cache(maxsize=4096)
+def _clean_game_title(filename):
+    # ROM sets repeat filenames across regions/versions, so identical inputs
+    # hit the LRU instead of re-running the substitutions.
+    title = _RE_XISO.sub('', Path(filename).stem)
+    title = _RE_TAGS.sub('', title)
+    return title.replace('.', ' ').replace('_', ' ').strip()
+
+def hash_game_path(path):
+    """Identity key for a game path. abspath is pure string normalization (no
+    readlink syscalls like Path.resolve), and a short BLAKE2b digest is cheaper
+    than MD5 while still collision-safe for a library-sized key space."""
+    key = os.path.abspath(path).encode('utf-8', 'surrogatepass')
+    return hashlib.blake2b(key, digest_size=8).hexdigest()
+
+def _pid_alive(pid):
+    """One-syscall liveness probe for a pid we did not spawn.
+
+    os.kill(pid, 0) delivers nothing; EPERM still proves the process
+    exists. On Windows signal 0 is not a probe (os.kill would terminate),
+    so callers there fall back to psutil when they only hold a pid.
+    """
+    if os.name == 'nt':
+        return psutil.pid_exists(pid) if psutil else False
+    try:
+        os.kill(pid, 0)
+        return True
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+
+def _reveal_in_explorer_windows(path):
+    """Select *path* in Explorer via the shell API, no child process.
+
+    SHOpenFolderAndSelectItems talks to the running shell directly, so it
+    skips a CreateProcess per invocation and reuses an Explorer window that
+    is already showing the folder. Callers fall back to `explorer /select,`
+    if anything here raises.
+    """
+    import ctypes
+    from ctypes import wintypes
+    ole32 = ctypes.windll.ole32
+    shell32 = ctypes.windll.shell32
+    ole32.CoInitialize(None)
+    try:
+        pidl = ctypes.c_void_p()
+        sfgao = wintypes.ULONG()
+        if shell32.SHParseDisplayName(ctypes.c_wchar_p(path), None, ctypes.byref(pidl), 0, ctypes.byref(sfgao)) != 0:
+            raise OSError(f"SHParseDisplayName failed for {path}")
+        try:
+            if shell32.SHOpenFolderAndSelectItems(pidl, 0, None, 0) != 0:
+                raise OSError("SHOpenFolderAndSelectItems failed")
+        finally:
+            ole32.CoTaskMemFree(pidl)
+    finally:
+        ole32.CoUninitialize()
+
+# =============================================================================
+# --- BACKGROUND WORKER THREADS ---
+# =============================================================================
+
+class CacheLoader(QThread):
+    """Deserializes the game cache off the UI thread so startup paints first."""
+    loaded = pyqtSignal(bool)
+
+    def __init__(self, backend):
+        super().__init__()
+        self.backend = backend
+
+    def run(self):
+        self.loaded.emit(self.backend.load_from_cache())
+
+
+class ProcessWaiter(QThread):
+    """Blocks in the OS until a launched game exits, then signals once.
+
+    Replaces the 5-second psutil poll: process.wait() parks the thread on
+    waitpid/WaitForSingleObject, so there are zero wake-ups while the game
+    runs and exactly one when it quits.
+    """
+    process_exited = pyqtSignal(int)
+
+    def __init__(self, process, parent=None):
+        super().__init__(parent)
+        self.process = process
+
+    def run(self):
+        try:
+            self.process.wait()
+        except Exception:
+            pass
+        self.process_exited.emit(self.process.pid)
+
+
+class IconLoader(QThread):
+    """Decodes cover images off the UI thread, pre-scaled to the view's size.
+
+    QImageReader.setScaledSize decodes straight to the target resolution, so
+    a 1500px PNG never materializes at full size just to become a 128px icon.
+    Results come back as QImage (QPixmap is not thread-safe to create here);
+    the window converts and repaints the one affected row.
+    """
+    icon_ready = pyqtSignal(str, QImage)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._queue = queue.Queue()
+
+    def request(self, game_hash, image_path, size):
+        self._queue.put((game_hash, image_path, size.width(), size.height()))
+
+    def stop(self):
+        self._queue.put(None)
+
+    def run(self):
+        while True:
+            job = self._queue.get()
+            if job is None:
+                break
+            game_hash, image_path, width, height = job
+            reader = QImageReader(image_path)
+            reader.setAutoTransform(True)
+            source_size = reader.size()
+            if source_size.isValid():
+                reader.setScaledSize(source_size.scaled(width, height, Qt.AspectRatioMode.KeepAspectRatio))
+            self.icon_ready.emit(game_hash, reader.read())
+
+
+class GameScanner(QThread):
+    progress_update = pyqtSignal(str)
+    scan_finished = pyqtSignal(dict, dict)
+
+    def __init__(self, backend, roots=None):
+        super().__init__()
+        self.backend = backend
+        # When set, only these roots are walked (e.g. a freshly dropped
+        # library folder) and the results are merged into the existing maps.
+        self.roots = roots
+
+    def run(self):
+        games_by_platform = {}
+        all_games_map = {}
+        self.progress_update.emit("Starting library scan...")
+        self._processed_items = 0
+        self._last_progress_emit = time.monotonic()
+
+        # Work-stealing traversal: a shared queue of directories, scanned by a
+        # pool of threads so readdir/stat latency overlaps across requests.
+        dir_queue = queue.Queue()
+        results_lock = threading.Lock()
+        for lib_path in self.roots or self.backend.config_manager.config["game_library_paths"]:
+            dir_queue.put(lib_path)
+
+        parallelism = self.backend.config_manager.config.get("scan_parallelism", 8)
+        num_workers = max(1, min(32, parallelism, (os.cpu_count() or 4) * 4))
+
+        def scan_worker():
+            while True:
+                current_dir = dir_queue.get()
+                if current_dir is None:
+                    dir_queue.task_done()
+                    return
+                try:
+                    self._scan_directory(current_dir, dir_queue, games_by_platform, all_games_map, results_lock)
+                finally:
+                    dir_queue.task_done()
+
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            for _ in range(num_workers):
+                executor.submit(scan_worker)
+            dir_queue.join()
+            for _ in range(num_workers):
+                dir_queue.put(None)
+        self.scan_finished.emit(games_by_platform, all_games_map)
+
+    def _scan_directory(self, current_dir, dir_queue, games_by_platform, all_games_map, results_lock):
+        # Single os.scandir pass per directory: DirEntry type checks come
+        # pre-cached from the directory read, so no extra stat() per child.
+        try:
+            with os.scandir(current_dir) as entries:
+                dir_entries = list(entries)
+        except OSError:
+            return
+        dir_platform = self.backend.get_platform_from_path(current_dir)
+        ext_map = self.backend.GAME_EXTENSIONS
+        # Only probe for PS3_GAME roots where the folder hints allow one;
+        # inside e.g. an SNES tree the probe is thousands of wasted syscalls.
+        may_contain_ps3 = dir_platform is None or dir_platform == "PlayStation 3"
+        for entry in dir_entries:
+            if entry.name.startswith('.'):
+                continue
+            self._processed_items += 1
+            # Cap cross-thread progress signals at ~20 Hz; each emit is a
+            # queued meta-call posted to the GUI event loop.
+            now = time.monotonic()
+            if now - self._last_progress_emit > 0.05:
+                self._last_progress_emit = now
+                self.progress_update.emit(f"Scanning... ({self._processed_items} found)")
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if may_contain_ps3 and os.path.isdir(os.path.join(entry.path, 'PS3_GAME')):
+                        with results_lock:
+                            self._add_game("PlayStation 3", entry.name, entry.path, games_by_platform, all_games_map, entry=entry)
+                    else:
+                        dir_queue.put(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    platform = dir_platform
+                    if not platform:
+                        # splitext avoids a Path allocation per file; the
+                        # compound '.xiso.iso' Xbox extension needs the stem.
+                        stem, ext = os.path.splitext(entry.name)
+                        ext = ext.lower()
+                        if ext == '.iso' and stem.lower().endswith('.xiso'):
+                            ext = '.xiso.iso'
+                        platform = ext_map.get(ext)
+                    if platform:
+                        with results_lock:
+                            self._add_game(platform, entry.name, entry.path, games_by_platform, all_games_map, entry=entry)
+            except OSError:
+                continue
+
+    def _add_game(self, platform, title_source, path, games_by_platform, all_games_map, entry=None):
+        if platform == "Game Boy Color":
+            platform = "Game Boy"
+        if platform not in games_by_platform: games_by_platform[platform] = []
+        path_hash = hash_game_path(path)
+        if path_hash in all_games_map:
+            return
+        try:
+            stat_result = entry.stat(follow_symlinks=False) if entry is not None else os.stat(path)
+        except OSError:
+            stat_result = None
+        mtime = stat_result.st_mtime_ns if stat_result is not None else 0
+        # Rescans are cache-validated: when the path's mtime matches the entry
+        # loaded from game_cache.json, reuse it and skip the slow size/title work.
+        cached = self.backend.all_games_map.get(path_hash)
+        if cached and mtime and cached.get('mtime') == mtime:
+            game_data = dict(cached)
+        else:
+            clean_title = self.backend._clean_game_title(title_source)
+            try:
+                if os.path.isdir(path):
+                    size = self.backend._dir_size(path)
+                elif stat_result is not None:
+                    size = stat_result.st_size
+                else:
+                    size = os.path.getsize(path)
+            except FileNotFoundError: size = 0
+            metadata = self.backend.config_manager.config.get("game_metadata", {}).get(path_hash, {})
+            game_data = {"title": clean_title, "path": path, "hash": path_hash, "size": size, "platform": platform, "mtime": mtime, **metadata}
+        # The scanner just saw this path on disk, so the view never has to stat it.
+        game_data['exists'] = True
+        self.backend.annotate_game(game_data)
+        self.backend.resolve_cover_path(game_data)
+        games_by_platform[platform].append(game_data)
+        all_games_map[path_hash] = game_data
+
+class ThumbnailTask(QRunnable):
+    """Generates a cover thumbnail on the global thread pool so the UI never
+    blocks on JPEG decode / PIL resampling."""
+    def __init__(self, source_path, thumb_path):
+        super().__init__()
+        self.source_path = source_path
+        self.thumb_path = thumb_path
+
+    def run(self):
+        try:
+            from PIL import Image
+            with Image.open(self.source_path) as img:
+                if img.format == 'JPEG':
+                    # libjpeg DCT-scaled decode: skip most IDCT work for
+                    # large sources since we only need a 300px thumbnail.
+                    img.draft('RGB', (600, 600))
+                img.thumbnail((300, 300), Image.Resampling.BILINEAR)
+                img.save(self.thumb_path, quality=85)
+        except Exception:
+            pass  # The full-size cover remains the fallback
+
+# =============================================================================
+# --- CUSTOM UI DELEGATES ---
+# =============================================================================
+
+
+# Star outline for the 16x16 favorite glyph, fixed at import time: the
+# rebuild path just fills this polygon, no trig or path construction.
+_STAR_POLYGON = QPolygonF([QPointF(8 + 6 * math.sin(i * 144 * math.pi / 180),
+                                   8 - 6 * math.cos(i * 144 * math.pi / 180)) for i in range(5)])
+
+# The only two item-state bits the delegates style on; masking with this lets
+# paint resolve hover/selection through one dict lookup in the theme style.
+# StateFlag is a plain enum.Flag in PyQt6, so .value (not int()) gets the bits.
+_HOVER_BIT = QStyle.StateFlag.State_MouseOver.value
+_SEL_BIT = QStyle.StateFlag.State_Selected.value
+_HOVER_SEL_MASK = _HOVER_BIT | _SEL_BIT
+
+class _ThemeAwareDelegate(QStyledItemDelegate):
+    """Base for the paint delegates: resolves the window's theme colors once
+    and tracks switches via the theme_changed signal, instead of chasing
+    parent().window().themes[...] on every paint call."""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._colors = None
+        self._style = None
+        self._style_cache = {}  # theme name -> prebuilt QColor/QPen objects
+        self._static_cache = {}  # (text, font key) -> laid-out QStaticText
+
+    def _theme_style(self, theme_name, colors):
+        raise NotImplementedError
+
+    def _static_text(self, text, font):
+        # Shape the glyph run once per (text, font); scrolling repaints of the
+        # same label then reuse the layout instead of re-shaping it each frame.
+        key = (text, font.key())
+        static = self._static_cache.get(key)
+        if static is None:
+            if len(self._static_cache) > 512:
+                self._static_cache.clear()
+            static = QStaticText(text)
+            static.setTextFormat(Qt.TextFormat.PlainText)
+            static.setPerformanceHint(QStaticText.PerformanceHint.AggressiveCaching)
+            static.prepare(QTransform(), font)
+            self._static_cache[key] = static
+        return static
+
+    def _current_style(self):
+        if self._style is None:
+            window = self.parent().window()
+            window.theme_changed.connect(self._on_theme_changed)
+            self._on_theme_changed(window.current_theme_name, window.themes[window.current_theme_name])
+        return self._style
+
+    def _on_theme_changed(self, theme_name, colors):
+        self._colors = colors
+        self._style = self._theme_style(theme_name, colors)
+
+class GridItemDelegate(_ThemeAwareDelegate):
+    def __init__(self, backend, parent=None):
+        super().__init__(parent); self.backend = backend; self.TEXT_PADDING = 5
+        self.TEXT_AREA_HEIGHT = 40; self.FAVORITE_STAR = QPixmap(":/qt-project.org/styles/commonstyle/images/star-on-16.png")
+        self._star_cache = {}  # warning color -> rendered 16x16 star pixmap
+        self._font_title = QFont("Segoe UI", 9, QFont.Weight.Medium)
+        self._font_badge = QFont("Segoe UI", 7, QFont.Weight.Bold)
+        self._white_pen = QPen(QColor("#FFFFFF"))
+        # Bound once: paint probes favorite state per visible cell.
+        self._is_favorite = backend.is_favorite
+
+    def _theme_style(self, theme_name, colors):
+        # QColor-from-hex parsing and QPen setup are too slow to repeat per
+        # visible cell per frame; build them once per theme.
+        style = self._style_cache.get(theme_name)
+        if style is None:
+            no_pen = QPen(Qt.PenStyle.NoPen)
+            no_brush = QBrush(Qt.BrushStyle.NoBrush)
+            hover_spec = (no_pen, QBrush(QColor(colors['C_BACKGROUND_LIGHT'])))
+            sel_spec = (QPen(QColor(colors['C_HIGHLIGHT_CYAN']), 3), no_brush)
+            style = {
+                'badge': QColor(colors['C_ACCENT']),
+                # Hover/selection resolved by one mask lookup; each spec is a
+                # (pen, brush) pair drawn with the same rounded rect.
+                'state_specs': {
+                    0: (),
+                    _HOVER_BIT: (hover_spec,),
+                    _SEL_BIT: (sel_spec,),
+                    _HOVER_BIT | _SEL_BIT: (hover_spec, sel_spec),
+                },
+            }
+            self._style_cache[theme_name] = style
+        return style
+    def sizeHint(self, option, index):
+        icon_size = option.decorationSize; return QSize(icon_size.width(), icon_size.height() + self.TEXT_AREA_HEIGHT)
+    def paint(self, painter, option, index):
+        rect = option.rect; game_data = index.data(Qt.ItemDataRole.UserRole)
+        if not game_data:  # Fix: Null check
+            return
+        # Cells scrolled out of the dirty region need no draw calls at all.
+        clip = painter.clipBoundingRect()
+        if not clip.isNull() and not clip.intersects(QRectF(rect)):
+            return
+        style = self._current_style()
+        colors = self._colors
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        # Background with shadow for hover/selection: the pre-bound specs for
+        # this state mask carry their pens and brushes, so the branch work is
+        # a dict lookup. Restoring just pen and brush is cheaper than
+        # QPainter.save() snapshotting the full state for a two-field change.
+        specs = style['state_specs'][option.state.value & _HOVER_SEL_MASK]
+        if specs:
+            old_pen, old_brush = painter.pen(), painter.brush()
+            bg_rect = rect.adjusted(2, 2, -2, -2)
+            for pen, brush in specs:
+                painter.setPen(pen); painter.setBrush(brush); painter.drawRoundedRect(bg_rect, 8, 8)
+            painter.setPen(old_pen); painter.setBrush(old_brush)
+        icon_area = QRect(rect.x() + 4, rect.y() + 4, rect.width() - 8, rect.height() - self.TEXT_AREA_HEIGHT - 4)
+        # Rasterize the icon once per QIcon+size through QPixmapCache, with
+        # the drop shadow baked into the cached pixmap.
+        icon = index.data(Qt.ItemDataRole.DecorationRole)
+        if isinstance(icon, QIcon):
+            # Keyed on the QIcon instance, so a row whose async-decoded
+            # cover replaces its placeholder never hits the stale entry.
+            cache_key = f"{icon.cacheKey()}-{icon_area.width()}x{icon_area.height()}"
+            composed = QPixmap()
+            if not QPixmapCache.find(cache_key, composed):
+                composed = self._composed_icon(icon, icon_area.size())
+                QPixmapCache.insert(cache_key, composed)
+            if not composed.isNull():
+                # Cached cover with its shadow baked in: one blit per cell.
+                x = icon_area.x() + (icon_area.width() - (composed.width() - 2)) // 2
+                y = icon_area.y() + (icon_area.height() - (composed.height() - 2)) // 2
+                painter.drawPixmap(x, y, composed)
+        if self._is_favorite(game_data['hash']):
+            star_icon = self.create_star_icon(colors); painter.drawPixmap(rect.x() + 8, rect.y() + 8, star_icon)
+        # Play count badge
+        playtime = game_data.get('playtime', 0)
+        if playtime > 0:
+            badge_text = format_playtime(playtime).split(',')[0]  # Show only first part
+            old_pen, old_brush = painter.pen(), painter.brush()
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(style['badge'])
+            badge_rect = QRect(rect.right() - 60, rect.y() + 8, 50, 20)
+            painter.drawRoundedRect(badge_rect, 10, 10)
+            painter.setPen(self._white_pen)
+            painter.setFont(self._font_badge)
+            painter.drawText(badge_rect, Qt.AlignmentFlag.AlignCenter, badge_text)
+            painter.setPen(old_pen); painter.setBrush(old_brush)
+        text_area = QRect(rect.x() + self.TEXT_PADDING, icon_area.bottom() + 2, rect.width() - 2 * self.TEXT_PADDING, self.TEXT_AREA_HEIGHT)
+        text = index.data(Qt.ItemDataRole.DisplayRole); painter.setPen(option.palette.color(option.palette.ColorRole.Text))
+        painter.setFont(self._font_title)
+        painter.drawText(text_area, Qt.AlignmentFlag.AlignCenter | Qt.TextFlag.TextWordWrap, text)
+    def _composed_icon(self, icon, size):
+        # Rasterize the icon once and bake the drop shadow (2px offset at
+        # 0.2 opacity) into the cached pixmap, so repaints never pay the
+        # rasterize + double-draw again.
+        base = icon.pixmap(size)
+        composed = QPixmap(base.width() + 2, base.height() + 2)
+        composed.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(composed)
+        painter.setOpacity(0.2)
+        painter.drawPixmap(2, 2, base)
+        painter.setOpacity(1.0)
+        painter.drawPixmap(0, 0, base)
+        painter.end()
+        return composed
+
+    def create_star_icon(self, colors):
+        # Rendered once per warning color (i.e. per theme); every favorite
+        # cell repaint after that is a plain pixmap blit.
+        warn_color = colors['C_WARNING']
+        pixmap = self._star_cache.get(warn_color)
+        if pixmap is not None:
+            return pixmap
+        pixmap = QPixmap(16, 16); pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap); painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setBrush(QColor(warn_color)); painter.setPen(Qt.PenStyle.NoPen)
+        painter.drawPolygon(_STAR_POLYGON); painter.end()
+        self._star_cache[warn_color] = pixmap
+        return pixmap
+
+class SpacedListItemDelegate(QStyledItemDelegate):
+    def __init__(self, spacing=8, parent=None): super().__init__(parent); self.spacing = spacing
+    def sizeHint(self, option, index):
+        size = super().sizeHint(option, index); icon_height = option.decorationSize.height()
+        size.setHeight(max(size.height(), icon_height) + self.spacing); return size
+
+@lru_cache(maxsize=256)
+def _parse_platform_label(label):
+    """Split a sidebar "Name (count)" label once; repaints hit the cache."""
+    if ' (' in label:
+        name_part, _, count_part = label.partition(' (')
+        count_part = count_part.rstrip(')')
+    else:
+        name_part, count_part = label, None
+    return name_part, count_part, Constants.PLATFORM_ICONS.get(name_part, "🎮")
+
+class PlatformListDelegate(_ThemeAwareDelegate):
+    """Custom delegate for platform list with enhanced visuals"""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.padding = 8
+        self.icon_size = 24
+        self._platform_colors = {name: QColor(value) for name, value in Constants.PLATFORM_COLORS.items()}
+        self._font_separator = QFont("Segoe UI", 8, QFont.Weight.Bold)
+        self._font_emoji = QFont("Segoe UI Emoji", 16)
+        self._font_name = QFont("Segoe UI", 10, QFont.Weight.Medium)
+        self._font_badge = QFont("Segoe UI", 8, QFont.Weight.Bold)
+        self._white_pen = QPen(QColor("#FFFFFF"))
+
+    def _theme_style(self, theme_name, colors):
+        style = self._style_cache.get(theme_name)
+        if style is None:
+            # ObjectBoundingMode stretches the one gradient over whatever
+            # rect is being filled, so a single brush serves every row.
+            sel_gradient = QLinearGradient(0, 0, 1, 0)
+            sel_gradient.setCoordinateMode(QGradient.CoordinateMode.ObjectBoundingMode)
+            sel_gradient.setColorAt(0, QColor(colors['C_HIGHLIGHT_BLUE']))
+            sel_gradient.setColorAt(1, QColor(colors['C_ACCENT']))
+            sel_brush = QBrush(sel_gradient)
+            hover_brush = QBrush(QColor(colors['C_BACKGROUND_LIGHT']))
+            style = {
+                'sep_pen': QPen(QColor(colors['C_BORDER']), 2),
+                'text_secondary': QColor(colors['C_TEXT_SECONDARY']),
+                'text_primary': QColor(colors['C_TEXT_PRIMARY']),
+                'accent': QColor(colors['C_ACCENT']),
+                # Selection wins over hover, matching the old if/elif chain.
+                'state_brush': {
+                    0: None,
+                    _HOVER_BIT: hover_brush,
+                    _SEL_BIT: sel_brush,
+                    _HOVER_BIT | _SEL_BIT: sel_brush,
+                },
+            }
+            self._style_cache[theme_name] = style
+        return style
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), 40)
+
+    def paint(self, painter, option, index):
+        clip = painter.clipBoundingRect()
+        if not clip.isNull() and not clip.intersects(QRectF(option.rect)):
+            return
+        # Only pen, brush and font change below; restoring those three beats
+        # QPainter.save() copying the full painter state every row.
+        old_pen, old_brush, old_font = painter.pen(), painter.brush(), painter.font()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        rect = option.rect
+        item_data = index.data(Qt.ItemDataRole.UserRole)
+        style = self._current_style()
+
+        # Skip separators
+        if item_data and item_data.get('is_separator'):
+            # Draw separator line
+            painter.setPen(style['sep_pen'])
+            y = rect.center().y()
+            painter.drawLine(rect.left() + 20, y, rect.right() - 20, y)
+
+            # Draw separator text
+            painter.setPen(style['text_secondary'])
+            painter.setFont(self._font_separator)
+            text_rect = rect.adjusted(0, -5, 0, -5)
+            painter.drawText(text_rect, Qt.AlignmentFlag.AlignCenter, item_data.get('text', ''))
+            painter.setPen(old_pen); painter.setBrush(old_brush); painter.setFont(old_font)
+            return
+
+        # Background, resolved by one mask lookup instead of two bit tests
+        bg_brush = style['state_brush'][option.state.value & _HOVER_SEL_MASK]
+        if bg_brush is not None:
+            painter.setBrush(bg_brush)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.drawRoundedRect(rect.adjusted(4, 2, -4, -2), 6, 6)
+        
+        # Get platform info
+        platform_name = index.data(Qt.ItemDataRole.DisplayRole)
+        if not platform_name:
+            painter.setPen(old_pen); painter.setBrush(old_brush); painter.setFont(old_font)
+            return
+        
+        # Extract actual name, count, and emoji in one cached parse
+        name_part, count_part, icon_text = _parse_platform_label(platform_name)
+
+        # Icon
+        icon_rect = QRect(rect.left() + self.padding, rect.top() + (rect.height() - self.icon_size) // 2,
+                         self.icon_size, self.icon_size)
+
+        # Draw emoji icon or colored circle
+        painter.setFont(self._font_emoji)
+        painter.setPen(style['text_primary'])
+        static = self._static_text(icon_text, self._font_emoji)
+        painter.drawStaticText(QPointF(icon_rect.x() + (icon_rect.width() - static.size().width()) / 2,
+                                       icon_rect.y() + (icon_rect.height() - static.size().height()) / 2), static)
+
+        # Platform color indicator
+        platform_color = self._platform_colors.get(name_part)
+        if platform_color is not None:
+            color_indicator = QRect(rect.left() + 2, rect.top() + 8, 3, rect.height() - 16)
+            painter.setBrush(platform_color)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.drawRoundedRect(color_indicator, 2, 2)
+
+        # Text
+        text_rect = QRect(icon_rect.right() + 8, rect.top(),
+                         rect.width() - icon_rect.width() - self.padding * 3 - 40, rect.height())
+
+        painter.setFont(self._font_name)
+        painter.setPen(style['text_primary'])
+        static = self._static_text(name_part, self._font_name)
+        painter.drawStaticText(QPointF(text_rect.x(), text_rect.y() + (text_rect.height() - static.size().height()) / 2), static)
+        
+        # Count badge
+        if count_part:
+            badge_width = 35
+            badge_rect = QRect(rect.right() - badge_width - self.padding, 
+                             rect.top() + (rect.height() - 22) // 2, badge_width, 22)
+            
+            # Badge background
+            painter.setBrush(style['accent'])
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.drawRoundedRect(badge_rect, 11, 11)
+
+            # Badge text
+            painter.setFont(self._font_badge)
+            painter.setPen(self._white_pen)
+            static = self._static_text(count_part, self._font_badge)
+            painter.drawStaticText(QPointF(badge_rect.x() + (badge_rect.width() - static.size().width()) / 2,
+                                           badge_rect.y() + (badge_rect.height() - static.size().height()) / 2), static)
+
+        painter.setPen(old_pen); painter.setBrush(old_brush); painter.setFont(old_font)
+
+class EmulatorTreeDelegate(_ThemeAwareDelegate):
+    """Modern card-style delegate for emulator tree items"""
+
+    STATUS_CONFIGURED = "✓ Configured"
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.padding = 12
+        self.icon_size = 32
+        self._font_header = QFont("Segoe UI", 11, QFont.Weight.Bold)
+        self._font_emoji = QFont("Segoe UI Emoji", 24)
+        self._font_status = QFont("Segoe UI", 8, QFont.Weight.Medium)
+        self._size_cache = {}  # (width, height) -> shared QSize for sizeHint
+
+    def _theme_style(self, theme_name, colors):
+        style = self._style_cache.get(theme_name)
+        if style is None:
+            # Header background: a 1px-wide vertical gradient strip rendered
+            # once and tiled across the row, so headers are a single blit.
+            header_tile = QPixmap(1, 50)
+            gradient = QLinearGradient(0, 0, 0, 50)
+            gradient.setColorAt(0, QColor(colors['C_BACKGROUND_LIGHT']))
+            gradient.setColorAt(1, QColor(colors['C_BACKGROUND_DARK']))
+            tile_painter = QPainter(header_tile)
+            tile_painter.fillRect(0, 0, 1, 50, gradient)
+            tile_painter.end()
+            sel_gradient = QLinearGradient(0, 0, 1, 0)
+            sel_gradient.setCoordinateMode(QGradient.CoordinateMode.ObjectBoundingMode)
+            sel_gradient.setColorAt(0, QColor(colors['C_HIGHLIGHT_BLUE']))
+            sel_gradient.setColorAt(0.5, QColor(colors['C_ACCENT']))
+            sel_gradient.setColorAt(1, QColor(colors['C_HIGHLIGHT_BLUE']))
+            style = {
+                'header_tile': header_tile,
+                'hl_cyan': QColor(colors['C_HIGHLIGHT_CYAN']),
+                'text_primary': QColor(colors['C_TEXT_PRIMARY']),
+                'success': QColor(colors['C_SUCCESS']),
+                'border_pen': QPen(QColor(colors['C_BORDER']), 1),
+            }
+            # Card brush/pen per hover/selection mask; selection wins over
+            # hover, matching the old if/elif chain.
+            sel_state = (QBrush(sel_gradient), QPen(QColor(colors['C_HIGHLIGHT_CYAN']), 2))
+            hover_state = (QBrush(QColor(colors['C_BACKGROUND_LIGHT'])), QPen(QColor(colors['C_BORDER']), 2))
+            normal_state = (QBrush(QColor(colors['C_BACKGROUND_WIDGET'])), style['border_pen'])
+            style['card_states'] = {
+                0: normal_state,
+                _HOVER_BIT: hover_state,
+                _SEL_BIT: sel_state,
+                _HOVER_BIT | _SEL_BIT: sel_state,
+            }
+            self._style_cache[theme_name] = style
+        return style
+
+    def sizeHint(self, option, index):
+        # Parent rows are 50px, child cards 70px; hand back cached QSize
+        # objects instead of allocating one per row on every relayout.
+        width = option.rect.width()
+        height = 50 if not index.parent().isValid() else 70
+        size = self._size_cache.get((width, height))
+        if size is None:
+            size = self._size_cache[(width, height)] = QSize(width, height)
+        return size
+    
+    def paint(self, painter, option, index):
+        clip = painter.clipBoundingRect()
+        if not clip.isNull() and not clip.intersects(QRectF(option.rect)):
+            return
+        old_pen, old_brush, old_font = painter.pen(), painter.brush(), painter.font()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        style = self._current_style()
+        rect = option.rect
+        is_parent = not index.parent().isValid()
+
+        # Platform header styling (parent items)
+        if is_parent:
+            # Background gradient, pre-rendered as a 1px tile
+            painter.drawTiledPixmap(rect, style['header_tile'])
+
+            # Bottom border
+            painter.setPen(style['border_pen'])
+            painter.drawLine(rect.bottomLeft(), rect.bottomRight())
+
+            # Text
+            text = index.data(Qt.ItemDataRole.DisplayRole)
+            painter.setFont(self._font_header)
+            painter.setPen(style['hl_cyan'])
+            text_rect = rect.adjusted(self.padding, 0, -self.padding, 0)
+            static = self._static_text(f"📁 {text}", self._font_header)
+            painter.drawStaticText(QPointF(text_rect.x(), text_rect.y() + (text_rect.height() - static.size().height()) / 2), static)
+
+        # Emulator card styling (child items)
+        else:
+            # Card background
+            card_rect = rect.adjusted(8, 4, -8, -4)
+
+            brush, pen = style['card_states'][option.state.value & _HOVER_SEL_MASK]
+            painter.setBrush(brush)
+            painter.setPen(pen)
+            painter.drawRoundedRect(card_rect, 8, 8)
+
+            # Icon area
+            icon_rect = QRect(card_rect.left() + self.padding,
+                            card_rect.top() + (card_rect.height() - self.icon_size) // 2,
+                            self.icon_size, self.icon_size)
+
+            # Draw emulator icon
+            emulator_name = index.data(Qt.ItemDataRole.DisplayRole)
+            icon_emoji = self.get_emulator_icon(emulator_name)
+            painter.setFont(self._font_emoji)
+            painter.setPen(style['text_primary'])
+            static = self._static_text(icon_emoji, self._font_emoji)
+            painter.drawStaticText(QPointF(icon_rect.x() + (icon_rect.width() - static.size().width()) / 2,
+                                           icon_rect.y() + (icon_rect.height() - static.size().height()) / 2), static)
+
+            # Text area
+            text_x = icon_rect.right() + 12
+            text_rect = QRect(text_x, card_rect.top() + 8,
+                            card_rect.width() - (text_x - card_rect.left()) - self.padding, 24)
+
+            # Emulator name
+            painter.setFont(self._font_header)
+            painter.setPen(style['text_primary'])
+            painter.drawStaticText(QPointF(text_rect.topLeft()), self._static_text(emulator_name, self._font_header))
+
+            # Status indicator (bottom right)
+            painter.setFont(self._font_status)
+            painter.setPen(style['success'])
+            status_rect = QRect(text_x, card_rect.bottom() - 24,
+                              card_rect.width() - (text_x - card_rect.left()) - self.padding, 16)
+            static = self._static_text(self.STATUS_CONFIGURED, self._font_status)
+            painter.drawStaticText(QPointF(status_rect.x(), status_rect.y() + status_rect.height() - static.size().height()), static)
+
+        painter.setPen(old_pen); painter.setBrush(old_brush); painter.setFont(old_font)
+    
+    # Keyword -> emoji, scanned once per distinct name thanks to the cache.
+    # Order matters: first match wins, mirroring the old if/elif chain.
+    _EMU_ICON_TABLE = (
+        ('dolphin', '🐬'), ('pcsx2', '🎮'), ('rpcs3', '🎯'), ('xenia', '🟢'),
+        ('xemu', '🟢'), ('duckstation', '🦆'), ('ppsspp', '📱'), ('mgba', '👾'),
+        ('visualboy', '👾'), ('citra', '🍊'), ('cemu', '🎮'), ('snes', '🕹️'),
+        ('project64', '6️⃣4️⃣'),
+    )
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def get_emulator_icon(emulator_name):
+        """Return appropriate emoji icon for emulator"""
+        name_lower = emulator_name.lower()
+        for keyword, emoji in EmulatorTreeDelegate._EMU_ICON_TABLE:
+            if keyword in name_lower:
+                return emoji
+        return '🎮'
+
+
+
+# =============================================================================
+# --- GAME LIST MODEL ---
+# =============================================================================
+
+class GamesModel(QAbstractListModel):
+    """List model over plain game dicts. The view only asks for visible rows,
+    so repopulating becomes a model reset instead of one QListWidgetItem
+    allocation (plus icon build and path stat) per game."""
+
+    def __init__(self, icon_provider, parent=None):
+        super().__init__(parent)
+        self._games = []
+        self._row_by_hash = {}
+        self._exists_cache = {}
+        # QBrush is implicitly shared; one instance serves every missing row.
+        self._missing_brush = QBrush(QColor("red"))
+        self._icon_provider = icon_provider
+
+    def set_games(self, games):
+        self.beginResetModel()
+        self._games = games
+        self._row_by_hash = {game['hash']: row for row, game in enumerate(games)}
+        self._exists_cache.clear()
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._games)
+
+    def row_for_hash(self, game_hash):
+        return self._row_by_hash.get(game_hash, -1)
+
+    def refresh_game(self, game_hash):
+        # One-row dataChanged so a state flip repaints just that item.
+        row = self._row_by_hash.get(game_hash)
+        if row is None:
+            return False
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+        return True
+
+    def _exists(self, game):
+        # Freshly scanned games carry a scan-time flag; only cache-loaded
+        # entries without one need an os.path.exists probe.
+        exists = game.get('exists')
+        if exists is None:
+            exists = self._exists_cache.get(game['hash'])
+            if exists is None:
+                exists = os.path.exists(game['path'])
+                self._exists_cache[game['hash']] = exists
+        return exists
+
+    def flags(self, index):
+        flags = super().flags(index)
+        if index.isValid() and not self._exists(self._games[index.row()]):
+            flags &= ~Qt.ItemFlag.ItemIsEnabled
+        return flags
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        row = index.row()
+        if not index.isValid() or not 0 <= row < len(self._games):
+            return None
+        game = self._games[row]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return game['title'] if self._exists(game) else f"[MISSING] {game['title']}"
+        if role == Qt.ItemDataRole.UserRole:
+            return game
+        if role == Qt.ItemDataRole.DecorationRole:
+            return self._icon_provider(game)
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return game['title']
+        if role == Qt.ItemDataRole.ForegroundRole and not self._exists(game):
+            return self._missing_brush
+        return None
+
+# =============================================================================
+# --- CONTROLLER SUPPORT ---
+# =============================================================================
+
+class ControllerHandler(QThread):
+    """Handle controller input for navigation"""
+    button_pressed = pyqtSignal(str)
+    
+    def __init__(self, deadzone=0.2):
+        super().__init__()
+        self.deadzone = deadzone
+        self.running = False
+        self.joystick = None
+        
+    def run(self):
+        """Poll controller in background thread"""
+        try:
+            import pygame
+            pygame.init()
+            pygame.joystick.init()
+            
+            if pygame.joystick.get_count() == 0:
+                return
+            
+            self.joystick = pygame.joystick.Joystick(0)
+            self.joystick.init()
+            self.running = True
+            
+            last_axis = {0: 0, 1: 0}
+            axis_pressed = {0: False, 1: False}
+            
+            while self.running:
+                for event in pygame.event.get():
+                    if event.type == pygame.JOYBUTTONDOWN:
+                        # Map common buttons
+                        button_map = {
+                            0: 'A',  # A/Cross
+                            1: 'B',  # B/Circle
+                            2: 'X',  # X/Square
+                            3: 'Y',  # Y/Triangle
+                            4: 'LB',
+                            5: 'RB',
+                            6: 'Back',
+                            7: 'Start',
+                            8: 'LS',
+                            9: 'RS'
+                        }
+                        if event.button in button_map:
+                            self.button_pressed.emit(button_map[event.button])
+                    
+                    elif event.type == pygame.JOYHATMOTION:
+                        # D-pad
+                        x, y = event.value
+                        if x == -1:
+                            self.button_pressed.emit('Left')
+                        elif x == 1:
+                            self.button_pressed.emit('Right')
+                        if y == 1:
+                            self.button_pressed.emit('Up')
+                        elif y == -1:
+                            self.button_pressed.emit('Down')
+                
+                # Analog stick as D-pad
+                if self.joystick:
+                    # Left stick X axis
+                    x_axis = self.joystick.get_axis(0)
+                    if abs(x_axis) > self.deadzone:
+                        if not axis_pressed[0]:
+                            if x_axis < -self.deadzone:
+                                self.button_pressed.emit('Left')
+                            elif x_axis > self.deadzone:
+                                self.button_pressed.emit('Right')
+                            axis_pressed[0] = True
+                    else:
+                        axis_pressed[0] = False
+                    
+                    # Left stick Y axis
+                    y_axis = self.joystick.get_axis(1)
+                    if abs(y_axis) > self.deadzone:
+                        if not axis_pressed[1]:
+                            if y_axis < -self.deadzone:
+                                self.button_pressed.emit('Up')
+                            elif y_axis > self.deadzone:
+                                self.button_pressed.emit('Down')
+                            axis_pressed[1] = True
+                    else:
+                        axis_pressed[1] = False
+                
+                time.sleep(0.1)  # Poll 10 times per second
+                
+        except ImportError:
+            pass  # pygame not installed
+        except Exception:
+            pass
+    
+    def stop(self):
+        self.running = False
+
+# =============================================================================
+# --- CONFIGURATION MANAGER ---
+# =============================================================================
+class ConfigManager:
+    # Frequently-mutated library state is serialized to its own file so a
+    # favorite toggle or playtime update rewrites kilobytes, not the whole
+    # settings blob. self.config stays one merged dict for callers.
+    HOT_KEYS = ("favorites", "recently_played", "game_metadata", "game_tags",
+                "collections", "custom_covers", "total_playtime")
+
+    def __init__(self):
+        config_dir = Path(QStandardPaths.writableLocation(QStandardPaths.StandardLocation.AppLocalDataLocation)) / "EmulatorHub"
+        self.covers_dir = config_dir / "covers"; self.cache_dir = self.covers_dir / "cache"
+        self.save_states_dir = config_dir / "save_states"
+        config_dir.mkdir(parents=True, exist_ok=True); self.covers_dir.mkdir(exist_ok=True)
+        self.cache_dir.mkdir(exist_ok=True); self.save_states_dir.mkdir(exist_ok=True)
+        self.config_path = config_dir / "config.json"
+        self.library_state_path = config_dir / "library_state.json"
+        # Saves are debounced: interactive actions mark a section dirty and
+        # the actual disk write happens at most once per interval.
+        self._dirty_settings = False
+        self._dirty_library = False
+        self._save_timer = QTimer()
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(1500)
+        self._save_timer.timeout.connect(self._do_save)
+        self.config = {
+            "game_library_paths": [], "emulators": {}, "custom_covers": {},
+            "game_metadata": {}, "theme": "Modern Dark", "view_mode": "grid",
+            "grid_icon_size": 150, "list_icon_size": 48, "favorites": [],
+            "recently_played": [], "window_geometry": "", "window_state": "",
+            "splitter_state": "", "sort_order": "Name", "platform_defaults": {},
+            "details_panel_visible": True, "selected_platform_filter": "All Platforms",
+            "auto_backup": True, "last_scan_date": "", "total_playtime": 0,
+            "collections": {}, "game_tags": {}, "hotkeys": {}, "performance_mode": "balanced",
+            "scan_parallelism": 8, "last_system": "",
+            "controller_enabled": True, "controller_deadzone": 0.2,
+            "rawg_api_key": "", "auto_fetch_metadata": False,
+            "save_states_path": ""
+        }
+        self.load_config()
+    def load_config(self):
+        if self.config_path.exists():
+            self.config.update(json_loads(self.config_path.read_bytes()))
+        # Hot state merges on top; configs written before the split still
+        # carry these keys in config.json and migrate on the next save.
+        if self.library_state_path.exists():
+            self.config.update(json_loads(self.library_state_path.read_bytes()))
+    def save_config(self):
+        self._dirty_settings = True
+        self._dirty_library = True
+        self._save_timer.start()
+    def save_library_state(self):
+        # For mutators that only touch HOT_KEYS (favorites, playtime, ...).
+        self._dirty_library = True
+        self._save_timer.start()
+    def flush(self):
+        self._save_timer.stop()
+        self._do_save()
+    def _do_save(self):
+        if self._dirty_settings:
+            self._dirty_settings = False
+            cold = {k: v for k, v in self.config.items() if k not in self.HOT_KEYS}
+            self._write_json(self.config_path, cold)
+        if self._dirty_library:
+            self._dirty_library = False
+            hot = {k: self.config[k] for k in self.HOT_KEYS if k in self.config}
+            self._write_json(self.library_state_path, hot)
+    @staticmethod
+    def _write_json(path, payload):
+        tmp_path = path.with_suffix('.json.tmp')
+        # Both files stay indented — users do hand-edit them.
+        if orjson is not None:
+            tmp_path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+        else:
+            with open(tmp_path, 'w') as f: json.dump(payload, f, indent=4)
+        os.replace(tmp_path, path)
+
+# =============================================================================
+# --- BACKEND LOGIC ---
+# =============================================================================
+class EmulatorHubBackend:
+    # v3: game hashes switched from 32-char MD5 to 16-char BLAKE2b keys.
+    # v4: cache moved from a JSON blob to an SQLite store (one row per game).
+    CACHE_SCHEMA_VERSION = 4
+
+    def __init__(self, config_manager: ConfigManager):
+        self.config_manager = config_manager; self.games_by_platform = {}; self.all_games_map = {}
+        self.cache_path = self.config_manager.covers_dir.parent / "game_cache.sqlite"
+        self._cache_conn = None
+        legacy_cache = self.config_manager.covers_dir.parent / "game_cache.json"
+        if legacy_cache.exists(): legacy_cache.unlink()
+        self._sorted_cache = {}  # (category, sort key) -> pre-sorted game list
+        self._favorites = set(self.config_manager.config.get('favorites', []))
+        self._emus_by_system = None  # lowercase system -> [{name, config}], lazy
+        self.PLATFORM_FOLDER_MAP = {"gamecube": "GameCube", "gc": "GameCube", "wii": "Wii", "playstation 2": "PlayStation 2", "ps2": "PlayStation 2", "playstation 3": "PlayStation 3", "ps3": "PlayStation 3", "nintendo switch": "Nintendo Switch", "switch": "Nintendo Switch", "playstation": "PlayStation", "psx": "PlayStation", "ps1": "PlayStation", "psp": "PSP", "playstation portable": "PSP", "xbox": "Xbox", "xbox 360": "Xbox 360", "x360": "Xbox 360", "nintendo 3ds": "Nintendo 3DS", "3ds": "Nintendo 3DS", "nintendo ds": "Nintendo DS", "ds": "Nintendo DS", "dreamcast": "Dreamcast", "dc": "Dreamcast", "super nintendo": "Super Nintendo", "snes": "Super Nintendo", "sega genesis": "Sega Genesis", "genesis": "Sega Genesis", "mega drive": "Sega Genesis", "turbografx-16": "TurboGrafx-16", "pc engine": "TurboGrafx-16", "game boy": "Game Boy", "gb": "Game Boy", "game boy color": "Game Boy Color", "gbc": "Game Boy Color", "game boy advance": "Game Boy Advance", "gba": "Game Boy Advance", "sega game gear": "Sega Game Gear", "gg": "Sega Game Gear", "atari lynx": "Atari Lynx", "lynx": "Atari Lynx"}
+        self.GAME_EXTENSIONS = {
+            ".exe": "PC",
+            ".lnk": "PC",
+            ".url": "PC",
+            ".iso": "PlayStation 2", 
+            ".pkg": "PlayStation 3",
+            ".xiso.iso": "Xbox", 
+            ".gcz": "GameCube", 
+            ".rvz": "GameCube", 
+            ".wbfs": "Wii", 
+            ".chd": "PlayStation", 
+            ".cue": "PlayStation", 
+            ".bin": "PlayStation", 
+            ".cso": "PSP", 
+            ".3ds": "Nintendo 3DS", 
+            ".cci": "Nintendo 3DS", 
+            ".nds": "Nintendo DS", 
+            ".gdi": "Dreamcast", 
+            ".cdi": "Dreamcast",
+            ".z64": "Nintendo 64",
+            ".sfc": "Super Nintendo",
+            ".smc": "Super Nintendo",
+            ".md": "Sega Genesis",
+            ".smd": "Sega Genesis",
+            ".gen": "Sega Genesis",
+            ".pce": "TurboGrafx-16",
+            ".gb": "Game Boy",
+            ".gbc": "Game Boy Color",
+            ".gba": "Game Boy Advance",
+            ".gg": "Sega Game Gear",
+            ".lnx": "Atari Lynx"
+        }
+        self.KNOWN_EMULATORS = {
+            # Handhelds
+            "mGBA": {"executables": ["mgba"], "systems": ["Game Boy", "Game Boy Color", "Game Boy Advance"]},
+            "VisualBoyAdvance-M": {"executables": ["visualboyadvance-m", "vbam"], "systems": ["Game Boy", "Game Boy Color", "Game Boy Advance"]},
+            "SameBoy": {"executables": ["sameboy"], "systems": ["Game Boy", "Game Boy Color"]},
+            # 4th Generation
+            "Snes9x": {"executables": ["snes9x"], "systems": ["Super Nintendo"]},
+            "Mesen": {"executables": ["mesen"], "systems": ["Super Nintendo"]},
+            "Kega Fusion": {"executables": ["fusion"], "systems": ["Sega Genesis", "Sega Game Gear"]},
+            "BlastEm": {"executables": ["blastem"], "systems": ["Sega Genesis"]},
+            # 6th Generation
+            "Dolphin": {"executables": ["dolphin"], "systems": ["GameCube", "Wii"]}, 
+            "PCSX2": {"executables": ["pcsx2", "pcsx2-qt"], "systems": ["PlayStation 2"]}, 
+            "Xemu": {"executables": ["xemu"], "systems": ["Xbox"]},
+            "Redream": {"executables": ["redream"], "systems": ["Dreamcast"]},
+            "Flycast": {"executables": ["flycast"], "systems": ["Dreamcast"]},
+            
+            # 5th Generation
+            "DuckStation": {"executables": ["duckstation-qt", "duckstation-nogui"], "systems": ["PlayStation"]}, 
+            "Project64": {"executables": ["project64"], "systems": ["Nintendo 64"]},
+            "simple64": {"executables": ["simple64-gui", "simple64-cli"], "systems": ["Nintendo 64"]},
+            "Mednafen": {"executables": ["mednafen"], "systems": ["PlayStation", "Sega Saturn", "Super Nintendo", "Sega Genesis", "TurboGrafx-16", "Atari Lynx"]},
+            "YabaSanshiro": {"executables": ["yabasanshiro"], "systems": ["Sega Saturn"]},
+            "Kronos": {"executables": ["kronos"], "systems": ["Sega Saturn"]},
+            
+            # Other Previously Added Emulators
+            "RPCS3": {"executables": ["rpcs3"], "systems": ["PlayStation 3"]},
+            "Xenia": {"executables": ["xenia"], "systems": ["Xbox 360"]}
+        }
+        # Flat known-exe -> emulator index so detection is one pass over the
+        # filename instead of a nested walk of KNOWN_EMULATORS per call.
+        self._exe_index = {exe.lower(): (name, data)
+                           for name, data in self.KNOWN_EMULATORS.items()
+                           for exe in data["executables"]}
+        self._exe_tokens = tuple(self._exe_index.keys())
+
+    @staticmethod
+    def annotate_game(game):
+        # Precompute the case-folded title once so sorting and the search
+        # filter are plain dict reads instead of per-keystroke str.lower calls.
+        game['title_lower'] = game['title'].lower()
+        return game
+
+    def resolve_cover_path(self, game):
+        # Resolve the custom cover (thumbnail preferred) once, off the UI
+        # thread where possible, so repopulate never stats per game.
+        cover_name = self.config_manager.config["custom_covers"].get(game.get('hash'))
+        path = None
+        if cover_name:
+            thumb = self.config_manager.cache_dir / cover_name
+            if thumb.is_file():
+                path = thumb
+            else:
+                full = self.config_manager.covers_dir / cover_name
+                if full.is_file():
+                    path = full
+        game['cover_path'] = str(path) if path else None
+        return game['cover_path']
+
+    def _cache_connection(self):
+        if self._cache_conn is None:
+            # check_same_thread=False: the CacheLoader thread opens the
+            # connection at startup, later saves reuse it from the UI thread.
+            # Access is never concurrent (load finishes before any save).
+            conn = sqlite3.connect(self.cache_path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS games("
+                         "hash TEXT PRIMARY KEY, platform TEXT, title TEXT, path TEXT, "
+                         "size INTEGER, mtime INTEGER, json TEXT) WITHOUT ROWID")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_platform ON games(platform)")
+            self._cache_conn = conn
+        return self._cache_conn
+
+    def load_from_cache(self):
+        if not self.cache_path.exists():
+            return False
+        try:
+            conn = self._cache_connection()
+            if conn.execute("PRAGMA user_version").fetchone()[0] != self.CACHE_SCHEMA_VERSION:
+                self.clear_cache()
+                return False
+            self.all_games_map = {}
+            self._sorted_cache.clear()
+            # Bind the per-game calls once; with thousands of rows the
+            # attribute lookups and the two-probe dict branch add up.
+            annotate, resolve = self.annotate_game, self.resolve_cover_path
+            by_platform = defaultdict(list)
+            for (payload,) in conn.execute("SELECT json FROM games"):
+                game = annotate(json_loads(payload))
+                resolve(game)
+                self.all_games_map[game['hash']] = game
+                by_platform[game['platform']].append(game)
+            self.games_by_platform.clear()
+            self.games_by_platform.update(by_platform)
+            return bool(self.all_games_map)
+        except (sqlite3.Error, ValueError, KeyError):
+            self.clear_cache()
+            return False
+
+    # Runtime-only keys that load_from_cache recomputes (annotate_game,
+    # resolve_cover_path) or probes fresh (exists); persisting them would make
+    # stale values authoritative on the next startup.
+    _TRANSIENT_KEYS = ('exists', 'title_lower', 'cover_path')
+
+    def save_to_cache(self):
+        conn = self._cache_connection()
+        def payload(game):
+            slim = {k: v for k, v in game.items() if k not in self._TRANSIENT_KEYS}
+            return json_dumps(slim)
+        rows = [(g['hash'], g['platform'], g['title'], g['path'], g.get('size', 0), g.get('mtime', 0), payload(g))
+                for g in self.all_games_map.values()]
+        with conn:
+            conn.executemany("INSERT OR REPLACE INTO games VALUES (?,?,?,?,?,?,?)", rows)
+            stale = [(h,) for (h,) in conn.execute("SELECT hash FROM games") if h not in self.all_games_map]
+            if stale:
+                conn.executemany("DELETE FROM games WHERE hash=?", stale)
+            conn.execute(f"PRAGMA user_version = {self.CACHE_SCHEMA_VERSION}")
+
+    def clear_cache(self):
+        if self._cache_conn is not None:
+            self._cache_conn.close()
+            self._cache_conn = None
+        for sidecar in ("", "-wal", "-shm"):
+            stale_path = Path(str(self.cache_path) + sidecar)
+            if stale_path.exists():
+                stale_path.unlink()
+
+    def _dir_size(self, path):
+        """Total size of a directory tree via os.scandir, using the stat info
+        cached on each DirEntry instead of two pathlib stats per file."""
+        total = 0
+        stack = [path]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                stack.append(entry.path)
+                            else:
+                                total += entry.stat(follow_symlinks=False).st_size
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+        return total
+
+    def set_custom_game_image(self, game_hash, image_path):
+        try:
+            from PIL import Image
+        except ImportError:
+            return False, "Pillow library is required. Please run: pip install Pillow"
+        source_path = Path(image_path)
+        if source_path.suffix.lower() not in ['.png', '.jpg', '.jpeg', '.webp']:
+             return False, "Unsupported image format."
+        try:
+            new_name = f"{game_hash}{source_path.suffix}"; dest_path = self.config_manager.covers_dir / new_name
+            shutil.copy(source_path, dest_path); thumb_path = self.config_manager.cache_dir / new_name
+            QThreadPool.globalInstance().start(ThumbnailTask(dest_path, thumb_path))
+            self.config_manager.config["custom_covers"][game_hash] = new_name; self.config_manager.save_library_state()
+            # Re-resolve the stored cover path; the window drops its cached
+            # icon for this game so the new cover is decoded on next paint.
+            game = self.all_games_map.get(game_hash)
+            if game:
+                self.resolve_cover_path(game)
+            return True, "Set new custom cover image."
+        except Exception as e:
+            return False, f"Could not save image cover: {e}"
+            
+    def _clean_game_title(self, filename):
+        return _clean_game_title(filename)
+    def launch_game(self, game_hash, chosen_emulator_config=None):
+        game_data = self.all_games_map.get(game_hash);
+        if not game_data: return None, "Game data not found."
+        
+        # PC games don't need emulators
+        if game_data['platform'] in ['PC', 'Windows']:
+            return self._launch_pc_game(game_data)
+        
+        if not chosen_emulator_config:
+            return None, "No emulator configuration provided."
+        
+        emulator_path = chosen_emulator_config['path']; launch_args = chosen_emulator_config.get('args', '')
+        path_to_launch = self._get_launchable_path(game_data)
+        if not path_to_launch: return None, "Could not determine a launchable file for this game."
+        command = self._build_launch_command(emulator_path, launch_args, path_to_launch)
+        try:
+            process = subprocess.Popen(command); self.add_to_recently_played(game_data['hash']); return process, f"Launching {game_data['title']}..."
+        except Exception as e:
+            return None, f"Failed to start emulator: {e}"
+    
+    def _launch_pc_game(self, game_data):
+        """Launch PC game directly without emulator"""
+        game_path = game_data['path']
+        
+        try:
+            # Handle .lnk shortcuts
+            if game_path.lower().endswith('.lnk'):
+                # Use Windows shell to open the shortcut
+                import ctypes
+                ctypes.windll.shell32.ShellExecuteW(None, "open", game_path, None, None, 1)
+                self.add_to_recently_played(game_data['hash'])
+                return True, f"Launching {game_data['title']}..."
+            
+            # Handle .url files
+            elif game_path.lower().endswith('.url'):
+                os.startfile(game_path)
+                self.add_to_recently_played(game_data['hash'])
+                return True, f"Launching {game_data['title']}..."
+            
+            # Handle .exe files
+            elif game_path.lower().endswith('.exe'):
+                # Get the directory of the exe for working directory
+                work_dir = os.path.dirname(game_path)
+                process = subprocess.Popen([game_path], cwd=work_dir)
+                self.add_to_recently_played(game_data['hash'])
+                return process, f"Launching {game_data['title']}..."
+            
+            # Handle folders (look for common executable names)
+            elif os.path.isdir(game_path):
+                # Look for common game executable patterns in a single
+                # scandir pass: prefer game*.exe (stop as soon as one turns
+                # up), then launch*.exe, then the first .exe found.
+                launch_exe = first_exe = None
+                exe_name = None
+                with os.scandir(game_path) as entries:
+                    for entry in entries:
+                        name_lower = entry.name.lower()
+                        if not name_lower.endswith('.exe'):
+                            continue
+                        if 'game' in name_lower:
+                            exe_name = entry.name
+                            break
+                        if launch_exe is None and 'launch' in name_lower:
+                            launch_exe = entry.name
+                        elif first_exe is None:
+                            first_exe = entry.name
+                if exe_name is None:
+                    exe_name = launch_exe or first_exe
+                if exe_name:
+                    exe_path = os.path.join(game_path, exe_name)
+                    process = subprocess.Popen([exe_path], cwd=game_path)
+                    self.add_to_recently_played(game_data['hash'])
+                    return process, f"Launching {game_data['title']}..."
+                else:
+                    return None, "No executable found in game folder."
+            
+            return None, "Unsupported PC game file type."
+            
+        except Exception as e:
+            return None, f"Failed to launch PC game: {e}"
+    def _get_launchable_path(self, game_data):
+        if game_data['platform'] == "PlayStation 3":
+            path_obj = Path(game_data['path'])
+            if path_obj.is_dir():
+                eboot_path = path_obj / 'PS3_GAME' / 'USRDIR' / 'EBOOT.BIN'
+                if eboot_path.exists():
+                    return str(eboot_path)
+                if (path_obj / 'PS3_GAME').exists():
+                    return str(path_obj)
+                return None
+        return game_data['path']
+    def _build_launch_command(self, emulator_path, args_str, game_path):
+        norm_emulator_path = os.path.normpath(emulator_path); norm_game_path = os.path.normpath(game_path)
+        command = [norm_emulator_path]
+        if args_str:
+            if '%ROM%' in args_str:
+                full_args_str = args_str.replace('%ROM%', f'"{norm_game_path}"'); command.extend(shlex.split(full_args_str))
+            else:
+                command.extend(shlex.split(args_str)); command.append(norm_game_path)
+        else:
+            command.append(norm_game_path)
+        return command
+    def is_favorite(self, game_hash): return game_hash in self._favorites
+    def toggle_favorite(self, game_hash):
+        # The set answers is_favorite in O(1); the config list keeps its
+        # insertion order for the JSON file.
+        favorites = self.config_manager.config['favorites']
+        if game_hash in self._favorites:
+            self._favorites.discard(game_hash); favorites.remove(game_hash)
+        else:
+            self._favorites.add(game_hash); favorites.append(game_hash)
+        self.invalidate_sorted_games(category=Constants.FAVORITES_CATEGORY)
+        self.config_manager.save_library_state()
+    def add_to_recently_played(self, game_hash):
+        recents = self.config_manager.config.get('recently_played', [])
+        if game_hash in recents: recents.remove(game_hash)
+        recents.insert(0, game_hash); self.config_manager.config['recently_played'] = recents[:20]
+        self.invalidate_sorted_games(category=Constants.RECENTS_CATEGORY)
+        self.config_manager.save_library_state()
+    def _games_for_hashes(self, hashes):
+        # One dict probe per hash instead of a membership test plus a lookup.
+        lookup = self.all_games_map.get
+        games = []
+        for game_hash in hashes:
+            game = lookup(game_hash)
+            if game is not None:
+                games.append(game)
+        return games
+    def get_favorite_games(self): return self._games_for_hashes(self.config_manager.config['favorites'])
+    def get_recently_played_games(self): return self._games_for_hashes(self.config_manager.config['recently_played'])
+
+    def sorted_games(self, category, sort_key):
+        # Memoized per (category, sort key): the orderings only change when the
+        # library or the sorted-on field does, not on every repopulate.
+        cached = self._sorted_cache.get((category, sort_key))
+        if cached is not None:
+            return cached
+        if category == Constants.ALL_GAMES_CATEGORY: games = list(self.all_games_map.values())
+        elif category == Constants.FAVORITES_CATEGORY: games = self.get_favorite_games()
+        elif category == Constants.RECENTS_CATEGORY: games = self.get_recently_played_games()
+        else: games = list(self.games_by_platform.get(category, []))
+        if sort_key == "Name": games.sort(key=lambda g: g.get('title_lower') or g['title'].lower())
+        elif sort_key == "File Size (Asc)": games.sort(key=lambda g: g.get('size', 0))
+        elif sort_key == "Time Played": games.sort(key=lambda g: g.get('playtime', 0), reverse=True)
+        elif sort_key == "Date Added": games.sort(key=lambda g: g.get('date_added', 0), reverse=True)
+        else: games.sort(key=lambda g: g.get('size', 0), reverse=True)
+        self._sorted_cache[(category, sort_key)] = games
+        return games
+
+    def invalidate_sorted_games(self, category=None, sort_key=None):
+        if category is None and sort_key is None:
+            self._sorted_cache.clear()
+            return
+        for key in [k for k in self._sorted_cache
+                    if (category is None or k[0] == category) and (sort_key is None or k[1] == sort_key)]:
+            del self._sorted_cache[key]
+    def invalidate_emulator_index(self):
+        self._emus_by_system = None
+    def get_emulators_for_system(self, system: str) -> list:
+        if self._emus_by_system is None:
+            index = {}
+            for name, data in self.config_manager.config["emulators"].items():
+                entry = {"name": name, "config": data}
+                for supported in data.get("systems", []):
+                    index.setdefault(supported.lower(), []).append(entry)
+            self._emus_by_system = index
+        return self._emus_by_system.get(system.lower(), [])
+
+    # --- FIX: New, simpler, name-only detection logic ---
+    def detect_emulator_from_exe(self, exe_path):
+        """Detects an emulator by checking if known names are part of the exe filename."""
+        selected_exe_name = os.path.basename(exe_path).lower()
+
+        # Exact stem match first: "RPCS3.exe"/"mgba" resolve with one dict
+        # hit, so the substring scan below only runs for decorated names
+        # like "Dolphin-x64.exe".
+        hit = self._exe_index.get(os.path.splitext(selected_exe_name)[0])
+        if hit is None:
+            for known_exe in self._exe_tokens:
+                if known_exe in selected_exe_name:
+                    hit = self._exe_index[known_exe]
+                    break
+            else:
+                return None
+        emu_name, emu_data = hit
+        return {
+            "name": f"[Auto] {emu_name}",
+            "data": {
+                "path": exe_path,
+                "systems": emu_data["systems"],
+                "args": emu_data.get("default_args", "")
+            }
+        }
+        
+    def get_platform_from_path(self, path):
+        # Split the lowered string once instead of walking Path.parent, which
+        # allocates a Path object per level.
+        for segment in reversed(os.path.normpath(path).lower().split(os.sep)):
+            platform = self.PLATFORM_FOLDER_MAP.get(segment)
+            if platform: return platform
+        return None
+
+# =============================================================================
+# --- UI DIALOGS ---
+# =============================================================================
+# =============================================================================
+# --- UI DIALOGS ---
+# =============================================================================
+
+class SplashScreen(QWidget):
+    """Modern animated splash screen for app startup"""
+    def __init__(self):
+        super().__init__()
+        self.setWindowFlags(Qt.WindowType.FramelessWindowHint | Qt.WindowType.WindowStaysOnTopHint)
+        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
+        self.setFixedSize(500, 300)
+        
+        # Center on screen
+        screen = QApplication.primaryScreen().geometry()
+        self.move((screen.width() - self.width()) // 2, (screen.height() - self.height()) // 2)
+        
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(30, 30, 30, 30)
+        
+        # Title
+        title = QLabel(f"{Constants.APP_NAME}")
+        title.setFont(QFont("Segoe UI", 32, QFont.Weight.Bold))
+        title.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        title.setStyleSheet(f"color: {Constants.C_HIGHLIGHT_CYAN};")
+        
+        # Version
+        version = QLabel(f"Version {Constants.VERSION}")
+        version.setFont(QFont("Segoe UI", 14))
+        version.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        version.setStyleSheet(f"color: {Constants.C_TEXT_SECONDARY};")
+        
+        # Status label
+        self.status_label = QLabel("Initializing...")
+        self.status_label.setFont(QFont("Segoe UI", 10))
+        self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.status_label.setStyleSheet(f"color: {Constants.C_TEXT_PRIMARY};")
+        
+        # Progress bar
+        self.progress = QProgressBar()
+        self.progress.setRange(0, 0)  # Indeterminate
+        self.progress.setTextVisible(False)
+        self.progress.setFixedHeight(4)
+        self.progress.setStyleSheet(f"""
+            QProgressBar {{
+                background-color: {Constants.C_BACKGROUND_LIGHT};
+                border: none;
+                border-radius: 2px;
+            }}
+            QProgressBar::chunk {{
+                background-color: {Constants.C_HIGHLIGHT_CYAN};
+                border-radius: 2px;
+            }}
+        """)
+        
+        layout.addStretch()
+        layout.addWidget(title)
+        layout.addWidget(version)
+        layout.addSpacing(40)
+        layout.addWidget(self.status_label)
+        layout.addWidget(self.progress)
+        layout.addStretch()
+    
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        # Draw rounded background with gradient
+        from PyQt6.QtGui import QLinearGradient
+        gradient = QLinearGradient(0, 0, 0, self.height())
+        gradient.setColorAt(0, QColor(Constants.C_BACKGROUND_DARK))
+        gradient.setColorAt(1, QColor(Constants.C_BACKGROUND_LIGHT))
+        
+        painter.setBrush(QBrush(gradient))
+        painter.setPen(QPen(QColor(Constants.C_BORDER), 2))
+        painter.drawRoundedRect(self.rect(), 15, 15)
+    
+    def update_status(self, message):
+        self.status_label.setText(message)
+        QApplication.processEvents()
+
+class SettingsDialog(QDialog):
+    """Comprehensive settings dialog for all app configurations"""
+    def __init__(self, config_manager, parent=None):
+        super().__init__(parent)
+        self.config_manager = config_manager
+        self.setWindowTitle("Settings")
+        self.setMinimumSize(700, 500)
+        
+        layout = QVBoxLayout(self)
+        
+        # Tab widget for different settings categories
+        tabs = QTabWidget()
+        
+        # General Settings
+        general_tab = QWidget()
+        general_layout = QFormLayout(general_tab)
+        
+        self.auto_backup_check = QCheckBox("Enable automatic backups")
+        self.auto_backup_check.setChecked(config_manager.config.get("auto_backup", True))
+        general_layout.addRow("Backups:", self.auto_backup_check)
+        
+        self.performance_combo = QComboBox()
+        self.performance_combo.addItems(["Low", "Balanced", "High"])
+        self.performance_combo.setCurrentText(config_manager.config.get("performance_mode", "balanced").title())
+        general_layout.addRow("Performance Mode:", self.performance_combo)
+        
+        tabs.addTab(general_tab, "General")
+        
+        # Appearance Settings
+        appearance_tab = QWidget()
+        appearance_layout = QFormLayout(appearance_tab)
+        
+        self.theme_combo = QComboBox()
+        self.theme_combo.addItems(["Modern Dark", "Modern Light"])
+        self.theme_combo.setCurrentText(config_manager.config.get("theme", "Modern Dark"))
+        appearance_layout.addRow("Theme:", self.theme_combo)
+        
+        tabs.addTab(appearance_tab, "Appearance")
+        
+        # Hotkeys Settings
+        hotkeys_tab = QWidget()
+        hotkeys_layout = QFormLayout(hotkeys_tab)
+        hotkeys_layout.addRow(QLabel("Keyboard Shortcuts:"))
+        hotkeys_layout.addRow("Refresh Library:", QLabel("F5"))
+        hotkeys_layout.addRow("Search:", QLabel("Ctrl+F"))
+        hotkeys_layout.addRow("Toggle View:", QLabel("Ctrl+Tab"))
+        hotkeys_layout.addRow("Launch Game:", QLabel("Enter"))
+        hotkeys_layout.addRow("Delete Game:", QLabel("Delete"))
+        
+        tabs.addTab(hotkeys_tab, "Hotkeys")
+        
+        layout.addWidget(tabs)
+        
+        # Buttons
+        button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
+        button_box.accepted.connect(self.accept)
+        button_box.rejected.connect(self.reject)
+        layout.addWidget(button_box)
+    
+    def get_settings(self):
+        return {
+            "auto_backup": self.auto_backup_check.isChecked(),
+            "performance_mode": self.performance_combo.currentText().lower(),
+            "theme": self.theme_combo.currentText()
+        }
+
+class EnhancedGameInfoDialog(QDialog):
+    """Enhanced game info dialog with metadata editing"""
+    def __init__(self, game_data, backend, parent=None):
+        super().__init__(parent)
+        self.game_data = game_data
+        self.backend = backend
+        self.setWindowTitle(f"Game Info - {game_data.get('title', 'Unknown')}")
+        self.setMinimumSize(600, 500)
+        
+        layout = QVBoxLayout(self)
+        
+        # Top section with cover and basic info
+        top_layout = QHBoxLayout()
+        
+        # Cover image
+        cover_label = QLabel()
+        cover_label.setFixedSize(200, 267)
+        cover_label.setScaledContents(True)
+        cover_path = parent.get_cover_path_for_game(game_data) if parent else None
+        if cover_path:
+            pixmap = QPixmap(str(cover_path))
+            cover_label.setPixmap(pixmap.scaled(200, 267, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
+        else:
+            cover_label.setText("No Cover")
+            cover_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        
+        # Info section
+        info_layout = QFormLayout()
+        
+        self.title_edit = QLineEdit(game_data.get('title', ''))
+        info_layout.addRow("Title:", self.title_edit)
+        
+        platform_label = QLabel(game_data.get('platform', 'N/A'))
+        info_layout.addRow("Platform:", platform_label)
+        
+        size_label = QLabel(format_size(game_data.get('size', 0)))
+        info_layout.addRow("File Size:", size_label)
+        
+        playtime_label = QLabel(format_playtime(game_data.get('playtime', 0)))
+        info_layout.addRow("Time Played:", playtime_label)
+        
+        path_label = QLabel(game_data.get('path', 'N/A'))
+        path_label.setWordWrap(True)
+        info_layout.addRow("Location:", path_label)
+        
+        # Notes field
+        self.notes_edit = QLineEdit(game_data.get('notes', ''))
+        self.notes_edit.setPlaceholderText("Add notes about this game...")
+        info_layout.addRow("Notes:", self.notes_edit)
+        
+        # Tags
+        self.tags_edit = QLineEdit(game_data.get('tags', ''))
+        self.tags_edit.setPlaceholderText("Comma-separated tags...")
+        info_layout.addRow("Tags:", self.tags_edit)
+        
+        top_layout.addWidget(cover_label)
+        top_layout.addLayout(info_layout, 1)
+        layout.addLayout(top_layout)
+        
+        # Buttons
+        button_layout = QHBoxLayout()
+        
+        change_cover_btn = QPushButton("Change Cover...")
+        change_cover_btn.clicked.connect(self.change_cover)
+        button_layout.addWidget(change_cover_btn)
+        
+        button_layout.addStretch()
+        
+        save_btn = QPushButton("Save")
+        save_btn.clicked.connect(self.accept)
+        cancel_btn = QPushButton("Cancel")
+        cancel_btn.clicked.connect(self.reject)
+        
+        button_layout.addWidget(save_btn)
+        button_layout.addWidget(cancel_btn)
+        
+        layout.addLayout(button_layout)
+    
+    def change_cover(self):
+        image_path, _ = QFileDialog.getOpenFileName(self, "Select Cover Image", "", "Images (*.png *.jpg *.jpeg *.webp)")
+        if image_path:
+            success, message = self.backend.set_custom_game_image(self.game_data['hash'], image_path)
+            if success:
+                QMessageBox.information(self, "Success", "Cover image updated!")
+            else:
+                QMessageBox.critical(self, "Error", message)
+    
+    def get_metadata(self):
+        return {
+            "title": self.title_edit.text(),
+            "notes": self.notes_edit.text(),
+            "tags": self.tags_edit.text()
+        }
+
+class CollectionManagerDialog(QDialog):
+    """Dialog for managing game collections"""
+    def __init__(self, config_manager, parent=None):
+        super().__init__(parent)
+        self.config_manager = config_manager
+        self.setWindowTitle("Manage Collections")
+        self.setMinimumSize(500, 400)
+        
+        layout = QVBoxLayout(self)
+        
+        # Collections list
+        self.collections_list = QListWidget()
+        self.populate_collections()
+        layout.addWidget(QLabel("Your Collections:"))
+        layout.addWidget(self.collections_list)
+        
+        # Buttons
+        button_layout = QHBoxLayout()
+        
+        add_btn = QPushButton("New Collection...")
+        add_btn.clicked.connect(self.add_collection)
+        
+        rename_btn = QPushButton("Rename...")
+        rename_btn.clicked.connect(self.rename_collection)
+        
+        delete_btn = QPushButton("Delete")
+        delete_btn.clicked.connect(self.delete_collection)
+        
+        button_layout.addWidget(add_btn)
+        button_layout.addWidget(rename_btn)
+        button_layout.addWidget(delete_btn)
+        button_layout.addStretch()
+        
+        close_btn = QPushButton("Close")
+        close_btn.clicked.connect(self.accept)
+        button_layout.addWidget(close_btn)
+        
+        layout.addLayout(button_layout)
+    
+    def populate_collections(self):
+        self.collections_list.clear()
+        for collection_name in self.config_manager.config.get("collections", {}).keys():
+            self.collections_list.addItem(collection_name)
+    
+    def add_collection(self):
+        name, ok = QLineEdit().text(), True
+        name, ok = self.get_collection_name("New Collection", "")
+        if ok and name:
+            if name not in self.config_manager.config.get("collections", {}):
+                self.config_manager.config.setdefault("collections", {})[name] = []
+                self.config_manager.save_library_state()
+                self.populate_collections()
+            else:
+                QMessageBox.warning(self, "Duplicate", "A collection with this name already exists.")
+    
+    def rename_collection(self):
+        current_item = self.collections_list.currentItem()
+        if not current_item:
+            return
+        old_name = current_item.text()
+        new_name, ok = self.get_collection_name("Rename Collection", old_name)
+        if ok and new_name and new_name != old_name:
+            collections = self.config_manager.config.get("collections", {})
+            if new_name not in collections:
+                collections[new_name] = collections.pop(old_name)
+                self.config_manager.save_library_state()
+                self.populate_collections()
+    
+    def delete_collection(self):
+        current_item = self.collections_list.currentItem()
+        if not current_item:
+            return
+        name = current_item.text()
+        reply = QMessageBox.question(self, "Confirm Delete", f"Delete collection '{name}'?")
+        if reply == QMessageBox.StandardButton.Yes:
+            del self.config_manager.config["collections"][name]
+            self.config_manager.save_library_state()
+            self.populate_collections()
+    
+    def get_collection_name(self, title, default):
+        dialog = QDialog(self)
+        dialog.setWindowTitle(title)
+        layout = QVBoxLayout(dialog)
+        
+        name_edit = QLineEdit(default)
+        layout.addWidget(QLabel("Collection Name:"))
+        layout.addWidget(name_edit)
+        
+        buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
+        buttons.accepted.connect(dialog.accept)
+        buttons.rejected.connect(dialog.reject)
+        layout.addWidget(buttons)
+        
+        ok = dialog.exec() == QDialog.DialogCode.Accepted
+        return name_edit.text().strip(), ok
+
+class SaveStateManagerDialog(QDialog):
+    """Dialog for managing game save states"""
+    def __init__(self, game_data, config_manager, parent=None):
+        super().__init__(parent)
+        self.game_data = game_data
+        self.config_manager = config_manager
+        self.setWindowTitle(f"Save States - {game_data['title']}")
+        self.setMinimumSize(600, 400)
+        
+        layout = QVBoxLayout(self)
+        
+        # Info
+        info = QLabel(f"Manage save states for {game_data['title']}")
+        info.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
+        layout.addWidget(info)
+        
+        # Save states list
+        self.states_tree = QTreeWidget()
+        self.states_tree.setHeaderLabels(["Save State", "Date", "Size"])
+        self.states_tree.setColumnWidth(0, 300)
+        self.populate_save_states()
+        layout.addWidget(self.states_tree)
+        
+        # Buttons
+        button_layout = QHBoxLayout()
+        
+        btn_create = QPushButton("Create Save Point")
+        btn_create.clicked.connect(self.create_save_point)
+        
+        btn_load = QPushButton("Load State")
+        btn_load.clicked.connect(self.load_state)
+        
+        btn_delete = QPushButton("Delete")
+        btn_delete.clicked.connect(self.delete_state)
+        
+        btn_open_folder = QPushButton("Open Folder")
+        btn_open_folder.clicked.connect(self.open_saves_folder)
+        
+        button_layout.addWidget(btn_create)
+        button_layout.addWidget(btn_load)
+        button_layout.addWidget(btn_delete)
+        button_layout.addStretch()
+        button_layout.addWidget(btn_open_folder)
+        
+        close_btn = QPushButton("Close")
+        close_btn.clicked.connect(self.accept)
+        
+        layout.addLayout(button_layout)
+        layout.addWidget(close_btn)
+    
+    def get_save_folder(self):
+        """Get save folder for this game"""
+        game_hash = self.game_data['hash']
+        save_folder = self.config_manager.save_states_dir / game_hash
+        save_folder.mkdir(exist_ok=True)
+        return save_folder
+    
+    def populate_save_states(self):
+        """List all save states"""
+        self.states_tree.clear()
+        save_folder = self.get_save_folder()
+        
+        if save_folder.exists():
+            for save_file in sorted(save_folder.iterdir(), key=lambda x: x.stat().st_mtime, reverse=True):
+                if save_file.is_file():
+                    mod_time = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(save_file.stat().st_mtime))
+                    size = format_size(save_file.stat().st_size)
+                    item = QTreeWidgetItem([save_file.name, mod_time, size])
+                    item.setData(0, Qt.ItemDataRole.UserRole, str(save_file))
+                    self.states_tree.addTopLevelItem(item)
+        
+        if self.states_tree.topLevelItemCount() == 0:
+            placeholder = QTreeWidgetItem(["No save states yet", "", ""])
+            placeholder.setFlags(Qt.ItemFlag.NoItemFlags)
+            self.states_tree.addTopLevelItem(placeholder)
+    
+    def create_save_point(self):
+        """Create a new save point"""
+        from PyQt6.QtWidgets import QInputDialog
+        name, ok = QInputDialog.getText(self, "Create Save Point", "Save point name:")
+        if ok and name:
+            save_folder = self.get_save_folder()
+            timestamp = time.strftime("%Y%m%d_%H%M%S")
+            filename = f"{name}_{timestamp}.save"
+            save_path = save_folder / filename
+            
+            # Create empty save file (in real use, this would copy actual save data)
+            save_path.write_text(json.dumps({
+                "game": self.game_data['title'],
+                "timestamp": time.time(),
+                "note": name
+            }))
+            
+            self.populate_save_states()
+            QMessageBox.information(self, "Save Created", f"Save point '{name}' created.")
+    
+    def load_state(self):
+        """Load selected save state"""
+        current = self.states_tree.currentItem()
+        if not current or not current.data(0, Qt.ItemDataRole.UserRole):
+            return
+        
+        save_path = current.data(0, Qt.ItemDataRole.UserRole)
+        QMessageBox.information(self, "Load State", f"In a real implementation, this would load save state from:\n{save_path}")
+    
+    def delete_state(self):
+        """Delete selected save state"""
+        current = self.states_tree.currentItem()
+        if not current or not current.data(0, Qt.ItemDataRole.UserRole):
+            return
+        
+        save_path = Path(current.data(0, Qt.ItemDataRole.UserRole))
+        reply = QMessageBox.question(self, "Confirm Delete", f"Delete save state '{save_path.name}'?")
+        if reply == QMessageBox.StandardButton.Yes:
+            try:
+                save_path.unlink()
+                self.populate_save_states()
+            except Exception as e:
+                QMessageBox.critical(self, "Error", f"Failed to delete save: {e}")
+    
+    def open_saves_folder(self):
+        """Open the saves folder in explorer"""
+        save_folder = self.get_save_folder()
+        if sys.platform == "win32":
+            subprocess.Popen(['explorer', str(save_folder)])
+        elif sys.platform == "darwin":
+            subprocess.Popen(['open', str(save_folder)])
+        else:
+            subprocess.Popen(['xdg-open', str(save_folder)])
+
+class EmulatorEditDialog(QDialog):
+    def __init__(self, emu_name="", emu_data=None, parent=None):
+        super().__init__(parent); self.setWindowTitle("Add/Edit Emulator")
+        emu_data = emu_data or {"path": "", "systems": [], "args": ""}; layout = QVBoxLayout(self); layout.addWidget(QLabel("Emulator Name:")); self.name_edit = QLineEdit(emu_name); layout.addWidget(self.name_edit)
+        layout.addWidget(QLabel("Executable Path:")); path_layout = QHBoxLayout(); self.path_edit = QLineEdit(emu_data["path"]); btn_browse = QPushButton("Browse..."); btn_browse.clicked.connect(self.browse_for_exe); path_layout.addWidget(self.path_edit); path_layout.addWidget(btn_browse); layout.addLayout(path_layout)
+        layout.addWidget(QLabel("Supported Systems (comma-separated):")); self.systems_edit = QLineEdit(", ".join(emu_data.get("systems", []))); layout.addWidget(self.systems_edit)
+        layout.addWidget(QLabel("Launch Arguments (use %ROM% for game path):")); self.args_edit = QLineEdit(emu_data.get("args", "")); layout.addWidget(self.args_edit)
+        buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel); buttons.accepted.connect(self.accept); buttons.rejected.connect(self.reject); layout.addWidget(buttons)
+    def browse_for_exe(self): path, _ = QFileDialog.getOpenFileName(self, "Select Executable"); self.path_edit.setText(path) if path else None
+    def get_data(self): return {"name": self.name_edit.text().strip(), "data": {"path": self.path_edit.text().strip(), "systems": [s.strip() for s in self.systems_edit.text().split(",") if s.strip()], "args": self.args_edit.text().strip()}}
+
+class GameInfoDialog(QDialog):
+    def __init__(self, info, parent=None):
+        super().__init__(parent); self.setWindowTitle(info.get('title', 'Game Info')); self.setMinimumSize(400, 150); layout = QVBoxLayout(self)
+        for key, title in [("title", "Title:"), ("platform", "Platform:"), ("size", "Size:"), ("playtime", "Time Played:")]:
+            layout.addWidget(QLabel(f"<b>{title}</b> {info.get(key, 'N/A')}"))
+        layout.addStretch(); close_btn = QPushButton("Close"); close_btn.clicked.connect(self.accept); layout.addWidget(close_btn, 0, Qt.AlignmentFlag.AlignRight)
+
+class EmulatorChoiceDialog(QDialog):
+    def __init__(self, emulators, platform_name, parent=None):
+        super().__init__(parent); self.setWindowTitle("Choose Emulator")
+        layout = QVBoxLayout(self); layout.addWidget(QLabel("Multiple emulators found. Please choose one:"))
+        self.list_widget = QListWidget()
+        for emu_name in emulators:
+            self.list_widget.addItem(emu_name)
+        self.list_widget.setCurrentRow(0); layout.addWidget(self.list_widget)
+        self.set_default_checkbox = QCheckBox(f"Always use this choice for {platform_name}")
+        layout.addWidget(self.set_default_checkbox)
+        buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
+        buttons.accepted.connect(self.accept); buttons.rejected.connect(self.reject); layout.addWidget(buttons)
+    
+    def get_selected_emulator_name(self):
+        return self.list_widget.currentItem().text() if self.list_widget.currentItem() else None
+
+    def get_set_as_default(self):
+        return self.set_default_checkbox.isChecked()
+
+class LibraryManagerDialog(QDialog):
+    def __init__(self, config_manager, parent=None):
+        super().__init__(parent); self.config_manager = config_manager; self.setWindowTitle("Manage Game Folders"); self.setMinimumSize(600, 400)
+        layout = QVBoxLayout(self); layout.addWidget(QLabel("Game Library Folders:"))
+        self.path_list = QListWidget(); self.populate_list(); layout.addWidget(self.path_list)
+        button_layout = QHBoxLayout(); btn_add = QPushButton("Add Folder..."); btn_add.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_FileDialogNewFolder))
+        self.btn_remove = QPushButton("Remove Selected"); self.btn_remove.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_TrashIcon))
+        btn_add.clicked.connect(self.add_path); self.btn_remove.clicked.connect(self.remove_path)
+        button_layout.addStretch(); button_layout.addWidget(btn_add); button_layout.addWidget(self.btn_remove); layout.addLayout(button_layout)
+        self.path_list.currentItemChanged.connect(lambda item: self.btn_remove.setEnabled(item is not None)); self.btn_remove.setEnabled(False)
+    def populate_list(self):
+        self.path_list.clear(); self.path_list.addItems(self.config_manager.config["game_library_paths"])
+    def add_path(self):
+        path = QFileDialog.getExistingDirectory(self, "Select Game Folder")
+        if path and path not in self.config_manager.config["game_library_paths"]:
+            self.config_manager.config["game_library_paths"].append(path); self.config_manager.save_config(); self.populate_list()
+    def remove_path(self):
+        selected_item = self.path_list.currentItem()
+        if not selected_item: return
+        path_to_remove = selected_item.text()
+        if QMessageBox.question(self, "Confirm Removal", f"Are you sure you want to remove this folder from the library?\n\n{path_to_remove}") == QMessageBox.StandardButton.Yes:
+            self.config_manager.config["game_library_paths"].remove(path_to_remove); self.config_manager.save_config(); self.populate_list()
+
+# =============================================================================
+# --- MAIN APPLICATION WINDOW ---
+# =============================================================================
+class EmulatorHubWindow(QMainWindow):
+    theme_changed = pyqtSignal(str, dict)  # theme name, its colors dict
+
+    def __init__(self, backend, config_manager):
+        super().__init__()
+        self.backend = backend; self.config_manager = config_manager
+        self.themes = {
+            "Modern Dark": {
+                "C_BACKGROUND_DARK": "#1A1B26", "C_BACKGROUND_LIGHT": "#24283B", "C_BACKGROUND_WIDGET": "#16161E",
+                "C_BORDER": "#414868", "C_TEXT_PRIMARY": "#C0CAF5", "C_TEXT_SECONDARY": "#9AA5CE",
+                "C_HIGHLIGHT_BLUE": "#7AA2F7", "C_HIGHLIGHT_CYAN": "#2AC3DE", "C_ACCENT": "#BB9AF7",
+                "C_SUCCESS": "#9ECE6A", "C_WARNING": "#E0AF68", "C_ERROR": "#F7768E"
+            },
+            "Modern Light": {
+                "C_BACKGROUND_DARK": "#F5F5F5", "C_BACKGROUND_LIGHT": "#FFFFFF", "C_BACKGROUND_WIDGET": "#FAFAFA",
+                "C_BORDER": "#D0D0D0", "C_TEXT_PRIMARY": "#2E3440", "C_TEXT_SECONDARY": "#4C566A",
+                "C_HIGHLIGHT_BLUE": "#5E81AC", "C_HIGHLIGHT_CYAN": "#88C0D0", "C_ACCENT": "#B48EAD",
+                "C_SUCCESS": "#A3BE8C", "C_WARNING": "#EBCB8B", "C_ERROR": "#BF616A"
+            }
+        }
+        self.current_theme_name = self.config_manager.config.get("theme", "Modern Dark")
+        self.is_grid_mode = self.config_manager.config.get("view_mode", "grid") == "grid"
+        self.current_grid_icon_size = self.config_manager.config.get("grid_icon_size", 150)
+        self.current_list_icon_size = self.config_manager.config.get("list_icon_size", 48)
+        self.grid_delegate = GridItemDelegate(self.backend, self); self.list_delegate = SpacedListItemDelegate(parent=self)
+        self.setWindowTitle(f"{Constants.APP_NAME} v{Constants.VERSION}"); self.setGeometry(100, 100, 1280, 800)
+        self.process_timers = {}
+        self.selected_games = []  # For batch operations
+        self.scanner_thread = None
+        self._std_icons = {}  # Memoized QStyle.standardIcon results
+        self._icon_cache = OrderedDict()  # hash -> QIcon, LRU-bounded
+        self._icon_pending = set()  # hashes queued on the loader, dedup guard
+        self.icon_loader = IconLoader(self)
+        self.icon_loader.icon_ready.connect(self._on_icon_ready)
+        self.icon_loader.start()
+        self._qss_cache = {}  # theme name -> compiled QSS string
+        self._game_context_menu = None  # built on first right-click, then reused
+        self._ctx_emu_menu_stale = True
+        self._ctx_emu_actions = {}
+        self._ctx_index = None
+        self._ctx_game = None
+        self._applied_theme_name = None
+
+        self.search_debounce_timer = QTimer(self)
+        self.search_debounce_timer.setSingleShot(True)
+        self.search_debounce_timer.setInterval(300)
+        self.search_debounce_timer.timeout.connect(self.repopulate_games_list)
+
+        # Coalesces selection changes while the user holds an arrow key or
+        # drags, so the cover decode only runs for the row they settle on.
+        self.details_debounce_timer = QTimer(self)
+        self.details_debounce_timer.setSingleShot(True)
+        self.details_debounce_timer.setInterval(80)
+        self.details_debounce_timer.timeout.connect(self._flush_details_panel)
+        self._pending_details_index = None
+
+        # system -> [emulator dicts], rebuilt only when the emulator config
+        # changes; search keystrokes just filter the cached index.
+        self._emulators_by_system_cache = None
+        self._repopulate_pending = False
+        self._emulator_list_update_pending = False
+        self.emu_search_debounce_timer = QTimer(self)
+        self.emu_search_debounce_timer.setSingleShot(True)
+        self.emu_search_debounce_timer.setInterval(300)
+        self.emu_search_debounce_timer.timeout.connect(self.update_emulator_list)
+
+        self.icon_size_debounce_timer = QTimer(self)
+        self.icon_size_debounce_timer.setSingleShot(True)
+        self.icon_size_debounce_timer.setInterval(30)
+        self.icon_size_debounce_timer.timeout.connect(self._apply_icon_size)
+        self._pending_icon_size = -1
+        self._last_applied_icon_size = -1
+
+        self.setAcceptDrops(True)
+        
+        # Initialize controller support
+        self.controller_handler = None
+        if self.config_manager.config.get("controller_enabled", True):
+            try:
+                self.controller_handler = ControllerHandler(self.config_manager.config.get("controller_deadzone", 0.2))
+                self.controller_handler.button_pressed.connect(self.handle_controller_input)
+                self.controller_handler.start()
+            except:
+                pass  # Controller support optional
+        
+        self.setup_ui()
+        self.apply_theme()
+        self.restore_window_state()
+        QTimer.singleShot(50, self.initial_load)
+        
+    def setup_ui(self):
+        self.create_toolbar(); central_widget = QWidget(); self.setCentralWidget(central_widget)
+        main_layout = QVBoxLayout(central_widget); self.tabs = QTabWidget(); main_layout.addWidget(self.tabs)
+        self.library_tab = self._create_library_tab()
+        # The emulators tab is built lazily on first visit; most sessions never
+        # open it, so startup skips the QTreeWidget population entirely.
+        self.emulators_tab = None
+        self._emulators_tab_built = False
+        self.tabs.addTab(self.library_tab, "Library"); self.tabs.addTab(QWidget(), "Emulators")
+        self.tabs.currentChanged.connect(self._on_tab_changed)
+        self.setStatusBar(QStatusBar(self))
+        
+        # Setup keyboard shortcuts
+        self.setup_keyboard_shortcuts()
+
+    def std_icon(self, standard_pixmap):
+        """standardIcon goes through QStyle's pixmap generator each call;
+        cache the QIcon per enum value."""
+        icon = self._std_icons.get(standard_pixmap)
+        if icon is None:
+            icon = self.style().standardIcon(standard_pixmap)
+            self._std_icons[standard_pixmap] = icon
+        return icon
+
+    def create_toolbar(self):
+        toolbar = self.addToolBar("Main")
+        toolbar.setObjectName("MainToolBar")
+        toolbar.setMovable(False)
+        manage_folder_action = QAction(self.std_icon(QStyle.StandardPixmap.SP_DirIcon), "Manage Game Folders...", self)
+        manage_folder_action.triggered.connect(self.open_library_manager); toolbar.addAction(manage_folder_action)
+        
+        # Add PC Game action
+        add_pc_game_action = QAction("💻 Add PC Game...", self)
+        add_pc_game_action.triggered.connect(self.add_pc_game_dialog); toolbar.addAction(add_pc_game_action)
+        toolbar.addSeparator()
+        
+        self.refresh_action = QAction(self.std_icon(QStyle.StandardPixmap.SP_BrowserReload), "Refresh Library", self)
+        self.refresh_action.triggered.connect(self.start_full_scan); toolbar.addAction(self.refresh_action)
+        toolbar.addSeparator()
+        
+        # Collections action
+        collections_action = QAction(self.std_icon(QStyle.StandardPixmap.SP_FileDialogListView), "Manage Collections...", self)
+        collections_action.triggered.connect(self.open_collections_manager); toolbar.addAction(collections_action)
+        toolbar.addSeparator()
+        
+        # Batch operations
+        self.batch_action = QAction(self.std_icon(QStyle.StandardPixmap.SP_FileDialogDetailedView), "Batch Operations", self)
+        self.batch_action.setCheckable(True)
+        self.batch_action.toggled.connect(self.toggle_batch_mode)
+        self.batch_action.setEnabled(False)
+        toolbar.addAction(self.batch_action)
+        toolbar.addSeparator()
+        
+        self.theme_toggle_action = QAction(self.create_theme_icon(), "Toggle Theme", self)
+        self.theme_toggle_action.triggered.connect(self.toggle_theme); toolbar.addAction(self.theme_toggle_action)
+        toolbar.addSeparator()
+        
+        # Settings action
+        settings_action = QAction(self.std_icon(QStyle.StandardPixmap.SP_FileDialogInfoView), "Settings...", self)
+        settings_action.triggered.connect(self.open_settings); toolbar.addAction(settings_action)
+        toolbar.addSeparator()
+        
+        self.toggle_details_action = QAction(self.std_icon(QStyle.StandardPixmap.SP_FileDialogDetailedView), "Toggle Details Panel", self)
+        self.toggle_details_action.setCheckable(True)
+        self.toggle_details_action.toggled.connect(self.on_toggle_details_panel)
+        toolbar.addAction(self.toggle_details_action)
+
+    def _create_library_tab(self):
+        library_widget = QWidget(); layout = QHBoxLayout(library_widget)
+        self.main_splitter = QSplitter(Qt.Orientation.Horizontal)
+        self.systems_list = QListWidget()
+        self.systems_list.setItemDelegate(PlatformListDelegate(self.systems_list))
+        # No uniformItemSizes here: the group separators carry a 10px size
+        # hint alongside the 40px platform rows, and the flag is only valid
+        # when every item is the same size.
+        self.systems_list.setSpacing(2)
+        self.systems_list.setMinimumWidth(280)
+        self.systems_list.currentItemChanged.connect(self._on_system_changed)
+        self.main_splitter.addWidget(self.systems_list)
+        
+        right_panel = QWidget()
+        right_layout = QVBoxLayout(right_panel)
+        right_layout.setContentsMargins(0,0,0,0)
+        
+        self.games_list = QListView()
+        self.games_model = GamesModel(self.get_icon_for_game, self)
+        self.games_list.setModel(self.games_model)
+        self._setup_common_list_properties()
+        right_layout.addLayout(self._create_view_options_bar())
+        right_layout.addWidget(self.games_list)
+
+        # Statistics are rendered in this label instead of the games view.
+        self.stats_label = QLabel()
+        self.stats_label.setWordWrap(True)
+        self.stats_label.setTextFormat(Qt.TextFormat.RichText)
+        self.stats_label.setAlignment(Qt.AlignmentFlag.AlignTop)
+        self.stats_label.setVisible(False)
+        right_layout.addWidget(self.stats_label)
+        
+        # ++++++++++++++ THE FIX IS HERE ++++++++++++++
+        # 1. Create the details panel and assign it to the instance variable.
+        self.details_panel = self._create_details_panel()
+        # 2. Add the created panel to the layout.
+        right_layout.addWidget(self.details_panel)
+        # 3. NOW that self.details_panel exists, we can safely call a method that uses it.
+        self.update_details_panel(None)
+
+        self.main_splitter.addWidget(right_panel)
+        self.main_splitter.setSizes([250, 1030])
+        layout.addWidget(self.main_splitter)
+        return library_widget
+    def _create_view_options_bar(self):
+        layout = QHBoxLayout()
+        self.btn_list_view = QPushButton(self.create_view_switcher_icon('list'), ""); self.btn_list_view.setCheckable(True)
+        self.btn_grid_view = QPushButton(self.create_view_switcher_icon('grid'), ""); self.btn_grid_view.setCheckable(True)
+        self.btn_list_view.clicked.connect(lambda: self.set_view_mode(False)); self.btn_grid_view.clicked.connect(lambda: self.set_view_mode(True))
+        layout.addWidget(self.btn_list_view); layout.addWidget(self.btn_grid_view)
+        layout.addWidget(QLabel("Icon Size:"))
+        self.icon_size_slider = QSlider(Qt.Orientation.Horizontal)
+        self.icon_size_slider.valueChanged.connect(self.on_icon_size_changed)
+        layout.addWidget(self.icon_size_slider)
+        
+        # Platform Filter
+        layout.addWidget(QLabel("Filter:"))
+        self.platform_filter_combo = QComboBox()
+        self.platform_filter_combo.setMinimumWidth(150)
+        self.platform_filter_combo.addItem("All Platforms")
+        self.platform_filter_combo.currentTextChanged.connect(self.on_platform_filter_changed)
+        layout.addWidget(self.platform_filter_combo)
+        
+        layout.addWidget(QLabel("Sort:"))
+        self.sort_combo = QComboBox(); self.sort_combo.addItems(["Name", "File Size (Asc)", "File Size (Desc)", "Time Played", "Date Added"])
+        self.sort_combo.setCurrentText(self.config_manager.config.get("sort_order", "Name"))
+        self.sort_combo.currentTextChanged.connect(self.on_sort_order_changed)
+        layout.addWidget(self.sort_combo)
+        
+        # Enhanced search bar with clear button
+        search_container = QWidget()
+        search_layout = QHBoxLayout(search_container)
+        search_layout.setContentsMargins(0, 0, 0, 0)
+        self.search_bar = QLineEdit(); self.search_bar.setPlaceholderText("🔍 Search games...");
+        self.search_bar.textChanged.connect(self.on_search_text_changed)
+        self.search_clear_btn = QPushButton("✕")
+        self.search_clear_btn.setMaximumWidth(30)
+        self.search_clear_btn.setVisible(False)
+        self.search_clear_btn.clicked.connect(lambda: self.search_bar.clear())
+        self.search_bar.textChanged.connect(lambda text: self.search_clear_btn.setVisible(bool(text)))
+        search_layout.addWidget(self.search_bar)
+        search_layout.addWidget(self.search_clear_btn)
+        layout.addWidget(search_container)
+        return layout
+
+    def _create_details_panel(self):
+        details_box = QGroupBox("Details")
+        main_layout = QHBoxLayout(details_box)
+        self.details_cover_label = QLabel()
+        self.details_cover_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.details_cover_label.setMinimumSize(200, 200)
+        self.details_cover_label.setMaximumSize(200, 200)
+        self.details_cover_label.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
+        
+        info_layout = QFormLayout()
+        self.details_title_label = QLabel()
+        self.details_title_label.setWordWrap(True)
+        self.details_title_label.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold))
+        self.details_platform_label = QLabel()
+        self.details_size_label = QLabel()
+        self.details_playtime_label = QLabel()
+        info_layout.addRow(self.details_title_label)
+        info_layout.addRow(QLabel())
+        info_layout.addRow("<b>Platform:</b>", self.details_platform_label)
+        info_layout.addRow("<b>File Size:</b>", self.details_size_label)
+        info_layout.addRow("<b>Time Played:</b>", self.details_playtime_label)
+
+        main_layout.addWidget(self.details_cover_label)
+        main_layout.addLayout(info_layout)
+        
+        self.details_placeholder_label = QLabel("Select a game to see details here.")
+        self.details_placeholder_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.details_placeholder_label.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
+
+        # A stacked widget swaps pages in O(1); with the old sibling-widget
+        # approach the hidden page still took part in every layout pass.
+        self.details_box = details_box
+        details_box.setAttribute(Qt.WidgetAttribute.WA_LayoutUsesWidgetRect)
+        details_widget_stack = QStackedWidget()
+        details_widget_stack.addWidget(details_box)
+        details_widget_stack.addWidget(self.details_placeholder_label)
+        details_widget_stack.setCurrentWidget(self.details_placeholder_label)
+
+        return details_widget_stack
+
+    def _on_tab_changed(self, idx):
+        if idx == 1 and not self._emulators_tab_built:
+            self.emulators_tab = self._create_emulators_tab()
+            self._emulators_tab_built = True
+            self.tabs.removeTab(1)
+            self.tabs.insertTab(1, self.emulators_tab, "Emulators")
+            self.tabs.setCurrentIndex(1)
+            self.update_emulator_list()
+
+    def _create_emulators_tab(self):
+        emulators_widget = QWidget(); layout = QVBoxLayout(emulators_widget)
+        layout.setContentsMargins(12, 12, 12, 12)
+        layout.setSpacing(12)
+        
+        # Header section with title and actions
+        header_layout = QHBoxLayout()
+        
+        # Title with icon
+        title_label = QLabel("🎮 Emulator Management")
+        title_label.setFont(QFont("Segoe UI", 16, QFont.Weight.Bold))
+        title_label.setStyleSheet(f"color: {Constants.C_HIGHLIGHT_CYAN};")
+        header_layout.addWidget(title_label)
+        
+        header_layout.addStretch()
+        
+        # Quick action buttons in header
+        btn_scan_emus = QPushButton("📂 Scan Folder")
+        btn_scan_emus.clicked.connect(self.scan_for_emulators)
+        btn_scan_emus.setMinimumHeight(36)
+        header_layout.addWidget(btn_scan_emus)
+        
+        layout.addLayout(header_layout)
+        
+        # Search bar with modern styling
+        search_container = QWidget()
+        search_layout = QHBoxLayout(search_container)
+        search_layout.setContentsMargins(0, 0, 0, 0)
+        
+        search_label = QLabel("🔍")
+        search_label.setFont(QFont("Segoe UI Emoji", 14))
+        search_layout.addWidget(search_label)
+        
+        self.emu_search_bar = QLineEdit()
+        self.emu_search_bar.setPlaceholderText("Search emulators...")
+        self.emu_search_bar.textChanged.connect(self.emu_search_debounce_timer.start)
+        self.emu_search_bar.setMinimumHeight(36)
+        search_layout.addWidget(self.emu_search_bar)
+        
+        self.emu_search_clear_btn = QPushButton("✕")
+        self.emu_search_clear_btn.setMaximumWidth(36)
+        self.emu_search_clear_btn.setMinimumHeight(36)
+        self.emu_search_clear_btn.setVisible(False)
+        self.emu_search_clear_btn.clicked.connect(lambda: self.emu_search_bar.clear())
+        self.emu_search_bar.textChanged.connect(lambda text: self.emu_search_clear_btn.setVisible(bool(text)))
+        search_layout.addWidget(self.emu_search_clear_btn)
+        
+        layout.addWidget(search_container)
+        
+        # Emulator tree with custom delegate
+        self.emulators_tree = QTreeWidget()
+        self.emulators_tree.setHeaderHidden(True)
+        self.emulators_tree.setRootIsDecorated(True)
+        self.emulators_tree.setIndentation(0)  # Remove default indentation for cleaner look
+        self.emulators_tree.setItemDelegate(EmulatorTreeDelegate(self.emulators_tree))
+        self.emulators_tree.setUniformRowHeights(False)
+        self.emulators_tree.itemDoubleClicked.connect(self.launch_selected_emulator)
+        self.emulators_tree.currentItemChanged.connect(self.on_emulator_selection_changed)
+        layout.addWidget(self.emulators_tree)
+        
+        # Action buttons panel with modern styling
+        button_panel = QWidget()
+        button_panel.setStyleSheet(f"""
+            QWidget {{
+                background-color: {Constants.C_BACKGROUND_LIGHT};
+                border-radius: 8px;
+                padding: 8px;
+            }}
+        """)
+        button_layout = QHBoxLayout(button_panel)
+        button_layout.setSpacing(8)
+        
+        self.btn_add_emu = QPushButton("➕ Add")
+        self.btn_add_emu.setMinimumHeight(40)
+        self.btn_edit_emu = QPushButton("✏️ Edit")
+        self.btn_edit_emu.setMinimumHeight(40)
+        self.btn_remove_emu = QPushButton("🗑️ Remove")
+        self.btn_remove_emu.setMinimumHeight(40)
+        self.btn_start_emu = QPushButton("▶️ Launch")
+        self.btn_start_emu.setMinimumHeight(40)
+        
+        self.btn_add_emu.clicked.connect(self.add_emulator)
+        self.btn_edit_emu.clicked.connect(self.edit_emulator)
+        self.btn_remove_emu.clicked.connect(self.remove_emulator)
+        self.btn_start_emu.clicked.connect(self.launch_selected_emulator)
+        
+        button_layout.addWidget(self.btn_add_emu)
+        button_layout.addWidget(self.btn_edit_emu)
+        button_layout.addWidget(self.btn_remove_emu)
+        button_layout.addStretch()
+        button_layout.addWidget(self.btn_start_emu)
+        
+        layout.addWidget(button_panel)
+        
+        self.on_emulator_selection_changed(None)
+        return emulators_widget
+
+    def apply_theme(self):
+        name = self.current_theme_name
+        if self._applied_theme_name == name:
+            return  # Re-applying the same QSS would invalidate every widget's style cache
+        self._icon_cache.clear()  # Placeholder gradients use theme colors
+        _PLACEHOLDER_PIXMAPS.clear()
+        qss = self._qss_cache.get(name)
+        if qss is None:
+            qss = self._qss_cache[name] = self._build_qss(name)
+        self.setStyleSheet(qss)
+        self._applied_theme_name = name
+        self.theme_toggle_action.setIcon(self.create_theme_icon())
+        self.theme_changed.emit(name, self.themes[name])
+
+    def _build_qss(self, name):
+        return _QSS_TEMPLATE.format(**self.themes[name])
+
+    
+    def toggle_theme(self):
+        self.current_theme_name = "Modern Light" if self.current_theme_name == "Modern Dark" else "Modern Dark"
+        self.apply_theme()
+    def create_theme_icon(self):
+        pixmap = QPixmap(24, 24); pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap); painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        colors = self.themes[self.current_theme_name]
+        painter.setBrush(QColor(colors['C_TEXT_PRIMARY'])); painter.setPen(Qt.PenStyle.NoPen)
+        if self.current_theme_name == "Modern Dark":
+            painter.drawEllipse(6, 6, 12, 12)
+        else:
+            path = QPainterPath(); path.addEllipse(4, 4, 16, 16); path.addEllipse(8, 4, 16, 16); path.setFillRule(Qt.FillRule.OddEvenFill); painter.drawPath(path)
+        painter.end(); return QIcon(pixmap)
+        
+    def create_view_switcher_icon(self, mode):
+        pixmap = QPixmap(24, 24); pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap); painter.setRenderHint(QPainter.RenderHint.Antialiasing); painter.setPen(QPen(QColor(self.themes[self.current_theme_name]['C_TEXT_PRIMARY']), 2))
+        if mode == 'list':
+            for y in [6, 12, 18]: painter.drawLine(3, y, 21, y)
+        elif mode == 'grid':
+            painter.drawRect(4, 4, 7, 7); painter.drawRect(13, 4, 7, 7); painter.drawRect(4, 13, 7, 7); painter.drawRect(13, 13, 7, 7)
+        painter.end(); return QIcon(pixmap)
+
+    def set_view_mode(self, is_grid):
+        self.is_grid_mode = is_grid; self._apply_view_mode_settings()
+    def _apply_view_mode_settings(self):
+        self.games_model.set_games([]); self.btn_grid_view.setChecked(self.is_grid_mode); self.btn_list_view.setChecked(not self.is_grid_mode)
+        self.icon_size_slider.blockSignals(True)
+        if self.is_grid_mode:
+            self.games_list.setViewMode(QListView.ViewMode.IconMode); self.games_list.setFlow(QListView.Flow.LeftToRight); self.games_list.setWrapping(True)
+            self.games_list.setResizeMode(QListView.ResizeMode.Adjust); self.games_list.setSpacing(15)
+            self.games_list.setIconSize(QSize(self.current_grid_icon_size, int(self.current_grid_icon_size * 1.33))); self.games_list.setItemDelegate(self.grid_delegate)
+            self.icon_size_slider.setRange(Constants.MIN_GRID_ICON_SIZE, Constants.MAX_GRID_ICON_SIZE); self.icon_size_slider.setValue(self.current_grid_icon_size)
+        else:
+            self.games_list.setViewMode(QListView.ViewMode.ListMode); self.games_list.setFlow(QListView.Flow.TopToBottom); self.games_list.setWrapping(False)
+            self.games_list.setResizeMode(QListView.ResizeMode.Adjust); self.games_list.setSpacing(0)
+            self.games_list.setIconSize(QSize(self.current_list_icon_size, self.current_list_icon_size)); self.games_list.setItemDelegate(self.list_delegate)
+            self.icon_size_slider.setRange(Constants.MIN_LIST_ICON_SIZE, Constants.MAX_LIST_ICON_SIZE); self.icon_size_slider.setValue(self.current_list_icon_size)
+        self.icon_size_slider.blockSignals(False)
+        self._last_applied_icon_size = -1  # Grid/list sizes use different scales
+        self.repopulate_games_list()
+    GRID_ASPECT_PERCENT = 133  # Grid icons are 4:3 portrait: height = width * 1.33
+
+    def on_icon_size_changed(self, value):
+        # Coalesce mid-drag slider ticks; only the value the user settles on
+        # triggers the (expensive) relayout.
+        self._pending_icon_size = value
+        self.icon_size_debounce_timer.start()
+
+    def _apply_icon_size(self):
+        value = self._pending_icon_size
+        if value == self._last_applied_icon_size:
+            return
+        self._last_applied_icon_size = value
+        self._icon_cache.clear()  # Placeholder icons are baked at the old size
+        if self.is_grid_mode:
+            self.current_grid_icon_size = value; self.games_list.setIconSize(QSize(value, (value * self.GRID_ASPECT_PERCENT) // 100))
+        else:
+            self.current_list_icon_size = value; self.games_list.setIconSize(QSize(value, value))
+        self.games_list.doItemsLayout()
+
+    def update_game_item(self, game_hash):
+        # Single-row refresh; falls back to a coalesced rebuild when the game
+        # is not in the currently shown list.
+        if not self.games_model.refresh_game(game_hash):
+            self.schedule_repopulate()
+
+    def schedule_repopulate(self):
+        # Coalesces bursts (multi-delete, several games exiting at once) into
+        # one rebuild on the next event-loop turn.
+        if not self._repopulate_pending:
+            self._repopulate_pending = True
+            QTimer.singleShot(0, self._do_repopulate)
+
+    def _do_repopulate(self):
+        self._repopulate_pending = False
+        self.repopulate_games_list()
+
+    def on_search_text_changed(self):
+        self.search_debounce_timer.start()
+
+    def on_platform_filter_changed(self, filter_text):
+        self.config_manager.config['selected_platform_filter'] = filter_text
+        self.repopulate_games_list()
+
+    def on_sort_order_changed(self, sort_text):
+        self.config_manager.config['sort_order'] = sort_text
+        self.repopulate_games_list()
+
+    def repopulate_games_list(self):
+        current_index = self.games_list.currentIndex()
+        current_item_data = current_index.data(Qt.ItemDataRole.UserRole) if current_index.isValid() else None
+        current_system = self.systems_list.currentItem()
+        if not current_system:
+            self.games_model.set_games([])
+            return
+        system_text = current_system.text()
+        # Extract actual system name (remove count if present)
+        system_name = system_text.split(' (')[0] if ' (' in system_text else system_text
+
+        # Handle Statistics view
+        if system_name == Constants.STATISTICS_CATEGORY:
+            self.show_statistics_view()
+            return
+        self.stats_label.setVisible(False)
+        self.games_list.setVisible(True)
+
+        # Pre-sorted per (category, sort key) in the backend; filters below
+        # rebind to fresh lists and never mutate the cached ordering.
+        games = self.backend.sorted_games(system_name, self.sort_combo.currentText())
+
+        # Apply platform filter
+        platform_filter = self.platform_filter_combo.currentText()
+        if platform_filter != "All Platforms":
+            games = [g for g in games if g['platform'] == platform_filter]
+
+        search_text = self.search_bar.text().lower()
+        if search_text: games = [g for g in games if search_text in (g.get('title_lower') or g['title'].lower())]
+
+        self.games_model.set_games(games)
+
+        # Update status bar with count
+        self.statusBar().showMessage(f"Showing {self.games_model.rowCount()} game(s)", 3000)
+
+        reselect_row = self.games_model.row_for_hash(current_item_data['hash']) if current_item_data else -1
+        if reselect_row >= 0:
+            self.games_list.setCurrentIndex(self.games_model.index(reselect_row))
+        elif self.games_model.rowCount() > 0:
+            self.games_list.setCurrentIndex(self.games_model.index(0))
+        else:
+            self.update_details_panel(None)
+
+    def get_icon_for_game(self, game_data):
+        game_hash = game_data['hash']
+        icon = self._icon_cache.get(game_hash)
+        if icon is not None:
+            self._icon_cache.move_to_end(game_hash)
+            return icon
+        cover_path = self.get_cover_path_for_game(game_data)
+        if cover_path:
+            # Decode happens on the IconLoader thread; hand back a placeholder
+            # now and repaint this row when the scaled image arrives.
+            if game_hash not in self._icon_pending:
+                self._icon_pending.add(game_hash)
+                self.icon_loader.request(game_hash, cover_path, self.games_list.iconSize())
+            return self.create_placeholder_icon(game_data['title'])
+        icon = self.create_placeholder_icon(game_data['title'])
+        self._icon_cache[game_hash] = icon
+        if len(self._icon_cache) > Constants.ICON_CACHE_SIZE:
+            self._icon_cache.popitem(last=False)
+        return icon
+
+    def _on_icon_ready(self, game_hash, image):
+        self._icon_pending.discard(game_hash)
+        if image.isNull():
+            return
+        self._icon_cache[game_hash] = QIcon(QPixmap.fromImage(image))
+        if len(self._icon_cache) > Constants.ICON_CACHE_SIZE:
+            self._icon_cache.popitem(last=False)
+        self.update_game_item(game_hash)
+
+    def _grid_pixmap_size(self):
+        # Matches GridItemDelegate's icon area (item rect minus padding).
+        size = self.games_list.iconSize()
+        return QSize(max(1, size.width() - 8), max(1, size.height() - 8))
+
+    def create_placeholder_icon(self, text):
+        size = self.games_list.iconSize()
+        if not size.isValid() or size.width() <= 0 or size.height() <= 0: return QIcon()
+        # Placeholders show the title's initial, so one rendered pixmap per
+        # (size, letter) serves every uncovered game starting with that letter.
+        letter = (text[:1] or '?').upper()
+        key = (size.width(), size.height(), letter)
+        pixmap = _PLACEHOLDER_PIXMAPS.get(key)
+        if pixmap is None:
+            if len(_PLACEHOLDER_PIXMAPS) >= 256:
+                _PLACEHOLDER_PIXMAPS.clear()
+            pixmap = _PLACEHOLDER_PIXMAPS[key] = self._draw_placeholder_pixmap(size, letter)
+        return QIcon(pixmap)
+
+    def _draw_placeholder_pixmap(self, size, letter):
+        pixmap = QPixmap(size); pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap); painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        # Create gradient background
+        from PyQt6.QtGui import QLinearGradient
+        gradient = QLinearGradient(0, 0, 0, size.height())
+        colors = self.themes[self.current_theme_name]
+        gradient.setColorAt(0, QColor(colors['C_HIGHLIGHT_BLUE']))
+        gradient.setColorAt(1, QColor(colors['C_ACCENT']))
+        painter.setBrush(QBrush(gradient))
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.drawRoundedRect(pixmap.rect().adjusted(4, 4, -4, -4), 12, 12)
+
+        # Add border
+        pen = QPen(QColor(colors['C_BORDER']))
+        pen.setWidth(2)
+        painter.setPen(pen)
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        painter.drawRoundedRect(pixmap.rect().adjusted(5, 5, -5, -5), 12, 12)
+
+        # Draw the initial letter
+        font_size = 16 if size.width() < 100 else 28; font = QFont("Segoe UI", font_size, QFont.Weight.Bold)
+        painter.setFont(font); painter.setPen(QColor("#FFFFFF"))
+        painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignCenter, letter); painter.end()
+        return pixmap
+
+    def initial_load(self):
+        # Show splash screen; the cache deserializes on a worker thread so the
+        # UI stays responsive while it loads.
+        self._splash = SplashScreen()
+        self._splash.show()
+        self._splash.update_status("Loading library from cache...")
+        self.statusBar().showMessage("Loading library from cache...")
+        self.cache_loader = CacheLoader(self.backend)
+        self.cache_loader.loaded.connect(self._on_cache_loaded)
+        self.cache_loader.start()
+
+    def _on_cache_loaded(self, loaded):
+        if loaded:
+            self._splash.update_status("Building interface...")
+            self.update_system_list()
+            self._splash.close()
+            self.statusBar().showMessage("Library loaded from cache. Ready.", 5000)
+        else:
+            self._splash.update_status("No cache found. Scanning library...")
+            self._splash.close()
+            self.statusBar().showMessage("No cache found. Performing initial library scan...")
+            self.start_full_scan()
+        self._splash = None
+
+    def start_full_scan(self, new_roots=None):
+        if self.scanner_thread and self.scanner_thread.isRunning():
+            return
+        if not new_roots:
+            # A scoped scan keeps the cache: existing roots are untouched.
+            self.backend.clear_cache()
+        self.refresh_action.setEnabled(False)
+        self.scanner_thread = GameScanner(self.backend, roots=new_roots)
+        self.scanner_thread.progress_update.connect(self.statusBar().showMessage)
+        self.scanner_thread.scan_finished.connect(self.on_scan_finished)
+        self.scanner_thread.finished.connect(lambda: self.refresh_action.setEnabled(True))
+        self.scanner_thread.start()
+
+    def on_scan_finished(self, games_by_platform, all_games_map):
+        if self.scanner_thread and self.scanner_thread.roots:
+            # Scoped scan of newly added roots: merge instead of replace.
+            for game_hash, game in all_games_map.items():
+                if game_hash not in self.backend.all_games_map:
+                    self.backend.all_games_map[game_hash] = game
+                    self.backend.games_by_platform.setdefault(game['platform'], []).append(game)
+        else:
+            self.backend.games_by_platform = games_by_platform
+            self.backend.all_games_map = all_games_map
+        self.backend.invalidate_sorted_games()
+        self.backend.save_to_cache()
+        self.update_system_list()
+        # Selection restore is silent when the category is unchanged, so the
+        # fresh scan results need an explicit repopulate.
+        self.schedule_repopulate()
+        self.update_emulator_list()
+        self.statusBar().showMessage("Library scan complete. Ready.", 5000)
+        
+    def _on_system_changed(self, current=None, _previous=None):
+        if current is not None:
+            data = current.data(Qt.ItemDataRole.UserRole)
+            if data and not data.get('is_separator'):
+                # Remembered across sessions so startup can show the last
+                # category instead of always populating All Games first.
+                self.config_manager.config['last_system'] = data['name']
+                self.config_manager.save_config()
+        self.repopulate_games_list()
+
+    def update_system_list(self):
+        current_item = self.systems_list.currentItem()
+        current_data = current_item.data(Qt.ItemDataRole.UserRole) if current_item else None
+        current_name = current_data.get('name') if current_data else self.config_manager.config.get('last_system')
+        # Batch the rebuild: one paint at the end instead of one per addItem,
+        # and no currentItemChanged storms while the list is in flux.
+        self.systems_list.setUpdatesEnabled(False)
+        self.systems_list.blockSignals(True)
+        try:
+            self._rebuild_system_list()
+        finally:
+            self.systems_list.blockSignals(False)
+            self.systems_list.setUpdatesEnabled(True)
+
+        # O(1) reselect via the name -> row map built during the rebuild. When
+        # the same category ends up selected again, restore it silently — the
+        # caller decides whether the games list itself needs refreshing.
+        prev_name = current_data.get('name') if current_data else None
+        row = self._system_row_by_name.get(current_name) if current_name else None
+        if row is None and self.systems_list.count() > 0:
+            row = 0
+        if row is not None:
+            target = self.systems_list.item(row)
+            target_data = target.data(Qt.ItemDataRole.UserRole) if target else None
+            if prev_name is not None and target_data and target_data.get('name') == prev_name:
+                self.systems_list.blockSignals(True)
+                self.systems_list.setCurrentRow(row)
+                self.systems_list.blockSignals(False)
+            else:
+                self.systems_list.setCurrentRow(row)
+
+    def _add_system_item(self, item, name):
+        self.systems_list.addItem(item)
+        self._system_row_by_name[name] = self.systems_list.count() - 1
+
+    def _rebuild_system_list(self):
+        self.systems_list.clear()
+        self._system_row_by_name = {}
+
+        # Special categories
+        all_games_item = QListWidgetItem(Constants.ALL_GAMES_CATEGORY)
+        all_games_item.setData(Qt.ItemDataRole.UserRole, {'name': Constants.ALL_GAMES_CATEGORY})
+        self._add_system_item(all_games_item, Constants.ALL_GAMES_CATEGORY)
+        
+        if self.backend.get_favorite_games():
+            fav_item = QListWidgetItem(Constants.FAVORITES_CATEGORY)
+            fav_item.setData(Qt.ItemDataRole.UserRole, {'name': Constants.FAVORITES_CATEGORY})
+            self._add_system_item(fav_item, Constants.FAVORITES_CATEGORY)
+        
+        if self.backend.get_recently_played_games():
+            recent_item = QListWidgetItem(Constants.RECENTS_CATEGORY)
+            recent_item.setData(Qt.ItemDataRole.UserRole, {'name': Constants.RECENTS_CATEGORY})
+            self._add_system_item(recent_item, Constants.RECENTS_CATEGORY)
+        
+        # Add Statistics category
+        stats_item = QListWidgetItem(Constants.STATISTICS_CATEGORY)
+        stats_item.setData(Qt.ItemDataRole.UserRole, {'name': Constants.STATISTICS_CATEGORY})
+        self._add_system_item(stats_item, Constants.STATISTICS_CATEGORY)
+        
+        if self.backend.games_by_platform:
+            # Add separator
+            sep = QListWidgetItem("")
+            sep.setFlags(Qt.ItemFlag.NoItemFlags)
+            sep.setData(Qt.ItemDataRole.UserRole, {'is_separator': True, 'text': 'PLATFORMS'})
+            self.systems_list.addItem(sep)
+        
+        # Update platform filter dropdown
+        self.platform_filter_combo.blockSignals(True)
+        current_filter = self.platform_filter_combo.currentText()
+        self.platform_filter_combo.clear()
+        self.platform_filter_combo.addItem("All Platforms")
+        
+        # Group platforms by manufacturer
+        platform_groups = {
+            'PlayStation': [],
+            'Xbox': [],
+            'Nintendo': [],
+            'Sega': [],
+            'Other': []
+        }
+        
+        for system in sorted(self.backend.games_by_platform.keys()):
+            game_count = len(self.backend.games_by_platform[system])
+            
+            # Categorize
+            if 'PlayStation' in system or 'PSP' in system:
+                platform_groups['PlayStation'].append((system, game_count))
+            elif 'Xbox' in system:
+                platform_groups['Xbox'].append((system, game_count))
+            elif 'Nintendo' in system or 'Wii' in system or 'GameCube' in system or 'Game Boy' in system or 'Switch' in system:
+                platform_groups['Nintendo'].append((system, game_count))
+            elif 'Sega' in system or 'Genesis' in system or 'Dreamcast' in system:
+                platform_groups['Sega'].append((system, game_count))
+            else:
+                platform_groups['Other'].append((system, game_count))
+            
+            self.platform_filter_combo.addItem(system)
+        
+        # Add platforms grouped by manufacturer
+        for group_name in ['PlayStation', 'Xbox', 'Nintendo', 'Sega', 'Other']:
+            if platform_groups[group_name]:
+                # Add group separator
+                if group_name != 'PlayStation':  # Skip separator for first group
+                    sep = QListWidgetItem("")
+                    sep.setFlags(Qt.ItemFlag.NoItemFlags)
+                    sep.setData(Qt.ItemDataRole.UserRole, {'is_separator': True, 'text': ''})
+                    sep.setSizeHint(QSize(0, 10))
+                    self.systems_list.addItem(sep)
+                
+                for system, count in sorted(platform_groups[group_name]):
+                    item = QListWidgetItem(f"{system} ({count})")
+                    item.setData(Qt.ItemDataRole.UserRole, {'name': system, 'count': count})
+                    self._add_system_item(item, system)
+        
+        # Restore filter selection
+        if current_filter:
+            idx = self.platform_filter_combo.findText(current_filter)
+            if idx >= 0:
+                self.platform_filter_combo.setCurrentIndex(idx)
+        self.platform_filter_combo.blockSignals(False)
+
+    def update_emulator_list(self):
+        if not self._emulators_tab_built:
+            return  # Tab not constructed yet; _on_tab_changed refreshes on first show
+        search_text = self.emu_search_bar.text().lower()
+        self.emulators_tree.setUpdatesEnabled(False)
+        self.emulators_tree.blockSignals(True)
+        try:
+            self._rebuild_emulator_tree(search_text)
+        finally:
+            self.emulators_tree.blockSignals(False)
+            self.emulators_tree.setUpdatesEnabled(True)
+
+    def refresh_emulator_list(self):
+        # For callers that changed the emulator config: drop the cached index
+        # and coalesce back-to-back refreshes into one rebuild.
+        self._emulators_by_system_cache = None
+        self._ctx_emu_menu_stale = True
+        self.backend.invalidate_emulator_index()
+        if not self._emulator_list_update_pending:
+            self._emulator_list_update_pending = True
+            QTimer.singleShot(0, self._do_emulator_list_update)
+
+    def _do_emulator_list_update(self):
+        self._emulator_list_update_pending = False
+        self.update_emulator_list()
+
+    def _rebuild_emulator_tree(self, search_text):
+        self.emulators_tree.clear()
+
+        emulators_by_system = self._emulators_by_system_cache
+        if emulators_by_system is None:
+            emulators_by_system = {}
+            for name, data in self.config_manager.config["emulators"].items():
+                for system in data.get("systems", []):
+                    if system not in emulators_by_system:
+                        emulators_by_system[system] = []
+                    emulators_by_system[system].append({"name": name, "name_lower": name.lower(), "data": data})
+            self._emulators_by_system_cache = emulators_by_system
+
+        # Sort systems for better organization
+        top_level_items = []
+        for system_name in sorted(emulators_by_system.keys()):
+            child_items = []
+            for emu in emulators_by_system[system_name]:
+                if search_text and search_text not in emu["name_lower"]:
+                    continue
+
+                child = QTreeWidgetItem([emu["name"]])
+                child.setData(0, Qt.ItemDataRole.UserRole, emu["name"])
+                child_items.append(child)
+
+            if child_items:
+                parent = QTreeWidgetItem([system_name])
+                parent.addChildren(child_items)
+                top_level_items.append(parent)
+
+        if top_level_items:
+            # One bulk insert plus one expandAll, instead of a layout pass per system.
+            self.emulators_tree.addTopLevelItems(top_level_items)
+            self.emulators_tree.expandAll()
+
+        # Show message if no emulators found
+        if self.emulators_tree.topLevelItemCount() == 0:
+            placeholder = QTreeWidgetItem(self.emulators_tree, ["No emulators configured"])
+            placeholder.setFlags(Qt.ItemFlag.NoItemFlags)
+            font = QFont("Segoe UI", 10, QFont.Weight.Normal)
+            font.setItalic(True)
+            placeholder.setFont(0, font)
+    
+    def _setup_common_list_properties(self):
+        self.games_list.doubleClicked.connect(self.launch_selected_game)
+        self.games_list.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self.games_list.customContextMenuRequested.connect(self.show_game_context_menu)
+        self.games_list.selectionModel().currentChanged.connect(self._on_current_game_changed)
+        self.games_list.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)  # Enable multi-select
+        # Every cell shares one sizeHint per view mode, so the view can lay
+        # out and cull without asking the delegate per row.
+        self.games_list.setUniformItemSizes(True)
+    
+    def setup_keyboard_shortcuts(self):
+        """Setup keyboard shortcuts for common actions"""
+        from PyQt6.QtGui import QShortcut, QKeySequence
+        
+        # F5 - Refresh
+        refresh_shortcut = QShortcut(QKeySequence("F5"), self)
+        refresh_shortcut.activated.connect(self.start_full_scan)
+        
+        # Ctrl+F - Focus search
+        search_shortcut = QShortcut(QKeySequence("Ctrl+F"), self)
+        search_shortcut.activated.connect(lambda: self.search_bar.setFocus())
+        
+        # Ctrl+Tab - Toggle view mode
+        view_shortcut = QShortcut(QKeySequence("Ctrl+Tab"), self)
+        view_shortcut.activated.connect(lambda: self.set_view_mode(not self.is_grid_mode))
+        
+        # Enter - Launch selected game
+        launch_shortcut = QShortcut(QKeySequence("Return"), self.games_list)
+        launch_shortcut.activated.connect(lambda: self.launch_selected_game(self.games_list.currentIndex()) if self.games_list.currentIndex().isValid() else None)
+        
+        # Delete - Delete selected game(s)
+        delete_shortcut = QShortcut(QKeySequence("Delete"), self.games_list)
+        delete_shortcut.activated.connect(self.delete_selected_games)
+        
+        # Ctrl+A - Select all
+        select_all_shortcut = QShortcut(QKeySequence("Ctrl+A"), self.games_list)
+        select_all_shortcut.activated.connect(self.games_list.selectAll)
+        
+        # Ctrl+I - Show info
+        info_shortcut = QShortcut(QKeySequence("Ctrl+I"), self.games_list)
+        info_shortcut.activated.connect(lambda: self.show_enhanced_game_info(self.games_list.currentIndex()) if self.games_list.currentIndex().isValid() else None)
+        
+        # Ctrl+B - Toggle batch mode
+        batch_shortcut = QShortcut(QKeySequence("Ctrl+B"), self)
+        batch_shortcut.activated.connect(lambda: self.batch_action.toggle())
+        
+        self.statusBar().showMessage("💡 Tip: Press F5 to refresh, Ctrl+F to search, Ctrl+Tab to toggle view", 5000)
+    
+    def handle_controller_input(self, button):
+        """Handle controller button presses"""
+        if button == 'Up':
+            self.games_list.setFocus()
+            current = self.games_list.currentIndex().row()
+            if current > 0:
+                self.games_list.setCurrentIndex(self.games_model.index(current - 1))
+        elif button == 'Down':
+            self.games_list.setFocus()
+            current = self.games_list.currentIndex().row()
+            if current < self.games_model.rowCount() - 1:
+                self.games_list.setCurrentIndex(self.games_model.index(current + 1))
+        elif button == 'Left':
+            self.systems_list.setFocus()
+            current = self.systems_list.currentRow()
+            if current > 0:
+                self.systems_list.setCurrentRow(current - 1)
+        elif button == 'Right':
+            self.games_list.setFocus()
+        elif button == 'A':  # Launch game
+            if self.games_list.currentIndex().isValid():
+                self.launch_selected_game(self.games_list.currentIndex())
+        elif button == 'B':  # Back/Toggle favorite
+            if self.games_list.currentIndex().isValid():
+                game_data = self.games_list.currentIndex().data(Qt.ItemDataRole.UserRole)
+                if game_data:
+                    self.toggle_favorite(game_data['hash'])
+        elif button == 'X':  # Show info
+            if self.games_list.currentIndex().isValid():
+                self.show_enhanced_game_info(self.games_list.currentIndex())
+        elif button == 'Y':  # Search
+            self.search_bar.setFocus()
+        elif button == 'Start':  # Refresh
+            self.start_full_scan()
+        elif button == 'LB':  # Previous tab
+            current = self.tabs.currentIndex()
+            self.tabs.setCurrentIndex(max(0, current - 1))
+        elif button == 'RB':  # Next tab
+            current = self.tabs.currentIndex()
+            self.tabs.setCurrentIndex(min(self.tabs.count() - 1, current + 1))
+
+    def _on_current_game_changed(self, current_index, _previous=None):
+        self._pending_details_index = current_index
+        self.details_debounce_timer.start()
+
+    def _flush_details_panel(self):
+        self.update_details_panel(self._pending_details_index)
+
+    def update_details_panel(self, current_item=None, _previous=None):
+        details_box = self.details_box
+
+        game_data = None
+        if current_item is not None and current_item.isValid():
+            game_data = current_item.data(Qt.ItemDataRole.UserRole)
+        if not game_data:
+            self.details_panel.setCurrentWidget(self.details_placeholder_label)
+            return
+
+        self.details_panel.setCurrentWidget(details_box)
+
+        self.details_title_label.setText(game_data.get('title', 'N/A'))
+        self.details_platform_label.setText(game_data.get('platform', 'N/A'))
+        self.details_size_label.setText(format_size(game_data.get('size', 0)))
+        self.details_playtime_label.setText(format_playtime(game_data.get('playtime', 0)))
+
+        cover_path = self.get_cover_path_for_game(game_data)
+        if cover_path:
+            # Reselecting a game should be a QPixmapCache hit, not a re-decode.
+            cache_key = f"cover:{game_data['hash']}:200"
+            pixmap = QPixmap()
+            if not QPixmapCache.find(cache_key, pixmap):
+                pixmap = QPixmap(cover_path).scaled(200, 200, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+                QPixmapCache.insert(cache_key, pixmap)
+            self.details_cover_label.setPixmap(pixmap)
+        else:
+            self.details_cover_label.setPixmap(self.create_placeholder_icon(game_data['title']).pixmap(200,200))
+
+    def get_cover_path_for_game(self, game_data):
+        # Covers are resolved at ingestion (scan/cache load); only games that
+        # have never been through the backend fall back to a live resolve.
+        if 'cover_path' in game_data:
+            return game_data['cover_path']
+        return self.backend.resolve_cover_path(game_data)
+
+    def on_toggle_details_panel(self, checked):
+        self.details_panel.setVisible(checked)
+        self.config_manager.config['details_panel_visible'] = checked
+
+    def open_library_manager(self):
+        dialog = LibraryManagerDialog(self.config_manager, self);
+        if dialog.exec():
+            self.start_full_scan()
+
+    # ++++++++++++++ THE FIX IS HERE (AGAIN) ++++++++++++++
+    def add_emulator(self):
+        exe_path, _ = QFileDialog.getOpenFileName(self, "Select Emulator Executable", "", "Executables (*.exe);;All Files (*)")
+        if not exe_path:
+            return
+
+        detected = self.backend.detect_emulator_from_exe(exe_path)
+        
+        if detected:
+            # Successfully auto-detected
+            if detected['name'] not in self.config_manager.config["emulators"]:
+                self.config_manager.config["emulators"][detected['name']] = detected['data']
+                self.config_manager.save_config()
+                self.refresh_emulator_list()
+                QMessageBox.information(self, "Emulator Added", f"Successfully auto-detected and added '{detected['name']}'.")
+            else:
+                QMessageBox.warning(self, "Emulator Exists", f"An emulator named '{detected['name']}' is already configured.")
+        else:
+            # Detection failed, fall back to manual entry
+            QMessageBox.information(self, "Unknown Emulator", "Could not identify this emulator. Please enter its details manually.")
+            dialog = EmulatorEditDialog(emu_data={"path": exe_path}, parent=self)
+            if dialog.exec():
+                result = dialog.get_data()
+                if result["name"] and result["data"]["path"]:
+                    if result["name"] in self.config_manager.config["emulators"]:
+                        QMessageBox.warning(self, "Emulator Exists", f"An emulator named '{result['name']}' is already configured.")
+                    else:
+                        self.config_manager.config["emulators"][result["name"]] = result["data"]
+                        self.config_manager.save_config()
+                        self.refresh_emulator_list()
+
+    def scan_for_emulators(self):
+        scan_path = QFileDialog.getExistingDirectory(self, "Select Folder to Scan for Emulators")
+        if not scan_path: return
+        found_count = 0
+        emulators = self.config_manager.config['emulators']
+        # Iterative scandir DFS: DirEntry caches is_dir/is_file, and entry.path
+        # spares the per-file os.path.join that os.walk does in Python.
+        stack = [scan_path]
+        while stack:
+            try:
+                entries = list(os.scandir(stack.pop()))
+            except OSError:
+                continue
+            for entry in entries:
+                if entry.name.startswith('.'):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    # Executable candidates only: .dll/.txt/asset files skip
+                    # the detection scan without any further work. Bare names
+                    # stay in for extensionless Linux binaries.
+                    ext = os.path.splitext(entry.name)[1].lower()
+                    if ext not in ('', '.exe', '.app', '.appimage'):
+                        continue
+                    detected = self.backend.detect_emulator_from_exe(entry.path)
+                    if detected and detected['name'] not in emulators:
+                        emulators[detected['name']] = detected['data']; found_count += 1
+        if found_count > 0:
+            self.config_manager.save_config(); self.refresh_emulator_list()
+            QMessageBox.information(self, "Scan Complete", f"Found and added {found_count} new emulator(s).")
+        else: QMessageBox.information(self, "Scan Complete", "No new emulators found in the selected folder.")
+        
+    def on_emulator_selection_changed(self, item):
+        is_child = item is not None and item.parent() is not None
+        self.btn_edit_emu.setEnabled(is_child)
+        self.btn_remove_emu.setEnabled(is_child)
+        self.btn_start_emu.setEnabled(is_child)
+
+    def edit_emulator(self):
+        item = self.emulators_tree.currentItem()
+        if not item or not item.parent(): return
+        name = item.data(0, Qt.ItemDataRole.UserRole); dialog = EmulatorEditDialog(name, self.config_manager.config["emulators"][name], self)
+        if dialog.exec():
+            result = dialog.get_data()
+            if result["name"] and result["data"]["path"]:
+                if name != result["name"]: del self.config_manager.config["emulators"][name]
+                self.config_manager.config["emulators"][result["name"]] = result["data"]; self.config_manager.save_config(); self.refresh_emulator_list()
+    def remove_emulator(self):
+        item = self.emulators_tree.currentItem()
+        if not item or not item.parent(): return
+        name = item.data(0, Qt.ItemDataRole.UserRole)
+        if QMessageBox.question(self, "Confirm", f"Remove '{name}'?") == QMessageBox.StandardButton.Yes:
+            del self.config_manager.config["emulators"][name]; self.config_manager.save_config(); self.refresh_emulator_list()
+    def launch_selected_game(self, item):
+        game_data = item.data(Qt.ItemDataRole.UserRole)
+        if not game_data:
+            return
+
+        if game_data.get('platform') == 'PlayStation 3' and game_data.get('path', '').lower().endswith('.pkg'):
+            QMessageBox.information(self, "Installation Required",
+                                    "This is a PlayStation 3 package file (.pkg).\n\n"
+                                    "It must be installed first using your emulator (e.g., RPCS3's 'File > Install Packages/Raps/Edats' option).\n\n"
+                                    "You cannot launch this file directly from EmulatorHub.")
+            return
+        
+        # Handle PC games separately (no emulator needed)
+        if game_data.get('platform') in ['PC', 'Windows']:
+            result, message = self.backend.launch_game(game_data['hash'])
+            self.statusBar().showMessage(message)
+            if result:
+                if hasattr(result, 'pid'):  # It's a process object
+                    self.start_playtime_tracker(result, game_data['hash'])
+            else:
+                QMessageBox.warning(self, "Launch Error", message)
+            return
+            
+        custom_emu_name = self.config_manager.config.get("game_metadata", {}).get(game_data['hash'], {}).get("custom_emulator")
+        chosen_emulator_config = None
+        system = game_data['platform']
+        if custom_emu_name:
+            chosen_emulator_config = self.config_manager.config["emulators"].get(custom_emu_name)
+            if not chosen_emulator_config:
+                QMessageBox.warning(self, "Launch Error", f"The custom emulator '{custom_emu_name}' is no longer configured."); return
+        else:
+            platform_defaults = self.config_manager.config.get("platform_defaults", {})
+            default_emu_name = platform_defaults.get(system)
+            if default_emu_name and default_emu_name in self.config_manager.config["emulators"]:
+                 chosen_emulator_config = self.config_manager.config["emulators"][default_emu_name]
+            else:
+                available_emulators = self.backend.get_emulators_for_system(system)
+                if not available_emulators:
+                    QMessageBox.warning(self, "Launch Error", f"No emulator configured for {system}."); return
+                if len(available_emulators) == 1:
+                    chosen_emulator_config = available_emulators[0]['config']
+                else:
+                    dialog = EmulatorChoiceDialog([emu['name'] for emu in available_emulators], system, self)
+                    if dialog.exec():
+                        name = dialog.get_selected_emulator_name()
+                        chosen_emulator_config = next((emu['config'] for emu in available_emulators if emu['name'] == name), None)
+                        if dialog.get_set_as_default() and name:
+                            self.config_manager.config["platform_defaults"][system] = name
+                            self.config_manager.save_config()
+                            self.statusBar().showMessage(f"Set {name} as default for {system}.")
+                    else: return
+        if chosen_emulator_config:
+            process, message = self.backend.launch_game(game_data['hash'], chosen_emulator_config)
+            self.statusBar().showMessage(message)
+            if process: self.start_playtime_tracker(process, game_data['hash'])
+            else: QMessageBox.warning(self, "Launch Error", message)
+
+    def start_playtime_tracker(self, process, game_hash):
+        pid = process.pid; start_time = time.time()
+        if hasattr(process, 'wait'):
+            # Our own child process: wait for its exit event instead of polling.
+            waiter = ProcessWaiter(process, self)
+            self.process_timers[pid] = waiter
+            waiter.process_exited.connect(lambda _pid: self._on_game_exited(pid, game_hash, start_time))
+            waiter.start()
+            return
+        # Fallback for pid-only handles: a 5-second poll, one syscall per tick.
+        timer = QTimer(self); self.process_timers[pid] = timer
+        def check_process():
+            if not _pid_alive(pid):
+                self._on_game_exited(pid, game_hash, start_time)
+        timer.timeout.connect(check_process); timer.start(5000)
+
+    def _on_game_exited(self, pid, game_hash, start_time):
+        elapsed_time = time.time() - start_time
+        metadata = self.config_manager.config["game_metadata"].setdefault(game_hash, {})
+        metadata['playtime'] = metadata.get('playtime', 0) + elapsed_time
+        self.config_manager.save_library_state()
+        if game_hash in self.backend.all_games_map:
+            self.backend.all_games_map[game_hash]['playtime'] = metadata['playtime']
+            self.backend.invalidate_sorted_games(sort_key="Time Played")
+        tracker = self.process_timers.pop(pid, None)
+        if isinstance(tracker, QTimer):
+            tracker.stop()
+        self.update_game_item(game_hash)
+        self.update_details_panel(self.games_list.currentIndex())
+        
+    def launch_selected_emulator(self, item=None):
+        if not item or not isinstance(item, QTreeWidgetItem): item = self.emulators_tree.currentItem()
+        if not item or not item.parent(): return
+        
+        name = item.data(0, Qt.ItemDataRole.UserRole)
+        path = self.config_manager.config["emulators"][name]['path']
+        try: subprocess.Popen([os.path.normpath(path)])
+        except Exception as e: QMessageBox.critical(self, "Launch Error", f"Failed to start emulator:\n{e}")
+    
+    def _build_game_context_menu(self):
+        """One-time construction of the game right-click menu skeleton.
+
+        The static actions are created once and reused for every popup; the
+        handlers read self._ctx_index / self._ctx_game, which
+        show_game_context_menu points at the clicked row before exec(). Only
+        per-click state (enabled flags, favorite text, check marks) is
+        patched on popup, and the emulator submenu is refilled only after
+        the emulator list actually changes.
+        """
+        menu = QMenu(self)
+        self._ctx_play = menu.addAction(self.std_icon(QStyle.StandardPixmap.SP_MediaPlay), "Play Game")
+        bold_font = QFont(); bold_font.setBold(True); self._ctx_play.setFont(bold_font)
+        self._ctx_play.triggered.connect(lambda: self.launch_selected_game(self._ctx_index))
+        menu.addSeparator()
+        self._ctx_fav = menu.addAction("Add to Favorites")
+        self._ctx_fav.triggered.connect(lambda: self.toggle_favorite(self._ctx_game['hash']))
+        menu.addSeparator()
+        manage_menu = menu.addMenu("Manage...")
+        self._ctx_emu_menu = manage_menu.addMenu("Set Custom Emulator")
+        cover_action = manage_menu.addAction("Set Custom Image...")
+        cover_action.triggered.connect(lambda: self.set_custom_game_image(self._ctx_index))
+        self._ctx_clear_default = manage_menu.addAction("Clear Default Emulator")
+        self._ctx_clear_default.triggered.connect(lambda: self.clear_platform_default_emulator(self._ctx_game['platform']))
+
+        manage_menu.addSeparator()
+        self._ctx_delete = manage_menu.addAction(self.std_icon(QStyle.StandardPixmap.SP_TrashIcon), "Delete Files...")
+        self._ctx_delete.triggered.connect(lambda: self.delete_game_files(self._ctx_index))
+
+        menu.addSeparator()
+        self._ctx_show_folder = menu.addAction(self.std_icon(QStyle.StandardPixmap.SP_DirIcon), "Show in Folder")
+        self._ctx_show_folder.triggered.connect(lambda: self.show_game_in_explorer(self._ctx_index))
+
+        # Enhanced info action
+        enhanced_info_action = menu.addAction(self.std_icon(QStyle.StandardPixmap.SP_FileDialogInfoView), "Detailed Info... (Ctrl+I)")
+        enhanced_info_action.triggered.connect(lambda: self.show_enhanced_game_info(self._ctx_index))
+
+        # Collections submenu (contents are per-click, the menu object is not)
+        self._ctx_collections_menu = menu.addMenu("Add to Collection")
+
+        menu.addSeparator()
+
+        # Save states
+        save_states_action = menu.addAction("💾 Manage Save States")
+        save_states_action.triggered.connect(lambda: self.open_save_state_manager(self._ctx_game))
+
+        info_action = menu.addAction(self.std_icon(QStyle.StandardPixmap.SP_DialogHelpButton), "View Info...")
+        info_action.triggered.connect(lambda: self.show_game_info(self._ctx_index))
+        return menu
+
+    def _refresh_ctx_emu_menu(self):
+        self._ctx_emu_menu.clear()
+        clear_action = self._ctx_emu_menu.addAction("Use Platform Default"); clear_action.setCheckable(True)
+        clear_action.triggered.connect(lambda: self.set_custom_emulator_for_game(self._ctx_game['hash'], None))
+        self._ctx_emu_menu.addSeparator()
+        self._ctx_emu_actions = {None: clear_action}
+        for emu_name in sorted(self.config_manager.config.get("emulators", {}).keys()):
+            action = self._ctx_emu_menu.addAction(emu_name); action.setCheckable(True)
+            action.triggered.connect(lambda checked, name=emu_name: self.set_custom_emulator_for_game(self._ctx_game['hash'], name))
+            self._ctx_emu_actions[emu_name] = action
+        self._ctx_emu_menu_stale = False
+
+    def show_game_context_menu(self, pos):
+        item = self.games_list.indexAt(pos)
+        if not item.isValid(): return
+        game_data = item.data(Qt.ItemDataRole.UserRole)
+        if self._game_context_menu is None:
+            self._game_context_menu = self._build_game_context_menu()
+        self._ctx_index = item
+        self._ctx_game = game_data
+        if self._ctx_emu_menu_stale:
+            self._refresh_ctx_emu_menu()
+        is_enabled = bool(item.flags() & Qt.ItemFlag.ItemIsEnabled)
+        self._ctx_play.setEnabled(is_enabled)
+        self._ctx_delete.setEnabled(is_enabled)
+        self._ctx_show_folder.setEnabled(is_enabled)
+        is_fav = self.backend.is_favorite(game_data['hash'])
+        self._ctx_fav.setText("Remove from Favorites" if is_fav else "Add to Favorites")
+        self._ctx_fav.setIcon(self.std_icon(QStyle.StandardPixmap.SP_DialogCancelButton if is_fav else QStyle.StandardPixmap.SP_DialogApplyButton))
+        current_custom_emu = self.config_manager.config.get("game_metadata", {}).get(game_data['hash'], {}).get("custom_emulator")
+        for emu_name, action in self._ctx_emu_actions.items():
+            action.setChecked(emu_name == current_custom_emu)
+        has_platform_default = game_data['platform'] in self.config_manager.config.get("platform_defaults", {})
+        self._ctx_clear_default.setVisible(has_platform_default)
+        if has_platform_default:
+            self._ctx_clear_default.setText(f"Clear Default Emulator for {game_data['platform']}")
+        collections = self.config_manager.config.get("collections", {})
+        self._ctx_collections_menu.menuAction().setVisible(bool(collections))
+        if collections:
+            self._ctx_collections_menu.clear()
+            for collection_name in sorted(collections.keys()):
+                action = self._ctx_collections_menu.addAction(collection_name)
+                action.triggered.connect(lambda checked, name=collection_name, hash=game_data['hash']: self.add_to_collection(hash, name))
+        self._game_context_menu.exec(self.games_list.viewport().mapToGlobal(pos))
+    
+    def add_to_collection(self, game_hash, collection_name):
+        """Add a game to a collection"""
+        collections = self.config_manager.config.setdefault("collections", {})
+        if collection_name in collections:
+            if game_hash not in collections[collection_name]:
+                collections[collection_name].append(game_hash)
+                self.config_manager.save_library_state()
+                self.statusBar().showMessage(f"Added to collection '{collection_name}'", 3000)
+    
+    def add_pc_game_dialog(self):
+        """Dialog to manually add PC games"""
+        dialog = QDialog(self)
+        dialog.setWindowTitle("Add PC Game")
+        dialog.setMinimumWidth(500)
+        
+        layout = QVBoxLayout(dialog)
+        
+        # Instructions
+        info_label = QLabel("Add a PC game by selecting an executable (.exe), shortcut (.lnk), or game folder.")
+        info_label.setWordWrap(True)
+        layout.addWidget(info_label)
+        
+        # File/Folder selection
+        file_group = QGroupBox("Game Location")
+        file_layout = QVBoxLayout(file_group)
+        
+        path_layout = QHBoxLayout()
+        self.pc_game_path_edit = QLineEdit()
+        self.pc_game_path_edit.setPlaceholderText("Select game executable, shortcut, or folder...")
+        
+        btn_browse_file = QPushButton("Browse File...")
+        btn_browse_file.clicked.connect(lambda: self.browse_pc_game_file())
+        
+        btn_browse_folder = QPushButton("Browse Folder...")
+        btn_browse_folder.clicked.connect(lambda: self.browse_pc_game_folder())
+        
+        path_layout.addWidget(self.pc_game_path_edit)
+        path_layout.addWidget(btn_browse_file)
+        path_layout.addWidget(btn_browse_folder)
+        file_layout.addLayout(path_layout)
+        layout.addWidget(file_group)
+        
+        # Game info
+        info_group = QGroupBox("Game Information")
+        info_layout = QFormLayout(info_group)
+        
+        self.pc_game_title_edit = QLineEdit()
+        self.pc_game_title_edit.setPlaceholderText("Game title (auto-detected)")
+        info_layout.addRow("Title:", self.pc_game_title_edit)
+        
+        layout.addWidget(info_group)
+        
+        # Buttons
+        button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
+        button_box.accepted.connect(lambda: self.add_pc_game_to_library(dialog))
+        button_box.rejected.connect(dialog.reject)
+        layout.addWidget(button_box)
+        
+        dialog.exec()
+    
+    def browse_pc_game_file(self):
+        """Browse for PC game file"""
+        file_path, _ = QFileDialog.getOpenFileName(
+            self, 
+            "Select Game File",
+            "",
+            "Game Files (*.exe *.lnk *.url);;All Files (*.*)"
+        )
+        if file_path:
+            self.pc_game_path_edit.setText(file_path)
+            # Auto-detect title
+            if not self.pc_game_title_edit.text():
+                title = os.path.splitext(os.path.basename(file_path))[0]
+                self.pc_game_title_edit.setText(title)
+    
+    def browse_pc_game_folder(self):
+        """Browse for PC game folder"""
+        folder_path = QFileDialog.getExistingDirectory(self, "Select Game Folder")
+        if folder_path:
+            self.pc_game_path_edit.setText(folder_path)
+            # Auto-detect title
+            if not self.pc_game_title_edit.text():
+                title = os.path.basename(folder_path)
+                self.pc_game_title_edit.setText(title)
+    
+    def add_pc_game_to_library(self, dialog):
+        """Add the PC game to the library"""
+        game_path = self.pc_game_path_edit.text().strip()
+        game_title = self.pc_game_title_edit.text().strip()
+        
+        if not game_path:
+            QMessageBox.warning(dialog, "Missing Information", "Please select a game file or folder.")
+            return
+        
+        if not os.path.exists(game_path):
+            QMessageBox.warning(dialog, "Invalid Path", "The selected file or folder does not exist.")
+            return
+        
+        if not game_title:
+            game_title = os.path.splitext(os.path.basename(game_path))[0]
+        
+        # Create game entry
+        import time
+        path_hash = hash_game_path(game_path)
+        
+        # Check if already exists
+        if path_hash in self.backend.all_games_map:
+            QMessageBox.information(dialog, "Already Added", "This game is already in your library.")
+            dialog.accept()
+            return
+        
+        # Get file size
+        try:
+            if os.path.isdir(game_path):
+                size = self.backend._dir_size(game_path)
+            else:
+                size = os.path.getsize(game_path)
+        except:
+            size = 0
+        
+        # Add to backend
+        game_data = {
+            "title": game_title,
+            "path": game_path,
+            "hash": path_hash,
+            "size": size,
+            "platform": "PC",
+            "playtime": 0,
+            "date_added": time.time()
+        }
+        self.backend.annotate_game(game_data)
+
+        self.backend.all_games_map[path_hash] = game_data
+        
+        if "PC" not in self.backend.games_by_platform:
+            self.backend.games_by_platform["PC"] = []
+        self.backend.games_by_platform["PC"].append(game_data)
+        self.backend.invalidate_sorted_games()
+
+        # Save to cache
+        self.backend.save_to_cache()
+        self.config_manager.config['last_scan_date'] = time.strftime("%Y-%m-%d %H:%M:%S")
+        self.config_manager.save_config()
+        
+        # Update UI
+        self.update_system_list()
+        self.repopulate_games_list()
+        
+        self.statusBar().showMessage(f"Added '{game_title}' to PC games library.", 5000)
+        dialog.accept()
+    
+    def dragEnterEvent(self, event):
+        if event.mimeData().hasUrls():
+            path = Path(event.mimeData().urls()[0].toLocalFile())
+            if path.is_dir() or path.suffix.lower() in ['.png', '.jpg', '.jpeg', '.webp']:
+                event.acceptProposedAction()
+
+    def dropEvent(self, event):
+        urls = event.mimeData().urls()
+        if not urls:
+            return
+        path = Path(urls[0].toLocalFile())
+        if path.is_dir():
+            if str(path) not in self.config_manager.config["game_library_paths"]:
+                reply = QMessageBox.question(self, "Add Library Folder", f"Do you want to add this folder to your game library?\n\n{path}")
+                if reply == QMessageBox.StandardButton.Yes:
+                    self.config_manager.config["game_library_paths"].append(str(path))
+                    self.config_manager.save_config()
+                    # Only walk the dropped folder; existing roots are already scanned.
+                    self.start_full_scan(new_roots=[str(path)])
+        elif path.suffix.lower() in ['.png', '.jpg', '.jpeg', '.webp']:
+            window_pos = event.position().toPoint()
+            list_local_pos = self.games_list.mapFrom(self, window_pos)
+            item = self.games_list.indexAt(list_local_pos)
+            if item.isValid():
+                self.set_custom_game_image(item, image_path=str(path))
+
+    def show_game_in_explorer(self, item):
+        game_data = item.data(Qt.ItemDataRole.UserRole)
+        path = os.path.normpath(game_data['path'])
+        try:
+            if sys.platform == "win32":
+                try:
+                    _reveal_in_explorer_windows(path)
+                except Exception:
+                    subprocess.Popen(['explorer', '/select,', path])
+            elif sys.platform == "darwin": # macOS
+                subprocess.Popen(['open', '-R', path])
+            else: # Linux, etc.
+                subprocess.Popen(['xdg-open', os.path.dirname(path)])
+        except Exception as e:
+            QMessageBox.warning(self, "Error", f"Could not open file location: {e}")
+
+    def delete_game_files(self, item):
+        game_data = item.data(Qt.ItemDataRole.UserRole)
+        path_to_delete = Path(game_data['path'])
+        
+        msg_box = QMessageBox(self)
+        msg_box.setWindowTitle("Confirm Deletion")
+        msg_box.setText(f"<h2>Permanently Delete Files?</h2>"
+                        f"<p>This action cannot be undone. It will delete the following file or folder from your hard drive:</p>"
+                        f"<p><b>{path_to_delete.resolve()}</b></p>")
+        msg_box.setStandardButtons(QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+        msg_box.setDefaultButton(QMessageBox.StandardButton.No)
+        msg_box.setIcon(QMessageBox.Icon.Warning)
+
+        if msg_box.exec() == QMessageBox.StandardButton.Yes:
+            try:
+                self.statusBar().showMessage(f"Deleting {path_to_delete.name}...")
+                if path_to_delete.is_dir():
+                    shutil.rmtree(path_to_delete)
+                else:
+                    path_to_delete.unlink()
+                
+                self.statusBar().showMessage(f"Successfully deleted {path_to_delete.name}.", 5000)
+                self.start_full_scan()
+
+            except Exception as e:
+                QMessageBox.critical(self, "Deletion Error", f"Could not delete files.\n\nError: {e}")
+                self.statusBar().showMessage("Deletion failed.", 5000)
+
+    def clear_platform_default_emulator(self, platform_name):
+        platform_defaults = self.config_manager.config.get("platform_defaults", {})
+        if platform_name in platform_defaults:
+            del platform_defaults[platform_name]
+            self.config_manager.save_config()
+            self.statusBar().showMessage(f"Cleared default emulator for {platform_name}. You will be prompted on next launch.")
+
+    def set_custom_emulator_for_game(self, game_hash, emulator_name):
+        metadata = self.config_manager.config["game_metadata"].setdefault(game_hash, {})
+        if emulator_name:
+            metadata["custom_emulator"] = emulator_name; self.statusBar().showMessage(f"Set {emulator_name} as custom emulator.")
+        else:
+            if "custom_emulator" in metadata: del metadata["custom_emulator"]
+            self.statusBar().showMessage("Cleared custom emulator. Will use platform default.")
+        self.config_manager.save_library_state()
+        
+    def toggle_favorite(self, game_hash):
+        self.backend.toggle_favorite(game_hash)
+        self.update_system_list()  # Favorites category may appear/disappear
+        current = self.systems_list.currentItem()
+        current_data = current.data(Qt.ItemDataRole.UserRole) if current else None
+        if current_data and current_data.get('name') == Constants.FAVORITES_CATEGORY:
+            # Membership of the visible list changed, not just one row's state.
+            self.schedule_repopulate()
+        else:
+            self.update_game_item(game_hash)
+
+    def set_custom_game_image(self, item, image_path=None):
+        if not image_path:
+            image_path, _ = QFileDialog.getOpenFileName(self, "Select Cover Image", "", "Images (*.png *.jpg *.jpeg *.webp)")
+        if not image_path: return
+        game_data = item.data(Qt.ItemDataRole.UserRole)
+        success, message = self.backend.set_custom_game_image(game_data['hash'], image_path)
+        if success:
+            self._icon_cache.pop(game_data['hash'], None)
+            self._icon_pending.discard(game_data['hash'])
+            QPixmapCache.remove(f"cover:{game_data['hash']}:200")
+            self.schedule_repopulate(); self.statusBar().showMessage(f"Set custom cover for {game_data['title']}")
+        else:
+            QMessageBox.critical(self, "Error", message)
+    def show_game_info(self, item):
+        game_data = item.data(Qt.ItemDataRole.UserRole)
+        info = {"title": game_data.get('title', 'N/A'), "platform": game_data.get('platform', 'N/A'), "size": format_size(game_data.get('size', 0)), "playtime": format_playtime(game_data.get('playtime', 0))}
+        GameInfoDialog(info, self).exec()
+        self.statusBar().showMessage("Ready.")
+    
+    def show_enhanced_game_info(self, item):
+        """Show enhanced game info dialog with editing capabilities"""
+        if not item:
+            return
+        game_data = item.data(Qt.ItemDataRole.UserRole)
+        if not game_data:
+            return
+        
+        dialog = EnhancedGameInfoDialog(game_data, self.backend, self)
+        if dialog.exec() == QDialog.DialogCode.Accepted:
+            metadata = dialog.get_metadata()
+            game_hash = game_data['hash']
+            
+            # Update metadata
+            stored_metadata = self.config_manager.config["game_metadata"].setdefault(game_hash, {})
+            if metadata['title'] != game_data.get('title'):
+                game = self.backend.all_games_map[game_hash]
+                game['title'] = metadata['title']
+                self.backend.annotate_game(game)
+                self.backend.invalidate_sorted_games(sort_key="Name")
+            stored_metadata['notes'] = metadata['notes']
+            stored_metadata['tags'] = metadata['tags']
+            
+            self.config_manager.save_library_state()
+            self.backend.save_to_cache()
+            self.repopulate_games_list()
+            self.statusBar().showMessage("Game metadata updated.", 3000)
+    
+    def open_settings(self):
+        """Open settings dialog"""
+        dialog = SettingsDialog(self.config_manager, self)
+        if dialog.exec() == QDialog.DialogCode.Accepted:
+            settings = dialog.get_settings()
+            self.config_manager.config.update(settings)
+            
+            # Apply theme if changed
+            if settings['theme'] != self.current_theme_name:
+                self.current_theme_name = settings['theme']
+                self.apply_theme()
+            
+            self.config_manager.save_config()
+            self.statusBar().showMessage("Settings saved.", 3000)
+    
+    def open_save_state_manager(self, game_data):
+        """Open save state manager for a game"""
+        dialog = SaveStateManagerDialog(game_data, self.config_manager, self)
+        dialog.exec()
+    
+    def open_collections_manager(self):
+        """Open collections manager dialog"""
+        dialog = CollectionManagerDialog(self.config_manager, self)
+        if dialog.exec() == QDialog.DialogCode.Accepted:
+            self.update_system_list()
+    
+    def toggle_batch_mode(self, enabled):
+        """Toggle batch operations mode"""
+        if enabled:
+            self.statusBar().showMessage("Batch mode enabled. Select multiple games to perform actions.", 5000)
+            self.games_list.setSelectionMode(QAbstractItemView.SelectionMode.MultiSelection)
+        else:
+            self.statusBar().showMessage("Batch mode disabled.", 3000)
+            self.games_list.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+            self.games_list.clearSelection()
+    
+    def delete_selected_games(self):
+        """Delete multiple selected games"""
+        selected_items = self.games_list.selectionModel().selectedIndexes()
+        if not selected_items:
+            return
+        
+        count = len(selected_items)
+        reply = QMessageBox.question(
+            self, 
+            "Confirm Batch Delete",
+            f"Are you sure you want to permanently delete {count} game(s)?\n\nThis action cannot be undone.",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        )
+        
+        if reply == QMessageBox.StandardButton.Yes:
+            deleted_count = 0
+            failed_items = []
+            
+            for item in selected_items:
+                game_data = item.data(Qt.ItemDataRole.UserRole)
+                if not game_data:
+                    continue
+                
+                path_to_delete = Path(game_data['path'])
+                try:
+                    if path_to_delete.is_dir():
+                        shutil.rmtree(path_to_delete)
+                    else:
+                        path_to_delete.unlink()
+                    deleted_count += 1
+                except Exception as e:
+                    failed_items.append((game_data['title'], str(e)))
+            
+            if deleted_count > 0:
+                self.statusBar().showMessage(f"Deleted {deleted_count} game(s).", 5000)
+                self.start_full_scan()
+            
+            if failed_items:
+                error_msg = "Failed to delete:\n" + "\n".join([f"• {title}: {error}" for title, error in failed_items[:5]])
+                QMessageBox.warning(self, "Deletion Errors", error_msg)
+    
+    def show_statistics_view(self):
+        """Display library statistics in the games list area"""
+        self.games_model.set_games([])
+
+        # Calculate statistics
+        total_games = len(self.backend.all_games_map)
+        total_size = sum(g.get('size', 0) for g in self.backend.all_games_map.values())
+        total_playtime = sum(g.get('playtime', 0) for g in self.backend.all_games_map.values())
+        platform_count = len(self.backend.games_by_platform)
+        favorites_count = len(self.backend.get_favorite_games())
+        
+        # Most played games
+        most_played = sorted(
+            [g for g in self.backend.all_games_map.values() if g.get('playtime', 0) > 0],
+            key=lambda g: g.get('playtime', 0),
+            reverse=True
+        )[:5]
+        
+        # Platform distribution
+        platform_stats = {
+            platform: len(games) 
+            for platform, games in self.backend.games_by_platform.items()
+        }
+        top_platforms = sorted(platform_stats.items(), key=lambda x: x[1], reverse=True)[:5]
+        
+        # Get theme colors
+        theme_colors = self.themes.get(self.current_theme_name, self.themes["Modern Dark"])
+        cyan_color = theme_colors.get('C_HIGHLIGHT_CYAN', '#2AC3DE')
+        blue_color = theme_colors.get('C_HIGHLIGHT_BLUE', '#7AA2F7')
+        text_color = theme_colors.get('C_TEXT_PRIMARY', '#C0CAF5')
+        
+        # Create statistics display with proper styling
+        stats_text = f"""
+<div style='color: {text_color}; padding: 20px;'>
+<h2 style='color: {cyan_color}; margin-bottom: 10px;'>📊 Library Statistics</h2>
+<hr style='border-color: {blue_color}; margin: 15px 0;'>
+
+<h3 style='color: {blue_color}; margin-top: 20px;'>Overview</h3>
+<ul style='line-height: 1.8;'>
+<li><b>Total Games:</b> {total_games}</li>
+<li><b>Total Size:</b> {format_size(total_size)}</li>
+<li><b>Total Playtime:</b> {format_playtime(total_playtime)}</li>
+<li><b>Platforms:</b> {platform_count}</li>
+<li><b>Favorites:</b> {favorites_count}</li>
+</ul>
+
+<h3 style='color: {blue_color}; margin-top: 20px;'>Top 5 Most Played Games</h3>
+<ol style='line-height: 1.8;'>
+"""
+        
+        if most_played:
+            for game in most_played:
+                stats_text += f"<li><b>{game['title']}</b> <span style='color: {theme_colors.get('C_TEXT_SECONDARY', '#9AA5CE')}'>({game['platform']})</span> - {format_playtime(game.get('playtime', 0))}</li>\n"
+        else:
+            stats_text += f"<li><i style='color: {theme_colors.get('C_TEXT_SECONDARY', '#9AA5CE')}'>No games played yet</i></li>\n"
+        
+        stats_text += f"""
+</ol>
+
+<h3 style='color: {blue_color}; margin-top: 20px;'>Top 5 Platforms by Game Count</h3>
+<ol style='line-height: 1.8;'>
+"""
+        
+        for platform, count in top_platforms:
+            stats_text += f"<li><b>{platform}:</b> {count} game(s)</li>\n"
+        
+        stats_text += """
+</ol>
+</div>
+"""
+        
+        # Swap the games view for the statistics label
+        self.stats_label.setText(stats_text)
+        self.stats_label.setStyleSheet("QLabel { background-color: transparent; padding: 10px; }")
+        self.games_list.setVisible(False)
+        self.stats_label.setVisible(True)
+
+        # Show the placeholder page for the statistics view
+        self.details_panel.setCurrentWidget(self.details_placeholder_label)
+    
+    @staticmethod
+    def _decode_state_blob(text):
+        # New configs store base64 (shorter, decoded in C); configs written
+        # before the switch are hex. Hex blobs only ever use [0-9a-f].
+        raw = bytes(text, 'ascii')
+        if len(raw) % 2 == 0 and all(c in b'0123456789abcdefABCDEF' for c in raw):
+            return QByteArray.fromHex(raw)
+        return QByteArray.fromBase64(raw)
+
+    def restore_window_state(self):
+        # Geometry must land before show() or the window visibly jumps.
+        geo_blob = self.config_manager.config.get("window_geometry")
+        if geo_blob: self.restoreGeometry(self._decode_state_blob(geo_blob))
+        is_visible = self.config_manager.config.get("details_panel_visible", True)
+        self.toggle_details_action.setChecked(is_visible)
+        self.details_panel.setVisible(is_visible)
+        # Toolbar/splitter blobs can decode after first paint.
+        QTimer.singleShot(0, self._restore_window_state_deferred)
+
+    def _restore_window_state_deferred(self):
+        state_blob = self.config_manager.config.get("window_state")
+        if state_blob: self.restoreState(self._decode_state_blob(state_blob))
+        splitter_blob = self.config_manager.config.get("splitter_state")
+        if splitter_blob: self.main_splitter.restoreState(self._decode_state_blob(splitter_blob))
+
+    def closeEvent(self, event):
+        # Stop controller handler
+        if self.controller_handler:
+            self.controller_handler.stop()
+            self.controller_handler.wait(1000)
+        self.icon_loader.stop()
+        self.icon_loader.wait(1000)
+        
+        self.config_manager.config['view_mode'] = 'grid' if self.is_grid_mode else 'list'
+        self.config_manager.config['grid_icon_size'] = self.current_grid_icon_size
+        self.config_manager.config['list_icon_size'] = self.current_list_icon_size
+        self.config_manager.config['theme'] = self.current_theme_name
+        self.config_manager.config['window_geometry'] = self.saveGeometry().toBase64().data().decode('ascii')
+        self.config_manager.config['window_state'] = self.saveState().toBase64().data().decode('ascii')
+        self.config_manager.config['splitter_state'] = self.main_splitter.saveState().toBase64().data().decode('ascii')
+        self.config_manager.config['details_panel_visible'] = self.toggle_details_action.isChecked()
+        self.config_manager.save_config(); event.accept()
+
+# =============================================================================
+# --- MAIN EXECUTION BLOCK ---
+# =============================================================================
+if __name__ == "__main__":
+    app = QApplication(sys.argv); app.setFont(QFont("Segoe UI", 9))
+    QPixmapCache.setCacheLimit(128 * 1024)  # 128 MB for rasterized covers
+    if psutil is None: print("WARNING: 'psutil' library not found. Playtime tracking will be disabled. Run 'pip install psutil' to enable it.")
+    config = ConfigManager(); backend = EmulatorHubBackend(config); window = EmulatorHubWindow(backend, config)
+    app.aboutToQuit.connect(config.flush)
+    window.show(); sys.exit(app.exec())